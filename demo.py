@@ -2,23 +2,32 @@
 Example usage and demo of the Agent Framework.
 """
 
+import re
 from typing import Any, List
 from src.agent import Agent
 from src.components import (
-    ContextManager, StateMachine, Watchdog,
-    ConsoleLogger, LifeCycleManager, WorkspaceManager,
-    InMemoryManager, ToolManager
+    ContextManager, StateMachine, ConsoleLogger, InMemoryManager
 )
 from src.models import Protocol, ProtocolStep, Transition
-from src.clients import MockInboxClient, MockTaskClient
 
 
 # ==============================================================================
 # MOCK LLM CLIENT (for demonstration without actual API calls)
 # ==============================================================================
 
+# Keyword dispatch for MockTextClient: one case-insensitive scan per message
+_KEYWORD_RE = re.compile(r"email|task", re.IGNORECASE)
+_EMAIL_RE = re.compile(r"email", re.IGNORECASE)
+_KEYWORD_RESPONSES = {
+    "email": "I'll help you handle this email. Let me check the details.",
+    "task": "I see there's a task that needs attention. Let me work on it.",
+}
+
+
 class MockTextClient:
     """Mock LLM client for testing."""
+
+    __slots__ = ("_model_name", "_tools")
     
     def __init__(self, model_name: str = "mock-model"):
         self._model_name = model_name
@@ -28,13 +37,14 @@ class MockTextClient:
         # Extract the last user message
         user_msg = messages[-1].get("content", "") if messages else ""
         
-        # Simple mock response logic
-        if "email" in user_msg.lower():
-            return MockResponse(f"I'll help you handle this email. Let me check the details.")
-        elif "task" in user_msg.lower():
-            return MockResponse(f"I see there's a task that needs attention. Let me work on it.")
-        else:
+        # Simple mock response logic ("email" wins over "task" wherever it appears)
+        match = _KEYWORD_RE.search(user_msg)
+        if match is None:
             return MockResponse(f"I understand. You said: {user_msg[:50]}... Let me help with that.")
+        keyword = match.group().lower()
+        if keyword == "task" and _EMAIL_RE.search(user_msg, match.end()):
+            keyword = "email"
+        return MockResponse(_KEYWORD_RESPONSES[keyword])
     
     def bind_tools(self, tools: List[Any]) -> "MockTextClient":
         new_client = MockTextClient(self._model_name)
@@ -47,6 +57,9 @@ class MockTextClient:
 
 class MockResponse:
     """Mock response object."""
+
+    __slots__ = ("content", "tool_calls")
+
     def __init__(self, content: str):
         self.content = content
         self.tool_calls = None
@@ -123,6 +136,11 @@ def demo_reactive_mode():
     print("DEMO: Reactive Mode (Monitoring/Event-Driven)")
     print("="*60 + "\n")
     
+    # Monitoring-only dependencies are imported here, not at module load
+    import asyncio
+    from src.clients import MockInboxClient, MockTaskClient
+    from src.components import Watchdog
+    
     # Create components
     text_client = MockTextClient("gpt-4")
     logger = ConsoleLogger(name="ReactiveAgent")
@@ -158,23 +176,17 @@ def demo_reactive_mode():
     print("Starting monitoring mode (will run for 5 seconds)...")
     print("Press Ctrl+C to stop early.\n")
     
-    # Run monitoring in a limited way for demo
-    import threading
-    import time
-    
-    def stop_after_delay():
-        time.sleep(5)
-        agent.stop_monitoring()
-    
-    stop_thread = threading.Thread(target=stop_after_delay)
-    stop_thread.start()
+    # Run monitoring in a limited way for demo: schedule the stop on the
+    # monitoring event loop itself instead of a dedicated sleeper thread
+    async def monitor_for(seconds: float):
+        asyncio.get_running_loop().call_later(seconds, agent.stop_monitoring)
+        await agent.start_monitoring_async(sources=['inbox', 'tasks'])
     
     try:
-        agent.start_monitoring(sources=['inbox', 'tasks'])
+        asyncio.run(monitor_for(5.0))
     except KeyboardInterrupt:
         pass
     
-    stop_thread.join()
     print("\nMonitoring stopped.")
 
 
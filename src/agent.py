@@ -5,8 +5,14 @@ Supports both Synchronous (Request/Response) and Reactive (Monitoring/Event-Driv
 """
 
 import contextlib
+import copy
+import hashlib
+import heapq
+import itertools
 import json
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .components.context_manager import ContextManager
@@ -16,14 +22,116 @@ from .interfaces.base import (
     ILifeCycle,
     ILogger,
     IMemoryManager,
+    IResponseCache,
     ITaskManager,
     ITextClient,
     IToolManager,
     IWatchdog,
     IWorkspaceManager,
+    LogLevel,
 )
 from .models.data_models import AgentEvent, AgentState, Protocol, Transition
 
+# Workspace file holding recorded plans for recurring events
+_PLAN_CACHE_FILE = "plan_cache.json"
+
+
+# ==============================================================================
+# TOOL CALL EXTRACTION
+# ==============================================================================
+
+ToolCallExtractors = tuple[Callable[[Any], str], Callable[[Any], Any], Callable[[Any], Any]]
+
+
+def _parse_tool_args(tool_args: Any) -> Any:
+    """Parse JSON arguments if they arrive as a string."""
+    if isinstance(tool_args, str):
+        with contextlib.suppress(Exception):
+            return json.loads(tool_args)
+    return tool_args
+
+
+# Object (Pydantic/SDK) layout: tool_call.function.{name, arguments}
+_FUNCTION_EXTRACTORS: ToolCallExtractors = (
+    lambda tc: tc.function.name,
+    lambda tc: _parse_tool_args(tc.function.arguments),
+    lambda tc: getattr(tc, 'id', None),
+)
+
+# Dict layout: {"name", "args", "id"} or {"function": {"name", "arguments"}, "id"}
+_DICT_EXTRACTORS: ToolCallExtractors = (
+    lambda tc: tc.get('name', tc.get('function', {}).get('name')),
+    lambda tc: _parse_tool_args(tc.get('args', tc.get('function', {}).get('arguments', {}))),
+    lambda tc: tc.get('id'),
+)
+
+# Flat object layout: tool_call.{name, args, id}
+_ATTRIBUTE_EXTRACTORS: ToolCallExtractors = (
+    lambda tc: tc.name,
+    lambda tc: _parse_tool_args(getattr(tc, 'args', {})),
+    lambda tc: getattr(tc, 'id', None),
+)
+
+# Extractors resolved per tool call type
+_TOOL_CALL_EXTRACTORS: dict[type, ToolCallExtractors] = {dict: _DICT_EXTRACTORS}
+
+
+def _get_tool_call_extractors(tool_call: Any) -> ToolCallExtractors:
+    """
+    Get the (name, args, id) extractors for a tool call.
+
+    The layout is probed on the first tool call of a given type and the
+    result is reused for every later call of that type.
+    """
+    call_type = type(tool_call)
+    extractors = _TOOL_CALL_EXTRACTORS.get(call_type)
+    if extractors is None:
+        if isinstance(tool_call, dict):
+            extractors = _DICT_EXTRACTORS
+        elif hasattr(tool_call, 'function'):
+            extractors = _FUNCTION_EXTRACTORS
+        else:
+            extractors = _ATTRIBUTE_EXTRACTORS
+        _TOOL_CALL_EXTRACTORS[call_type] = extractors
+    return extractors
+
+
+def _render_response(response: Any) -> str:
+    """Get the text of an LLM response, avoiding str() when content is already a string."""
+    content = getattr(response, 'content', None)
+    return content if isinstance(content, str) else str(response)
+
+
+class _ReplayedResponse:
+    """Final response of a replayed plan, shaped like an LLM message without tool calls."""
+
+    __slots__ = ("content",)
+
+    tool_calls = None
+
+    def __init__(self, content: str):
+        self.content = content
+
+    def __str__(self) -> str:
+        return self.content
+
+    def __repr__(self) -> str:
+        return f"_ReplayedResponse(content={self.content!r})"
+
+
+def _run_tool(
+    execute_tool: Callable[..., Any] | None,
+    tool_name: str,
+    tool_args: dict[str, Any]
+) -> tuple[Any, Exception | None]:
+    """Execute one tool call, returning (result, error) instead of raising."""
+    try:
+        if execute_tool is None:
+            raise ValueError(f"Tool '{tool_name}' not found")
+        return execute_tool(tool_name, **tool_args), None
+    except Exception as e:
+        return None, e
+
 
 class Agent:
     """
@@ -44,6 +152,32 @@ class Agent:
         workspace_manager: Isolated workspace for file operations
     """
 
+    __slots__ = (
+        "text_provider",
+        "context",
+        "memory",
+        "tools",
+        "state_machine",
+        "watchdog",
+        "logger",
+        "life_manager",
+        "workspace_manager",
+        "inbox_client",
+        "task_client",
+        "response_cache",
+        "use_plan_cache",
+        "max_tool_workers",
+        "_is_monitoring",
+        "_event_queue",
+        "_protocols",
+        "_ctx_last",
+        "_cached_bound_llm",
+        "_cached_bound_llm_version",
+        "_plan_cache",
+        "_tool_trace",
+        "_tool_executor",
+    )
+
     def __init__(
         self,
         text_provider: ITextClient,
@@ -56,7 +190,10 @@ class Agent:
         life_manager: ILifeCycle | None = None,
         workspace_manager: IWorkspaceManager | None = None,
         inbox_client: IInboxClient | None = None,
-        task_manager: ITaskManager | None = None
+        task_manager: ITaskManager | None = None,
+        response_cache: IResponseCache | None = None,
+        use_plan_cache: bool = False,
+        max_tool_workers: int = 1
     ):
         """
         Initialize the Agent with all components.
@@ -73,6 +210,11 @@ class Agent:
             workspace_manager: Optional workspace manager
             inbox_client: Optional inbox client for email monitoring
             task_manager: Optional task manager for task monitoring
+            response_cache: Optional cache answering repeated messages without the LLM
+            use_plan_cache: Replay recorded tool calls for recurring events instead
+                of calling the LLM (persisted in the workspace when available)
+            max_tool_workers: Threads used to run the tool calls of one LLM response
+                concurrently (1 keeps them sequential)
         """
         # Core components
         self.text_provider = text_provider
@@ -88,12 +230,27 @@ class Agent:
         # Monitoring clients
         self.inbox_client = inbox_client
         self.task_client = task_manager
+        self.response_cache = response_cache
+        self.use_plan_cache = use_plan_cache
+        self.max_tool_workers = max_tool_workers
 
         # Internal state
         self._is_monitoring = False
         self._event_queue: list[AgentEvent] = []
         self._protocols: dict[str, Protocol] = {}
 
+        # (copy of the value, written object) of the last write per context key
+        self._ctx_last: dict[str, tuple[Any, Any]] = {}
+        # Text provider with tools bound, keyed by (provider id, tools version)
+        self._cached_bound_llm: ITextClient | None = None
+        self._cached_bound_llm_version: tuple[int, int | None] | None = None
+        # Recorded plans for recurring events, loaded lazily from the workspace
+        self._plan_cache: dict[str, dict[str, Any]] | None = None
+        # Successful tool calls of the current event, recorded for the plan cache
+        self._tool_trace: list[dict[str, Any]] | None = None
+        # Pool for concurrent tool calls, created on first use (shut down by close())
+        self._tool_executor: ThreadPoolExecutor | None = None
+
         # Set agent reference in state machine
         self.state_machine.set_agent_reference(self)
 
@@ -178,36 +335,77 @@ class Agent:
             BaseMessage: The agent's response
         """
         if self.logger:
-            self.logger.info(f"Processing message: {input_message[:50]}...")
+            self.logger.info("Processing message: %.50s...", input_message)
 
         # 1. Transition to REQUEST_RECEIVED
         self.state_machine.trigger("input:user_message", self)
 
-        # 2. Store message in memory
-        if self.memory:
-            self.memory.add_message("user", input_message)
-
-        # 3. Transition to THINKING
+        # 2. Transition to THINKING
         self.state_machine.trigger("process:start", self)
 
-        # 4. Build system prompt
-        system_prompt = self._build_system_prompt()
+        # 3. Reuse a cached response for repeated/similar messages
+        cache_partition = self._response_cache_partition(chat_history)
+        response = None
+        if cache_partition is not None:
+            response = self.response_cache.lookup(input_message, cache_partition)
+            if response is not None and self.logger:
+                self.logger.debug("Response cache hit")
 
-        # 5. Build messages for LLM
-        messages = self._build_messages(system_prompt, input_message, chat_history)
+        if response is None:
+            try:
+                # 4. Build system prompt
+                system_prompt = self._build_system_prompt()
+
+                # 5. Build messages for LLM
+                messages = self._build_messages(system_prompt, input_message, chat_history)
+
+                # 6. Execute ReAct loop
+                response = self._execute_react_loop(messages)
+            except Exception:
+                # Keep the user's message even when no response was produced
+                if self.memory:
+                    self.memory.add_message("user", input_message)
+                raise
 
-        # 6. Execute ReAct loop
-        response = self._execute_react_loop(messages)
+            if cache_partition is not None:
+                self.response_cache.store(input_message, response, cache_partition)
 
-        # 7. Store response in memory
+        # 7. Store the exchange in memory (one batched write per turn); the
+        # current message is already the last entry sent to the LLM
         if self.memory:
-            self.memory.add_message("assistant", str(response))
+            self.memory.add_messages(
+                [("user", input_message), ("assistant", _render_response(response))]
+            )
 
         # 8. Complete processing
         self.state_machine.trigger("process:complete", self)
 
         return response
 
+    def _response_cache_partition(self, chat_history: list[Any] | None) -> str | None:
+        """
+        Get the response cache partition for the current message.
+
+        Returns None when the cache must be bypassed: no cache configured,
+        an explicit chat history, earlier turns in memory, or registered tools
+        (whose results may change). The partition does not capture the
+        conversation, so a message that refers to earlier turns ("what did I
+        just ask?") could otherwise get an answer cached for another
+        conversation; only turns without conversation memory are cached.
+        """
+        if self.response_cache is None or chat_history:
+            return None
+        if self.memory and self.memory.get_recent_messages(1):
+            return None
+        if self.tools and self.tools.get_tools():
+            return None
+
+        # Urgent events (e.g. emails flagged is_urgent) get their own partition
+        events = self.context.get("current_events") or [self.context.get("current_event") or {}]
+        urgent = any(e.get("data", {}).get("is_urgent") for e in events if isinstance(e, dict))
+        protocol_query = self.state_machine.get_protocol_query() or ""
+        return f"{self.get_current_state()}|{protocol_query}|{'urgent' if urgent else 'normal'}"
+
     def _build_system_prompt(self) -> str:
         """
         Build the system prompt from context and current state.
@@ -217,8 +415,8 @@ class Agent:
         """
         # Add state instruction to context
         state_instruction = self.state_machine.get_current_instruction()
-        self.context.add("current_state", self.state_machine.current_state)
-        self.context.add("state_instruction", state_instruction)
+        self._set_context("current_state", self.state_machine.current_state)
+        self._set_context("state_instruction", state_instruction)
 
         # Collect context from all IContextProvider components
         self._collect_context_contributions()
@@ -228,10 +426,28 @@ class Agent:
         if protocol_query:
             protocols = self.context.get_protocols(protocol_query)
             if protocols:
-                self.context.add("active_protocols", [p.model_dump() for p in protocols])
+                self._set_context("active_protocols", [p.cached_dump for p in protocols])
 
+        # ContextManager reuses the rendered message while its versioned inputs
+        # are unchanged, and _set_context() leaves them alone on steady turns
         return self.context.populate_system_message()
 
+    def _set_context(self, key: str, value: Any) -> None:
+        """
+        Write a context entry only when its value actually changed.
+
+        Keeps steady-state turns from rewriting identical entries, so the
+        context is only touched (and caches invalidated) on real change.
+        The value is compared against a copy taken at the last write, so a
+        value mutated in place since then is still written again.
+        """
+        last = self._ctx_last.get(key)
+        # Skip only if the entry still holds the object written last time
+        if last is not None and self.context.get(key) is last[1] and value == last[0]:
+            return
+        self.context.add(key, value)
+        self._ctx_last[key] = (copy.deepcopy(value), value)
+
     def _collect_context_contributions(self) -> None:
         """
         Collect context from all components implementing IContextProvider.
@@ -261,11 +477,11 @@ class Agent:
                         if contribution:
                             # Merge each key from the contribution
                             for key, value in contribution.items():
-                                self.context.add(key, value)
+                                self._set_context(key, value)
                     except Exception as e:
                         if self.logger:
                             self.logger.warning(
-                                f"Failed to get context from {type(component).__name__}: {e}"
+                                "Failed to get context from %s: %s", type(component).__name__, e
                             )
 
     def _build_messages(
@@ -274,63 +490,71 @@ class Agent:
         user_message: str,
         chat_history: list[Any] | None = None
     ) -> list[dict[str, str]]:
-        """Build message list for LLM invocation."""
-        messages = [{"role": "system", "content": system_prompt}]
+        """
+        Build message list for LLM invocation.
 
+        The list is built once and then grown in place by the ReAct loop and
+        handed to the provider as-is, so no per-iteration copy is made.
+        """
         # Add chat history if provided
-        if chat_history:
-            for msg in chat_history:
-                if hasattr(msg, 'type') and hasattr(msg, 'content'):
-                    messages.append({"role": msg.type, "content": msg.content})
-                elif isinstance(msg, dict):
-                    messages.append(msg)
-
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
+        history = [
+            {"role": msg.type, "content": msg.content}
+            if hasattr(msg, 'type') and hasattr(msg, 'content') else msg
+            for msg in chat_history or ()
+            if isinstance(msg, dict) or (hasattr(msg, 'type') and hasattr(msg, 'content'))
+        ]
 
-        return messages
+        return [
+            {"role": "system", "content": system_prompt},
+            *history,
+            {"role": "user", "content": user_message},
+        ]
 
     def _execute_react_loop(self, messages: list[dict], max_iterations: int = 10) -> Any:
         """Execute the ReAct reasoning loop."""
+        # Hoist component lookups out of the loop
+        trigger = self.state_machine.trigger
+        logger = self.logger
+        life_manager = self.life_manager
+        watchdog = self.watchdog
+        execute_tool = self.tools.execute_tool if self.tools else None
+        log_thinking = logger is not None and logger.is_enabled_for(LogLevel.DEBUG)
+        append_message = messages.append
         iteration = 0
 
         while iteration < max_iterations:
             iteration += 1
 
             # Check rate limits
-            if self.life_manager and not self.life_manager.check_rate_limit():
-                if self.logger:
-                    self.logger.warning("Rate limit reached, waiting...")
+            if life_manager and not life_manager.check_rate_limit():
+                if logger:
+                    logger.warning("Rate limit reached, waiting...")
                 time.sleep(1)
 
             # Check watchdog timeout
-            if self.watchdog and self.watchdog.is_timed_out():
-                self.state_machine.trigger("watchdog:timeout", self)
+            if watchdog and watchdog.is_timed_out():
+                trigger("watchdog:timeout", self)
                 raise TimeoutError("Agent operation timed out")
 
             # Invoke LLM
             try:
-                # Bind tools if available
-                llm = self.text_provider
-                if self.tools:
-                    tools = self.tools.get_tools()
-                    if tools:
-                        llm = llm.bind_tools(tools)
+                # Bind tools if available (reused while the tool set is unchanged)
+                llm = self._get_bound_llm()
 
                 response = llm.invoke(messages)
 
                 # Record token usage
-                if self.life_manager:
-                    token_estimate = len(str(response)) // 4
-                    self.life_manager.record_request(token_estimate)
+                if life_manager:
+                    token_estimate = len(_render_response(response)) // 4
+                    life_manager.record_request(token_estimate)
 
                 # Log thinking
-                if self.logger and hasattr(response, 'content'):
-                    self.logger.log_thinking(str(response.content)[:200])
+                if log_thinking and hasattr(response, 'content'):
+                    logger.log_thinking(str(response.content)[:200])
 
                 # Check for tool calls
                 if hasattr(response, 'tool_calls') and response.tool_calls:
-                    self.state_machine.trigger("action:execute", self)
+                    trigger("action:execute", self)
 
                     # Append assistant message with tool calls
                     assistant_msg = {
@@ -338,69 +562,90 @@ class Agent:
                         "content": str(response.content) if response.content else None,
                         "tool_calls": response.tool_calls
                     }
-                    messages.append(assistant_msg)
+                    append_message(assistant_msg)
 
+                    # Extraction strategy is resolved once per tool call type
+                    calls = []
                     for tool_call in response.tool_calls:
-                        # Handle object (Pydantic/SDK) or dict
-                        if hasattr(tool_call, 'function'):
-                            tool_name = tool_call.function.name
-                            tool_args = tool_call.function.arguments
-                            # Parse JSON arguments if string
-                            if isinstance(tool_args, str):
-                                with contextlib.suppress(Exception):
-                                    tool_args = json.loads(tool_args)
+                        name_fn, args_fn, id_fn = _get_tool_call_extractors(tool_call)
+                        calls.append((name_fn(tool_call), args_fn(tool_call), id_fn(tool_call)))
+
+                    # Independent tool calls run concurrently when a pool is configured
+                    if len(calls) > 1 and self.max_tool_workers > 1:
+                        executor = self._get_tool_executor()
+                        outcomes = [
+                            future.result() for future in [
+                                executor.submit(_run_tool, execute_tool, name, args)
+                                for name, args, _ in calls
+                            ]
+                        ]
+                    else:
+                        outcomes = [_run_tool(execute_tool, name, args) for name, args, _ in calls]
+
+                    for (tool_name, tool_args, tool_call_id), (result, error) in zip(
+                        calls, outcomes, strict=True
+                    ):
+                        if error is None:
+                            if self._tool_trace is not None:
+                                self._tool_trace.append({"name": tool_name, "args": tool_args})
+                            if logger:
+                                logger.log_tool_call(tool_name, tool_args, result)
+                            content = str(result)
                         else:
-                            # Handle dict
-                            tool_name = tool_call.get('name', tool_call.get('function', {}).get('name'))
-                            tool_args = tool_call.get('args', tool_call.get('function', {}).get('arguments', {}))
-
-                        try:
-                            result = self.tools.execute_tool(tool_name, **tool_args)
-                            if self.logger:
-                                self.logger.log_tool_call(tool_name, tool_args, result)
-
-                            # Get tool call ID safely
-                            if hasattr(tool_call, 'id'):
-                                tool_call_id = tool_call.id
-                            else:
-                                tool_call_id = tool_call.get('id')
-
-                            messages.append({
-                                "role": "tool",
-                                "content": str(result),
-                                "name": tool_name,
-                                "tool_call_id": tool_call_id
-                            })
-                        except Exception as e:
-                            if self.logger:
-                                self.logger.error(f"Tool execution failed: {e}")
-
-                            # Get ID safely for error message too
-                            if hasattr(tool_call, 'id'):
-                                err_id = tool_call.id
-                            else:
-                                err_id = tool_call.get('id')
-
-                            messages.append({
-                                "role": "tool",
-                                "content": f"Error: {e}",
-                                "name": tool_name,
-                                "tool_call_id": err_id
-                            })
-
-                    self.state_machine.trigger("action:complete", self)
+                            if logger:
+                                logger.error("Tool execution failed: %s", error)
+                            content = f"Error: {error}"
+
+                        append_message({
+                            "role": "tool",
+                            "content": content,
+                            "name": tool_name,
+                            "tool_call_id": tool_call_id
+                        })
+
+                    trigger("action:complete", self)
                     continue  # Continue loop for more reasoning
 
                 # No tool calls - return final response
                 return response
 
             except Exception as e:
-                if self.life_manager and self.life_manager.handle_api_error(e):
+                if life_manager and life_manager.handle_api_error(e):
                     continue  # Retry
                 raise
 
         raise RuntimeError(f"ReAct loop exceeded maximum iterations ({max_iterations})")
 
+    def _get_tool_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for concurrent tool calls, creating it on first use."""
+        if self._tool_executor is None:
+            self._tool_executor = ThreadPoolExecutor(
+                max_workers=self.max_tool_workers, thread_name_prefix="agent-tool"
+            )
+        return self._tool_executor
+
+    def _get_bound_llm(self) -> ITextClient:
+        """
+        Get the text provider with the current tools bound.
+
+        The bound client is cached against the tool manager's version counter
+        (when it exposes one) so bind_tools() only runs when tools change.
+        """
+        if not self.tools:
+            return self.text_provider
+
+        version = getattr(self.tools, 'version', None)
+        cache_key = (id(self.text_provider), version)
+        if (version is not None and self._cached_bound_llm is not None
+                and self._cached_bound_llm_version == cache_key):
+            return self._cached_bound_llm
+
+        tools = self.tools.get_tools()
+        llm = self.text_provider.bind_tools(tools) if tools else self.text_provider
+        self._cached_bound_llm = llm
+        self._cached_bound_llm_version = cache_key
+        return llm
+
     # ==========================================================================
     # REACTIVE MODE - Monitoring/Event-Driven
     # ==========================================================================
@@ -409,7 +654,27 @@ class Agent:
         """
         REACTIVE MODE (Monitoring/Event-Driven).
 
-        Starts a continuous observation loop for inbox and tasks.
+        Starts a continuous observation loop for inbox and tasks. Blocking
+        wrapper around start_monitoring_async() for synchronous callers.
+
+        Args:
+            sources: List of sources to monitor ('inbox', 'tasks')
+        """
+        # asyncio is only needed in reactive mode; import it on demand
+        import asyncio
+
+        try:
+            asyncio.run(self.start_monitoring_async(sources))
+        except KeyboardInterrupt:
+            if self.logger:
+                self.logger.info("Monitoring stopped by user")
+
+    async def start_monitoring_async(self, sources: list[str] | None = None) -> None:
+        """
+        REACTIVE MODE on an existing event loop.
+
+        Lets several agents share a single event loop instead of holding
+        one blocked thread each.
 
         Args:
             sources: List of sources to monitor ('inbox', 'tasks')
@@ -417,7 +682,7 @@ class Agent:
         if sources is None:
             sources = ['inbox', 'tasks']
         if self.logger:
-            self.logger.info(f"Starting monitoring mode for: {sources}")
+            self.logger.info("Starting monitoring mode for: %s", sources)
 
         # Transition to MONITORING state
         self.state_machine.trigger("mode:monitoring", self)
@@ -426,41 +691,71 @@ class Agent:
         poll_interval = self.watchdog.get_poll_interval() if self.watchdog else 30.0
 
         try:
-            while self._is_monitoring:
-                events_detected = []
-
-                # Check inbox
-                if 'inbox' in sources and self.inbox_client:
-                    new_emails = self.inbox_client.check_new_emails()
-                    for email in new_emails:
-                        events_detected.append(AgentEvent.from_email(email))
-                        if self.logger:
-                            self.logger.info(f"New email detected: {email.subject}")
+            await self._monitor_loop(sources, poll_interval)
+        finally:
+            self._is_monitoring = False
+            self.state_machine.force_transition(AgentState.IDLE.value, self)
 
-                # Check tasks
-                if 'tasks' in sources and self.task_client:
-                    self.task_client.get_pending_tasks()  # Check for pending tasks
-                    overdue_tasks = self.task_client.get_overdue_tasks()
+    async def _monitor_loop(self, sources: list[str], poll_interval: float) -> None:
+        """Poll the monitored sources until stop_monitoring() is called."""
+        import asyncio
 
-                    for task in overdue_tasks:
-                        events_detected.append(AgentEvent.from_task(task))
-                        if self.logger:
-                            self.logger.warning(f"Overdue task: {task.title}")
+        while self._is_monitoring:
+            heap = await self._poll_sources(sources)
 
-                # Process detected events
-                for event in sorted(events_detected, key=lambda e: e.priority, reverse=True):
-                    self.process_event(event)
+            # Drain the heap highest priority first
+            events_detected = [heapq.heappop(heap)[2] for _ in range(len(heap))]
 
-                # Wait for next poll
-                if self._is_monitoring:
-                    time.sleep(poll_interval)
+            # Process detected events (LLM calls run off the event loop);
+            # several events from one cycle share a single ReAct cycle
+            if len(events_detected) > 1:
+                await asyncio.to_thread(self.process_events, events_detected)
+            elif events_detected:
+                await asyncio.to_thread(self.process_event, events_detected[0])
 
-        except KeyboardInterrupt:
-            if self.logger:
-                self.logger.info("Monitoring stopped by user")
-        finally:
-            self._is_monitoring = False
-            self.state_machine.force_transition(AgentState.IDLE.value, self)
+            # Wait for next poll
+            if self._is_monitoring:
+                await asyncio.sleep(poll_interval)
+
+    async def _poll_sources(self, sources: list[str]) -> list[tuple[int, int, AgentEvent]]:
+        """
+        Check inbox and tasks concurrently and convert results to events.
+
+        Returns:
+            Max-heap of (-priority, arrival_order, event) entries
+        """
+        import asyncio
+
+        check_inbox = 'inbox' in sources and self.inbox_client is not None
+        check_tasks = 'tasks' in sources and self.task_client is not None
+
+        checks = []
+        if check_inbox:
+            checks.append(asyncio.to_thread(self.inbox_client.check_new_emails))
+        if check_tasks:
+            checks.append(asyncio.to_thread(self.task_client.get_pending_tasks))
+            checks.append(asyncio.to_thread(self.task_client.get_overdue_tasks))
+
+        results = iter(await asyncio.gather(*checks))
+        events_detected: list[tuple[int, int, AgentEvent]] = []
+        arrival = itertools.count()
+
+        if check_inbox:
+            for email in next(results):
+                event = AgentEvent.from_email(email)
+                heapq.heappush(events_detected, (-event.priority, next(arrival), event))
+                if self.logger:
+                    self.logger.info("New email detected: %s", email.subject)
+
+        if check_tasks:
+            next(results)  # Pending tasks are checked but only overdue ones raise events
+            for task in next(results):
+                event = AgentEvent.from_task(task)
+                heapq.heappush(events_detected, (-event.priority, next(arrival), event))
+                if self.logger:
+                    self.logger.warning("Overdue task: %s", task.title)
+
+        return events_detected
 
     def stop_monitoring(self) -> None:
         """Stop the monitoring loop."""
@@ -481,7 +776,7 @@ class Agent:
             The agent's response/action for the event
         """
         if self.logger:
-            self.logger.info(f"Processing event: {event.event_type} from {event.source}")
+            self.logger.info("Processing event: %s from %s", event.event_type, event.source)
 
         # Trigger transition based on event type
         if event.event_type == "inbox":
@@ -493,15 +788,144 @@ class Agent:
         self.context.add("current_event", event.model_dump())
 
         # Build event-specific message
-        if event.event_type == "inbox":
-            message = f"New email received. Subject: {event.data.get('subject')}. From: {event.data.get('sender')}. Preview: {event.data.get('body_snippet')}"
-        elif event.event_type == "task":
-            message = f"Task requires attention. Title: {event.data.get('title')}. Priority: {event.data.get('priority')}. Status: {event.data.get('status')}"
-        else:
-            message = f"Event received: {event.event_type} - {event.data}"
+        message = self._describe_event(event)
+
+        # Replay a recorded plan for a recurring event, or run the full pipeline
+        plan_key = self._plan_key(event) if self.use_plan_cache else None
+        response = self._replay_plan(plan_key, message) if plan_key else None
+        if response is None:
+            self._tool_trace = [] if plan_key else None
+            try:
+                response = self.process_message(message)
+                if plan_key:
+                    self._store_plan(plan_key, self._tool_trace, _render_response(response))
+            finally:
+                self._tool_trace = None
+
+        # Return to monitoring if still active
+        if self._is_monitoring:
+            self.state_machine.force_transition(AgentState.MONITORING.value, self)
+
+        return response
+
+    # ==========================================================================
+    # PLAN CACHE - Replay of recurring events
+    # ==========================================================================
+
+    @staticmethod
+    def _plan_key(event: AgentEvent) -> str:
+        """
+        Get the plan cache key for an event.
+
+        Events share a plan when they have the same type, the same sender or
+        title, and the same priority.
+        """
+        data = event.data
+        subject = data.get("title") or f"{data.get('sender')}|{data.get('subject')}"
+        signature = f"{event.event_type}|{subject}|{event.priority}"
+        return hashlib.sha1(signature.encode("utf-8")).hexdigest()
+
+    def _load_plans(self) -> dict[str, dict[str, Any]]:
+        """Get the plan cache, loading it from the workspace on first use."""
+        if self._plan_cache is None:
+            self._plan_cache = {}
+            raw = None
+            if self.workspace_manager:
+                raw = self.workspace_manager.read_file(_PLAN_CACHE_FILE)
+            if raw:
+                try:
+                    self._plan_cache = json.loads(raw)
+                except json.JSONDecodeError:
+                    if self.logger:
+                        self.logger.warning("Ignoring corrupt plan cache")
+        return self._plan_cache
+
+    def _store_plan(self, key: str, tool_calls: list[dict[str, Any]], response: str) -> None:
+        """Record the tool calls and final response produced for an event."""
+        plans = self._load_plans()
+        plans[key] = {"tool_calls": tool_calls, "response": response}
+        if self.workspace_manager:
+            self.workspace_manager.update_file(_PLAN_CACHE_FILE, json.dumps(plans))
+
+    def _replay_plan(self, key: str, message: str) -> _ReplayedResponse | None:
+        """
+        Replay a recorded plan through the tool manager.
+
+        Replaying re-executes the recorded tool calls, side effects included.
+        When a call fails, the calls before it have already run; the full
+        pipeline that regenerates the plan may then run them again.
+
+        Returns:
+            The recorded response, or None when there is no plan or a tool
+            call fails (the plan is then dropped and regenerated)
+        """
+        plan = self._load_plans().get(key)
+        if plan is None:
+            return None
+
+        replayed: list[str] = []
+        try:
+            for call in plan["tool_calls"]:
+                if not self.tools:
+                    raise ValueError(f"Tool '{call['name']}' not found")
+                self.tools.execute_tool(call["name"], **call["args"])
+                replayed.append(call["name"])
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(
+                    "Plan replay failed after running %s, regenerating: %s",
+                    replayed or "no tool calls", e
+                )
+            del self._plan_cache[key]
+            return None
 
-        # Process through the regular message pipeline
-        response = self.process_message(message)
+        if self.logger:
+            self.logger.info("Replayed cached plan (%d tool calls)", len(replayed))
+        if self.memory:
+            self.memory.add_messages([("user", message), ("assistant", plan["response"])])
+        # Finish the cycle the way process_message() does
+        self.state_machine.trigger("process:complete", self)
+        return _ReplayedResponse(plan["response"])
+
+    def process_events(self, events: list[AgentEvent]) -> Any:
+        """
+        Process several events detected in the same poll cycle at once.
+
+        Events are rendered, in the given order, into a single message so the
+        whole batch costs one system prompt build and one ReAct cycle. The
+        batch is only in the context while it is being processed.
+
+        Args:
+            events: The events to process, highest priority first (the order
+                the monitoring loop pops them from its priority heap)
+
+        Returns:
+            The agent's response/action for the batch
+        """
+        if self.logger:
+            for event in events:
+                self.logger.info("Processing event: %s from %s", event.event_type, event.source)
+
+        # Inbox activity has a dedicated transition; anything else forces THINKING
+        if any(event.event_type == "inbox" for event in events):
+            self.state_machine.trigger("event:inbox_activity", self)
+        if not self.state_machine.is_in_state(AgentState.THINKING.value):
+            self.state_machine.force_transition(AgentState.THINKING.value, self)
+
+        # Update context with the data of every event in the batch
+        self.context.add("current_events", [event.model_dump() for event in events])
+
+        lines = [f"{len(events)} events require attention (highest priority first):"]
+        lines.extend(
+            f"- [priority {event.priority}] {self._describe_event(event)}" for event in events
+        )
+
+        # Process the whole batch through the regular message pipeline; drop the
+        # batch afterwards so later events and messages don't see it
+        try:
+            response = self.process_message("\n".join(lines))
+        finally:
+            self.context.remove("current_events")
 
         # Return to monitoring if still active
         if self._is_monitoring:
@@ -509,6 +933,14 @@ class Agent:
 
         return response
 
+    def _describe_event(self, event: AgentEvent) -> str:
+        """Render an event as a user message for the LLM."""
+        if event.event_type == "inbox":
+            return f"New email received. Subject: {event.data.get('subject')}. From: {event.data.get('sender')}. Preview: {event.data.get('body_snippet')}"
+        if event.event_type == "task":
+            return f"Task requires attention. Title: {event.data.get('title')}. Priority: {event.data.get('priority')}. Status: {event.data.get('status')}"
+        return f"Event received: {event.event_type} - {event.data}"
+
     # ==========================================================================
     # PROTOCOL MANAGEMENT
     # ==========================================================================
@@ -544,6 +976,18 @@ class Agent:
 
         if self.life_manager:
             status["guardrails"] = self.life_manager.check_guardrails()
-            status["token_usage"] = self.life_manager.get_token_usage()
+            # Copy the (possibly live) usage view so the status is a snapshot
+            status["token_usage"] = dict(self.life_manager.get_token_usage())
 
         return status
+
+    def close(self) -> None:
+        """
+        Release resources held by the agent.
+
+        Shuts down the thread pool used for concurrent tool calls, waiting for
+        running calls to finish. The pool is recreated if the agent is used again.
+        """
+        executor, self._tool_executor = self._tool_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
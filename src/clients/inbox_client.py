@@ -2,19 +2,39 @@
 Mock Inbox Client for testing and development.
 """
 
+import time
 import uuid
+from collections import deque
 from datetime import datetime
 
 from ..interfaces.base import IInboxClient
 from ..models.data_models import EmailMessage
 
+# How long a sent_at timestamp is reused for burst sends (seconds)
+_SENT_AT_TTL = 1.0
+
+# (monotonic timestamp, ISO string) of the last issued sent_at value
+_sent_at_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def _sent_at() -> str:
+    """Current time in ISO format, reused for sends within _SENT_AT_TTL."""
+    global _sent_at_cache
+    tick = time.monotonic()
+    if tick - _sent_at_cache[0] >= _SENT_AT_TTL:
+        _sent_at_cache = (tick, datetime.now().isoformat())
+    return _sent_at_cache[1]
+
 
 class MockInboxClient(IInboxClient):
     """Mock implementation of IInboxClient for testing."""
 
     def __init__(self):
-        self._emails: list[EmailMessage] = []
-        self._sent_emails: list[dict] = []
+        # Append-only logs: deques grow without list reallocation copies
+        self._emails: deque[EmailMessage] = deque()
+        # Unread, non-archived emails by thread_id (insertion ordered)
+        self._unread: dict[str, EmailMessage] = {}
+        self._sent_emails: deque[dict] = deque()
         self._read_threads: set = set()
         self._archived_threads: set = set()
 
@@ -29,24 +49,26 @@ class MockInboxClient(IInboxClient):
             thread_id=thread_id
         )
         self._emails.append(email)
+        self._unread[thread_id] = email
         return thread_id
 
     def check_new_emails(self) -> list[EmailMessage]:
-        unread = [e for e in self._emails if e.thread_id not in self._read_threads]
-        return unread
+        return list(self._unread.values())
 
     def send_email(self, to: str, subject: str, body: str,
                    cc: list[str] | None = None, bcc: list[str] | None = None) -> bool:
         self._sent_emails.append({
             "to": to, "subject": subject, "body": body,
-            "cc": cc, "bcc": bcc, "sent_at": datetime.now().isoformat()
+            "cc": cc, "bcc": bcc, "sent_at": _sent_at()
         })
         return True
 
     def mark_as_read(self, thread_id: str) -> bool:
         self._read_threads.add(thread_id)
+        self._unread.pop(thread_id, None)
         return True
 
     def archive(self, thread_id: str) -> bool:
         self._archived_threads.add(thread_id)
+        self._unread.pop(thread_id, None)
         return True
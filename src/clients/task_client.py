@@ -2,37 +2,67 @@
 Mock Task Client for testing and development.
 """
 
+import bisect
+import itertools
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from ..interfaces.base import ITaskManager
 from ..models.data_models import TaskItem, TaskStatus
 
 
+def _date_key(due_date: str) -> int | None:
+    """Convert an ISO date ("YYYY-MM-DD...") to a YYYYMMDD int, or None if unparseable."""
+    try:
+        day = date.fromisoformat(due_date[:10])
+    except ValueError:
+        return None
+    return day.year * 10000 + day.month * 100 + day.day
+
+
 class MockTaskClient(ITaskManager):
     """Mock implementation of ITaskManager for testing."""
 
     def __init__(self):
         self._tasks: dict[str, TaskItem] = {}
+        # Ids of pending tasks (dict keeps insertion order)
+        self._pending: dict[str, None] = {}
+        # YYYYMMDD due date of each dated task
+        self._due_keys: dict[str, int] = {}
+        # (YYYYMMDD, task_id) pairs kept sorted for overdue range queries
+        self._due_index: list[tuple[int, str]] = []
 
     def get_pending_tasks(self) -> list[TaskItem]:
-        return [t for t in self._tasks.values() if t.status == TaskStatus.PENDING.value]
+        # Status is re-checked in case a task was modified via get_task()
+        pending = TaskStatus.PENDING.value
+        tasks = self._tasks
+        return [task for task_id in self._pending if (task := tasks[task_id]).status == pending]
 
     def create_task(self, title: str, due_date: str | None = None,
                     priority: int = 1, description: str | None = None) -> str:
         task_id = f"task_{uuid.uuid4().hex[:8]}"
-        self._tasks[task_id] = TaskItem(
+        task = TaskItem(
             task_id=task_id,
             title=title,
             due_date=due_date,
             priority=priority,
             description=description
         )
+        self._tasks[task_id] = task
+        if task.status == TaskStatus.PENDING.value:
+            self._pending[task_id] = None
+        if due_date and (key := _date_key(due_date)) is not None:
+            self._due_keys[task_id] = key
+            bisect.insort(self._due_index, (key, task_id))
         return task_id
 
     def update_task_status(self, task_id: str, status: str) -> bool:
         if task_id in self._tasks:
             self._tasks[task_id].status = status
+            if status == TaskStatus.PENDING.value:
+                self._pending[task_id] = None
+            else:
+                self._pending.pop(task_id, None)
             return True
         return False
 
@@ -42,13 +72,24 @@ class MockTaskClient(ITaskManager):
     def delete_task(self, task_id: str) -> bool:
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._pending.pop(task_id, None)
+            key = self._due_keys.pop(task_id, None)
+            if key is not None:
+                entry = (key, task_id)
+                index = bisect.bisect_left(self._due_index, entry)
+                if index < len(self._due_index) and self._due_index[index] == entry:
+                    del self._due_index[index]
             return True
         return False
 
     def get_overdue_tasks(self) -> list[TaskItem]:
-        now = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = now.year * 10000 + now.month * 100 + now.day
+        pending = TaskStatus.PENDING.value
+        # Entries before (today,) are exactly those due before today
+        end = bisect.bisect_left(self._due_index, (today,))
+        tasks, pending_ids = self._tasks, self._pending
         return [
-            t for t in self._tasks.values()
-            if t.due_date and t.due_date < now and t.status == TaskStatus.PENDING.value
+            task for _, task_id in itertools.islice(self._due_index, end)
+            if task_id in pending_ids and (task := tasks[task_id]).status == pending
         ]
-
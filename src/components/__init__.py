@@ -1,46 +1,73 @@
 # Components module
 # Contains all component implementations for the agent framework
+#
+# Submodules are imported lazily (PEP 562): accessing a name imports only the
+# module that defines it, so e.g. using ContextManager does not load the
+# workspace, lifecycle or response cache modules.
 
-from .context_manager import (
-    SYSTEM_PROMPT_TEMPLATES,
-    ContextManager,
-    DictToXMLFormatter,
-    MarkdownFormatter,
-    MetaData,
-    SystemPromptTemplate,
-    TemplateRegistry,
-)
-from .lifecycle import LifeCycleManager
-from .logger import CompositeLogger, ConsoleLogger, FileLogger
-from .memory import InMemoryManager
-from .state_machine import StateMachine
-from .tools import ToolManager
-from .watchdog import Watchdog
-from .workspace import WorkspaceManager
-
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .context_manager import (
+        SYSTEM_PROMPT_TEMPLATES,
+        ContextManager,
+        DictToXMLFormatter,
+        MarkdownFormatter,
+        MetaData,
+        SystemPromptTemplate,
+        TemplateRegistry,
+    )
+    from .lifecycle import LifeCycleManager
+    from .logger import CompositeLogger, ConsoleLogger, FileLogger
+    from .memory import InMemoryManager
+    from .response_cache import SemanticResponseCache
+    from .state_machine import StateMachine
+    from .tools import ToolManager
+    from .watchdog import Watchdog
+    from .workspace import WorkspaceManager
+
+# Public name -> defining submodule
+_LAZY_IMPORTS: dict[str, str] = {
     # Context Manager
-    "ContextManager",
-    "DictToXMLFormatter",
-    "MarkdownFormatter",
-    "MetaData",
-    "SystemPromptTemplate",
-    "SYSTEM_PROMPT_TEMPLATES",
-    "TemplateRegistry",
+    "ContextManager": ".context_manager",
+    "DictToXMLFormatter": ".context_manager",
+    "MarkdownFormatter": ".context_manager",
+    "MetaData": ".context_manager",
+    "SystemPromptTemplate": ".context_manager",
+    "SYSTEM_PROMPT_TEMPLATES": ".context_manager",
+    "TemplateRegistry": ".context_manager",
     # State Machine
-    "StateMachine",
+    "StateMachine": ".state_machine",
     # Watchdog
-    "Watchdog",
+    "Watchdog": ".watchdog",
     # Loggers
-    "ConsoleLogger",
-    "FileLogger",
-    "CompositeLogger",
+    "ConsoleLogger": ".logger",
+    "FileLogger": ".logger",
+    "CompositeLogger": ".logger",
     # Lifecycle
-    "LifeCycleManager",
+    "LifeCycleManager": ".lifecycle",
     # Workspace
-    "WorkspaceManager",
+    "WorkspaceManager": ".workspace",
     # Memory
-    "InMemoryManager",
+    "InMemoryManager": ".memory",
+    # Response Cache
+    "SemanticResponseCache": ".response_cache",
     # Tools
-    "ToolManager",
-]
+    "ToolManager": ".tools",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
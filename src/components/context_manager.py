@@ -5,20 +5,30 @@ Manages the agent's context dictionary which forms the system prompt.
 Supports protocols, dynamic context injection, and template factories.
 """
 
+import functools
+import operator
 import re
+import sys
+import time
+from collections.abc import Callable
 from datetime import datetime
-from enum import Enum
-from typing import Any
+from typing import Any, ClassVar, Final
 
 from pydantic import BaseModel, Field
 
 from ..interfaces.base import IFormatter
-from ..models.data_models import Protocol
+from ..models.data_models import Protocol, ProtocolStep
 
 # ==============================================================================
 # METADATA MODEL FOR DYNAMIC VARIABLES
 # ==============================================================================
 
+_DATE_FMT = "%Y-%m-%d"
+_DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+# Seconds during which MetaData time fields share one datetime.now() reading
+_NOW_TTL = 0.001
+
+
 class MetaData(BaseModel):
     """
     Model for dynamic metadata that can be referenced in system prompts.
@@ -40,23 +50,41 @@ class MetaData(BaseModel):
     session_id: str | None = Field(default=None, description="Current session ID")
     user_name: str | None = Field(default=None, description="Name of the current user")
 
-    # Dynamic time fields (auto-updated on access)
-    _cached_time: datetime | None = None
+    # Dynamic time fields (auto-updated on access): (monotonic timestamp,
+    # datetime.now()) shared by accesses within _NOW_TTL
+    _now_cache: tuple[float, datetime] | None = None
+    # Bumped whenever a public field is reassigned (render cache key)
+    _version: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_version", self._version + 1)
+
+    def _now(self) -> datetime:
+        """Current datetime, reused for accesses within the same millisecond."""
+        tick = time.monotonic()
+        cached = self._now_cache
+        if cached is not None and tick - cached[0] < _NOW_TTL:
+            return cached[1]
+        now = datetime.now()
+        self._now_cache = (tick, now)
+        return now
 
     @property
     def current_time(self) -> str:
         """Current time in ISO format (auto-updated)."""
-        return datetime.now().isoformat()
+        return self._now().isoformat()
 
     @property
     def current_date(self) -> str:
         """Current date in YYYY-MM-DD format."""
-        return datetime.now().strftime("%Y-%m-%d")
+        return self._now().strftime(_DATE_FMT)
 
     @property
     def current_datetime(self) -> str:
         """Current date and time formatted for display."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return self._now().strftime(_DATETIME_FMT)
 
     # Custom fields dictionary for extensibility
     custom: dict[str, Any] = Field(default_factory=dict, description="Custom metadata fields")
@@ -74,49 +102,58 @@ class MetaData(BaseModel):
         Returns:
             Field value or None if not found
         """
+        # Known fields and properties resolve through a per-class table
+        resolver = _meta_resolvers(type(self)).get(field_name)
+        if resolver is not None:
+            return resolver(self)
+
         if "." in field_name:
-            parts = field_name.split(".", 1)
-            if parts[0] == "custom" and parts[1] in self.custom:
-                return self.custom[parts[1]]
-            return None
-
-        # Check for property (like current_time)
-        if hasattr(self.__class__, field_name):
-            attr = getattr(self.__class__, field_name)
-            if isinstance(attr, property):
-                return attr.fget(self)
+            prefix, _, key = field_name.partition(".")
+            return self.custom.get(key) if prefix == "custom" else None
 
-        # Check for regular field
-        if hasattr(self, field_name):
-            return getattr(self, field_name)
+        return getattr(self, field_name, None)
 
-        return None
+
+@functools.cache
+def _meta_resolvers(cls: type[MetaData]) -> dict[str, Callable[[MetaData], Any]]:
+    """Map each model field and property of a MetaData class to an accessor."""
+    resolvers: dict[str, Callable[[MetaData], Any]] = {
+        name: operator.attrgetter(name) for name in cls.model_fields
+    }
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            if isinstance(attr, property):
+                resolvers[name] = attr.fget
+    return resolvers
 
 
 # ==============================================================================
 # SYSTEM PROMPT TEMPLATES (DICTIONARY-BASED)
 # ==============================================================================
 
-class SystemPromptTemplate(str, Enum):
+class SystemPromptTemplate:
     """
     Pre-defined system prompt template identifiers.
 
     Templates are DICTIONARIES that define the base context structure.
     They work in harmony with context.add() - templates provide the base,
     context.add() can add or override any field.
+
+    The identifiers are plain strings (the keys of SYSTEM_PROMPT_TEMPLATES),
+    so they can be passed anywhere a template name is accepted.
     """
 
     # Minimal template - just identity
-    MINIMAL = "minimal"
+    MINIMAL: Final[str] = "minimal"
 
     # General purpose assistant
-    GENERAL_ASSISTANT = "general_assistant"
+    GENERAL_ASSISTANT: Final[str] = "general_assistant"
 
     # Task-oriented agent with protocols
-    TASK_AGENT = "task_agent"
+    TASK_AGENT: Final[str] = "task_agent"
 
     # Reactive/monitoring agent
-    REACTIVE_AGENT = "reactive_agent"
+    REACTIVE_AGENT: Final[str] = "reactive_agent"
 
 
 # Template content dictionary - each template is a DICT structure
@@ -297,7 +334,12 @@ class TemplateRegistry:
         context = ContextManager(template="my_agent")
     """
 
-    _custom_templates: dict[str, dict[str, Any]] = {}
+    _custom_templates: ClassVar[dict[str, dict[str, Any]]] = {}
+    # Built-in and custom templates in one lookup table (custom ones win):
+    # (custom templates dict, its length, table), rebuilt when either changes
+    _combined: ClassVar[
+        tuple[dict[str, dict[str, Any]], int, dict[str, dict[str, Any]]] | None
+    ] = None
 
     @classmethod
     def register(cls, name: str, template: dict[str, Any]) -> None:
@@ -321,7 +363,28 @@ class TemplateRegistry:
                 }
             })
         """
-        cls._custom_templates[name] = template
+        # Private copy: the registry shares it read-only with ContextManagers
+        cls._custom_templates[name] = _intern_keys(template)
+        cls._combined = None
+
+    @classmethod
+    def _get_shared(cls, name: str) -> dict[str, Any] | None:
+        """
+        Get the registry's own template dictionary without copying.
+
+        The result must be treated as read-only; ContextManager never mutates
+        its template in place, so instances can share it instead of copying.
+        """
+        return cls._get_combined().get(name)
+
+    @classmethod
+    def _get_combined(cls) -> dict[str, dict[str, Any]]:
+        """Get the name -> template table, rebuilding it if custom templates changed."""
+        custom = cls._custom_templates
+        combined = cls._combined
+        if combined is None or combined[0] is not custom or combined[1] != len(custom):
+            combined = cls._combined = (custom, len(custom), {**SYSTEM_PROMPT_TEMPLATES, **custom})
+        return combined[2]
 
     @classmethod
     def get(cls, name: str) -> dict[str, Any] | None:
@@ -336,15 +399,8 @@ class TemplateRegistry:
         Returns:
             Template dictionary or None if not found
         """
-        # Check custom templates first
-        if name in cls._custom_templates:
-            return _deep_copy_dict(cls._custom_templates[name])
-
-        # Check built-in templates
-        if name in SYSTEM_PROMPT_TEMPLATES:
-            return _deep_copy_dict(SYSTEM_PROMPT_TEMPLATES[name])
-
-        return None
+        template = cls._get_shared(name)
+        return _deep_copy_dict(template) if template is not None else None
 
     @classmethod
     def list_templates(cls) -> list[str]:
@@ -366,10 +422,35 @@ class TemplateRegistry:
         """
         if name in cls._custom_templates:
             del cls._custom_templates[name]
+            cls._combined = None
             return True
         return False
 
 
+# XML escapes, in application order ("&" first so escapes aren't re-escaped)
+_XML_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&apos;"),
+)
+
+
+def _escape_xml(text: str) -> str:
+    """
+    Escape special XML characters.
+
+    Most leaf values contain none of them, so each character is only replaced
+    when present; containment checks are much cheaper than rebuilding the string
+    (and str.translate with a multi-character table is slower than either).
+    """
+    for char, escape in _XML_ESCAPES:
+        if char in text:
+            text = text.replace(char, escape)
+    return text
+
+
 def _deep_copy_dict(d: dict[str, Any]) -> dict[str, Any]:
     """Deep copy a dictionary."""
     result = {}
@@ -377,29 +458,108 @@ def _deep_copy_dict(d: dict[str, Any]) -> dict[str, Any]:
         if isinstance(value, dict):
             result[key] = _deep_copy_dict(value)
         elif isinstance(value, list):
-            result[key] = [_deep_copy_dict(item) if isinstance(item, dict) else item for item in value]
+            # Lists of plain values (most template lists) need only a C-level copy;
+            # the type scan runs in C too, unlike a per-item isinstance comprehension
+            if dict in map(type, value):
+                result[key] = [
+                    _deep_copy_dict(item) if isinstance(item, dict) else item for item in value
+                ]
+            else:
+                result[key] = value.copy()
         else:
             result[key] = value
     return result
 
 
+def _intern_keys(d: dict[str, Any]) -> dict[str, Any]:
+    """
+    Deep copy a dictionary, interning its (string) keys.
+
+    Keys of runtime-built templates (e.g. loaded from JSON) are not interned by
+    the compiler; interned keys make merge and format lookups pointer compares.
+    """
+    result = {}
+    for key, value in d.items():
+        if isinstance(key, str):
+            key = sys.intern(key)
+        if isinstance(value, dict):
+            value = _intern_keys(value)
+        elif isinstance(value, list):
+            value = [_intern_keys(item) if isinstance(item, dict) else item for item in value]
+        result[key] = value
+    return result
+
+
+def _needs_interpolation(value: Any) -> bool:
+    """Check whether interpolating a value could change it."""
+    if isinstance(value, str):
+        return "{meta." in value
+    if isinstance(value, dict):
+        return any(_needs_interpolation(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_needs_interpolation(item) for item in value)
+    # Pydantic models are dumped to dicts by interpolation
+    return getattr(type(value), "model_dump", None) is not None
+
+
 def _deep_merge_dicts(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """
-    Deep merge two dictionaries.
+    Deep merge two dictionaries (copy-on-write).
 
-    Override values take precedence. Nested dicts are merged recursively.
+    Override values take precedence. Nested dicts are merged recursively. Only
+    the dicts along merged paths are new; every other subtree is shared with
+    base or override, so the result must be treated as read-only.
     """
-    result = _deep_copy_dict(base)
+    if not override:
+        return base
+    result = {**base, **override}
+    if override.keys().isdisjoint(base):
+        return result
 
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge_dicts(result[key], value)
-        else:
-            result[key] = value
+        if isinstance(value, dict):
+            base_value = base.get(key)
+            if isinstance(base_value, dict):
+                result[key] = _deep_merge_dicts(base_value, value)
 
     return result
 
 
+@functools.lru_cache(maxsize=512)
+def _get_singular(plural: str) -> str:
+    """Get a singular form of a plural word (simple heuristic, memoized per key)."""
+    if plural.endswith("ies"):
+        return plural[:-3] + "y"
+    elif plural.endswith("s"):
+        return plural[:-1]
+    return plural + "_item"
+
+
+# Pattern for matching {meta.field} variables
+_META_PATTERN = re.compile(r'\{meta\.([a-zA-Z_][a-zA-Z0-9_.]*)\}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_interpolation(text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Split a string into literal chunks and {meta.field} names (memoized per string).
+
+    Only call it for strings containing "{meta." so plain text is not retained.
+
+    Returns:
+        (literals, fields) where literals has one more item than fields
+    """
+    parts = _META_PATTERN.split(text)
+    # Field names are interned so MetaData.get_field resolver lookups compare by identity
+    return tuple(parts[::2]), tuple(sys.intern(name) for name in parts[1::2])
+
+
+@functools.lru_cache(maxsize=256)
+def _is_volatile_field(meta_cls: type, name: str) -> bool:
+    """Whether a meta field is a property of the (possibly subclassed) MetaData class."""
+    return isinstance(getattr(meta_cls, name, None), property)
+
+
 class DictToXMLFormatter(IFormatter):
     """
     Formats a dictionary into XML-like structured text.
@@ -408,6 +568,8 @@ class DictToXMLFormatter(IFormatter):
     XML-style format for system prompts.
     """
 
+    __slots__ = ("indent", "_prefix_cache", "_tag_cache", "_item_tag_cache")
+
     def __init__(self, indent: str = "  "):
         """
         Initialize the formatter.
@@ -416,6 +578,38 @@ class DictToXMLFormatter(IFormatter):
             indent: String to use for indentation
         """
         self.indent = indent
+        # Indentation strings by nesting level, extended on demand
+        self._prefix_cache: list[str] = [""]
+        # (level, key) -> (open line, close line, leaf close tag), compiled once per key
+        self._tag_cache: dict[tuple[int, str], tuple[str, str, str]] = {}
+        # (level, list key) -> tags of the list's items (singular of the key)
+        self._item_tag_cache: dict[tuple[int, str], tuple[str, str, str]] = {}
+
+    def _get_prefix(self, level: int) -> str:
+        """Get the indentation prefix for a nesting level."""
+        cache = self._prefix_cache
+        while len(cache) <= level:
+            cache.append(cache[-1] + self.indent)
+        return cache[level]
+
+    def _get_tags(self, level: int, key: str) -> tuple[str, str, str]:
+        """Get the indented open/close tags of a key at a nesting level."""
+        tags = self._tag_cache.get((level, key))
+        if tags is None:
+            prefix = self._get_prefix(level)
+            tags = self._tag_cache[(level, key)] = (
+                f"{prefix}<{key}>", f"{prefix}</{key}>", f"</{key}>"
+            )
+        return tags
+
+    def _get_item_tags(self, level: int, parent_key: str) -> tuple[str, str, str]:
+        """Get the tags of the items of a list stored under parent_key."""
+        tags = self._item_tag_cache.get((level, parent_key))
+        if tags is None:
+            tags = self._item_tag_cache[(level, parent_key)] = self._get_tags(
+                level, self._get_singular(parent_key)
+            )
+        return tags
 
     def format(self, context: dict[str, Any]) -> str:
         """
@@ -427,59 +621,73 @@ class DictToXMLFormatter(IFormatter):
         Returns:
             str: XML-formatted string representation
         """
-        return self._format_dict(context, level=0)
+        lines: list[str] = []
+        self._format_dict(context, 0, lines)
+        return "\n".join(lines)
 
-    def _format_dict(self, data: dict[str, Any], level: int) -> str:
-        """Recursively format a dictionary."""
-        lines = []
-        prefix = self.indent * level
+    def _format_dict(self, data: dict[str, Any], level: int, lines: list[str]) -> None:
+        """Recursively append a dictionary to the output, one line per element."""
+        append = lines.append
+        get_tags = self._get_tags
 
         for key, value in data.items():
+            open_tag, close_tag, leaf_close = get_tags(level, key)
             if isinstance(value, dict):
-                lines.append(f"{prefix}<{key}>")
-                lines.append(self._format_dict(value, level + 1))
-                lines.append(f"{prefix}</{key}>")
+                append(open_tag)
+                start = len(lines)
+                self._format_dict(value, level + 1, lines)
+                if len(lines) == start:
+                    append("")  # An empty container still gets its own line
+                append(close_tag)
             elif isinstance(value, list):
-                lines.append(f"{prefix}<{key}>")
-                lines.append(self._format_list(value, level + 1, key))
-                lines.append(f"{prefix}</{key}>")
+                append(open_tag)
+                start = len(lines)
+                self._format_list(value, level + 1, lines, key)
+                if len(lines) == start:
+                    append("")
+                append(close_tag)
             else:
-                lines.append(f"{prefix}<{key}>{self._escape_xml(str(value))}</{key}>")
+                append(open_tag + self._escape_xml(str(value)) + leaf_close)
 
-        return "\n".join(lines)
-
-    def _format_list(self, data: list[Any], level: int, parent_key: str) -> str:
-        """Format a list of items."""
-        lines = []
-        prefix = self.indent * level
-        item_tag = self._get_singular(parent_key)
+    def _format_list(
+        self,
+        data: list[Any],
+        level: int,
+        lines: list[str],
+        parent_key: str
+    ) -> None:
+        """Append a list of items to the output."""
+        append = lines.append
+        open_tag, close_tag, leaf_close = self._get_item_tags(level, parent_key)
 
         for item in data:
             if isinstance(item, dict):
-                lines.append(f"{prefix}<{item_tag}>")
-                lines.append(self._format_dict(item, level + 1))
-                lines.append(f"{prefix}</{item_tag}>")
+                append(open_tag)
+                start = len(lines)
+                self._format_dict(item, level + 1, lines)
+                if len(lines) == start:
+                    append("")
+                append(close_tag)
             else:
-                lines.append(f"{prefix}<{item_tag}>{self._escape_xml(str(item))}</{item_tag}>")
-
-        return "\n".join(lines)
+                append(open_tag + self._escape_xml(str(item)) + leaf_close)
 
     def _get_singular(self, plural: str) -> str:
         """Get a singular form of a plural word (simple heuristic)."""
-        if plural.endswith("ies"):
-            return plural[:-3] + "y"
-        elif plural.endswith("s"):
-            return plural[:-1]
-        return plural + "_item"
+        return _get_singular(plural)
 
     def _escape_xml(self, text: str) -> str:
         """Escape special XML characters."""
-        return (text
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;")
-                .replace("'", "&apos;"))
+        return _escape_xml(text)
+
+
+# Markdown header markers by nesting level (capped at h6)
+_MD_HEADER_PREFIXES = tuple("#" * level for level in range(7))
+
+
+@functools.lru_cache(maxsize=1024)
+def _md_title(key: str) -> str:
+    """Get the display title of a key, e.g. "agent_name" -> "Agent Name" (memoized)."""
+    return key.replace('_', ' ').title()
 
 
 class MarkdownFormatter(IFormatter):
@@ -489,6 +697,8 @@ class MarkdownFormatter(IFormatter):
     Alternative formatter for agents that prefer Markdown prompts.
     """
 
+    __slots__ = ()
+
     def format(self, context: dict[str, Any]) -> str:
         """
         Format a context dictionary into Markdown string.
@@ -499,37 +709,56 @@ class MarkdownFormatter(IFormatter):
         Returns:
             str: Markdown-formatted string representation
         """
-        return self._format_dict(context, level=1)
+        parts: list[str] = []
+        self._format_dict(context, 1, parts)
+        # Every element is appended with a trailing newline; drop the last one
+        return "".join(parts)[:-1]
 
-    def _format_dict(self, data: dict[str, Any], level: int) -> str:
-        """Recursively format a dictionary."""
-        lines = []
-        header_prefix = "#" * min(level, 6)
+    def _format_dict(self, data: dict[str, Any], level: int, parts: list[str]) -> None:
+        """Recursively append a dictionary to the output."""
+        append = parts.append
+        header_prefix = _MD_HEADER_PREFIXES[min(level, 6)]
 
         for key, value in data.items():
             if isinstance(value, dict):
-                lines.append(f"\n{header_prefix} {key.replace('_', ' ').title()}\n")
-                lines.append(self._format_dict(value, level + 1))
+                append(f"\n{header_prefix} {_md_title(key)}\n\n")
+                start = len(parts)
+                self._format_dict(value, level + 1, parts)
+                if len(parts) == start:
+                    append("\n")  # An empty container still gets its own line
             elif isinstance(value, list):
-                lines.append(f"\n{header_prefix} {key.replace('_', ' ').title()}\n")
-                lines.append(self._format_list(value, level + 1))
+                append(f"\n{header_prefix} {_md_title(key)}\n\n")
+                start = len(parts)
+                self._format_list(value, level + 1, parts)
+                if len(parts) == start:
+                    append("\n")
             else:
-                lines.append(f"**{key.replace('_', ' ').title()}:** {value}")
-
-        return "\n".join(lines)
+                append(f"**{_md_title(key)}:** {value}\n")
 
-    def _format_list(self, data: list[Any], level: int) -> str:
-        """Format a list of items."""
-        lines = []
+    def _format_list(self, data: list[Any], level: int, parts: list[str]) -> None:
+        """Append a list of items to the output."""
+        append = parts.append
 
         for item in data:
             if isinstance(item, dict):
                 for key, value in item.items():
-                    lines.append(f"- **{key}:** {value}")
+                    append(f"- **{key}:** {value}\n")
             else:
-                lines.append(f"- {item}")
+                append(f"- {item}\n")
 
-        return "\n".join(lines)
+
+def _construct_protocol(data: dict[str, Any]) -> Protocol:
+    """
+    Rebuild a Protocol from its model_dump() without re-validating it.
+
+    Mutable fields are copied so the protocol does not share state with
+    the dump it came from.
+    """
+    steps = [
+        ProtocolStep.model_construct(**{**step, "instructions": list(step["instructions"])})
+        for step in data["steps"]
+    ]
+    return Protocol.model_construct(**{**data, "steps": steps})
 
 
 class ContextManager:
@@ -579,7 +808,21 @@ class ContextManager:
     base_formatter = DictToXMLFormatter()
 
     # Pattern for matching {meta.field} variables
-    _META_PATTERN = re.compile(r'\{meta\.([a-zA-Z_][a-zA-Z0-9_.]*)\}')
+    _META_PATTERN = _META_PATTERN
+
+    __slots__ = (
+        "context",
+        "protocols",
+        "formatter",
+        "meta",
+        "_template",
+        "_version",
+        "_full_cache",
+        "_message_cache",
+        "_volatile_fields",
+        "_static_keys",
+        "_protocol_index",
+    )
 
     def __init__(
         self,
@@ -611,12 +854,25 @@ class ContextManager:
         self.formatter = formatter or self.base_formatter
         self.meta = meta or MetaData()
 
+        # Bumped by every mutator; part of the full-context cache key
+        self._version = 0
+        # Cached full context: (key, volatile meta fields, their values, context)
+        self._full_cache: tuple[tuple, tuple[str, ...], tuple, dict[str, Any]] | None = None
+        # Cached system message: (full context object, formatter, text)
+        self._message_cache: tuple[dict[str, Any], IFormatter, str] | None = None
+        # Volatile MetaData properties (e.g. current_datetime) seen while interpolating
+        self._volatile_fields: set[str] = set()
+        # (template, its top-level keys whose values need no interpolation)
+        self._static_keys: tuple[dict[str, Any], frozenset[str]] | None = None
+        # (registered protocols, their (lowercased name, protocol) pairs) for search
+        self._protocol_index: tuple[tuple[Protocol, ...], tuple[tuple[str, Protocol], ...]] | None = None
+
         # Set up template (dictionary-based)
         if template is None:
             self._template: dict[str, Any] = {}
         elif isinstance(template, str):
-            # Load from registry
-            loaded = TemplateRegistry.get(template)
+            # Load from registry (shared, read-only: never mutated in place)
+            loaded = TemplateRegistry._get_shared(template)
             self._template = loaded if loaded else {}
         elif isinstance(template, dict):
             # Direct dictionary template
@@ -781,12 +1037,13 @@ class ContextManager:
             template: Template name (string) or template dictionary
         """
         if isinstance(template, str):
-            loaded = TemplateRegistry.get(template)
+            loaded = TemplateRegistry._get_shared(template)
             self._template = loaded if loaded else {}
         elif isinstance(template, dict):
             self._template = _deep_copy_dict(template)
         else:
             self._template = {}
+        self._version += 1
 
     def get_template(self) -> dict[str, Any]:
         """Get a copy of the current template dictionary."""
@@ -806,12 +1063,24 @@ class ContextManager:
         Returns:
             String with placeholders replaced by actual values
         """
-        def replace_match(match: re.Match) -> str:
-            field_name = match.group(1)
-            value = self.meta.get_field(field_name)
-            return str(value) if value is not None else match.group(0)
-
-        return self._META_PATTERN.sub(replace_match, text)
+        if "{meta." not in text:
+            return text
+        literals, fields = _compile_interpolation(text)
+        if not fields:
+            return text
+
+        meta = self.meta
+        meta_cls = type(meta)
+        get_field = meta.get_field
+        parts = [literals[0]]
+        for field_name, literal in zip(fields, literals[1:], strict=True):
+            # Properties (on MetaData or a subclass) are recomputed on every read
+            if _is_volatile_field(meta_cls, field_name):
+                self._volatile_fields.add(field_name)
+            value = get_field(field_name)
+            parts.append(str(value) if value is not None else f"{{meta.{field_name}}}")
+            parts.append(literal)
+        return "".join(parts)
 
     def _interpolate_value(self, value: Any) -> Any:
         """
@@ -833,8 +1102,9 @@ class ContextManager:
             return {k: self._interpolate_value(v) for k, v in value.items()}
         elif isinstance(value, list):
             return [self._interpolate_value(item) for item in value]
-        elif hasattr(value, 'model_dump'):
-            # Pydantic models - dump to dict and interpolate
+        elif getattr(type(value), 'model_dump', None) is not None:
+            # Pydantic models - dump to dict and interpolate (looked up on the
+            # type: no AttributeError raised for the common plain-value case)
             return self._interpolate_value(value.model_dump())
         else:
             # Any other type - keep as is (will be str() when formatted)
@@ -875,7 +1145,8 @@ class ContextManager:
             # f-strings work naturally
             context.add("info", f"Generated at {time.time()}")
         """
-        self.context[key] = value
+        self.context[sys.intern(key)] = value
+        self._version += 1
 
     def get(self, key: str) -> Any | None:
         """
@@ -901,6 +1172,7 @@ class ContextManager:
         """
         if key in self.context:
             del self.context[key]
+            self._version += 1
             return True
         return False
 
@@ -912,10 +1184,12 @@ class ContextManager:
             updates: Dictionary of updates to apply
         """
         self.context.update(updates)
+        self._version += 1
 
     def clear(self) -> None:
         """Clear all dynamic context entries (but not template or protocols)."""
         self.context.clear()
+        self._version += 1
 
     def keys(self) -> list[str]:
         """Get all dynamic context keys."""
@@ -933,6 +1207,7 @@ class ContextManager:
             protocol: Protocol object to register
         """
         self.protocols[protocol.protocol_name] = protocol
+        self._version += 1
 
     def get_protocol(self, protocol_name: str) -> Protocol | None:
         """
@@ -956,11 +1231,28 @@ class ContextManager:
         Returns:
             List of matching Protocol objects
         """
-        query_lower = query.lower()
-        return [
-            ptc for ptc in self.protocols.values()
-            if query_lower in ptc.protocol_name.lower()
-        ]
+        folded = query.casefold()
+        return [ptc for name, ptc in self._get_protocol_index() if folded in name]
+
+    def _get_protocol_index(self) -> tuple[tuple[str, Protocol], ...]:
+        """
+        Get (casefolded name, protocol) pairs, rebuilt when the registered protocols change.
+
+        Renaming a registered protocol in place is not tracked (it also leaves its
+        registration key stale); re-register it with remove_protocol/add_protocol.
+        """
+        protocols = tuple(self.protocols.values())
+        cached = self._protocol_index
+        # Compare by identity: an equal but distinct Protocol (e.g. restored
+        # from a snapshot) must replace the cached one
+        if (
+            cached is None
+            or len(cached[0]) != len(protocols)
+            or not all(map(operator.is_, cached[0], protocols))
+        ):
+            index = tuple((ptc.protocol_name.casefold(), ptc) for ptc in protocols)
+            cached = self._protocol_index = (protocols, index)
+        return cached[1]
 
     def remove_protocol(self, protocol_name: str) -> bool:
         """
@@ -974,6 +1266,7 @@ class ContextManager:
         """
         if protocol_name in self.protocols:
             del self.protocols[protocol_name]
+            self._version += 1
             return True
         return False
 
@@ -985,35 +1278,94 @@ class ContextManager:
     # FORMATTING OPERATIONS
     # ==========================================================================
 
+    def invalidate(self) -> None:
+        """
+        Drop cached context and system messages.
+
+        Only needed after mutating stored values in place (e.g. appending to a
+        list previously passed to add()); add/remove/update/clear and protocol
+        operations invalidate automatically.
+        """
+        self._version += 1
+
+    def _cache_key(self) -> tuple:
+        """Fingerprint of everything the full context is built from."""
+        return (
+            self._version,
+            id(self._template),
+            id(self.context),
+            len(self.context),
+            # Exactly what _protocols_summary() renders; summary() returns the
+            # same dict until the protocol changes, so this compares by identity
+            tuple((name, p.summary()) for name, p in self.protocols.items()),
+            id(self.meta),
+            self.meta._version,
+            # custom is commonly mutated in place (meta.custom[key] = value)
+            repr(self.meta.custom) if self.meta.custom else None,
+        )
+
     def _build_full_context(self) -> dict[str, Any]:
         """
-        Build the complete context by merging template + dynamic context + protocols.
+        Get the complete context, rebuilding it only when its inputs changed.
+
+        The result is shared between calls and must not be mutated.
 
         Returns:
             Complete merged context dictionary with interpolated values
         """
-        # Start with template as base
-        full_context = _deep_copy_dict(self._template) if self._template else {}
+        key = self._cache_key()
+        cached = self._full_cache
+        if (cached is not None and cached[0] == key
+                and cached[2] == tuple(self.meta.get_field(f) for f in cached[1])):
+            return cached[3]
+
+        self._volatile_fields = set()
+        full_context = self._assemble_full_context()
+        volatile = tuple(sorted(self._volatile_fields))
+        values = tuple(self.meta.get_field(f) for f in volatile)
+        self._full_cache = (key, volatile, values, full_context)
+        return full_context
+
+    def _assemble_full_context(self) -> dict[str, Any]:
+        """
+        Build the complete context by merging template + dynamic context + protocols.
 
-        # Deep merge dynamic context (overrides template)
-        if self.context:
-            full_context = _deep_merge_dicts(full_context, self.context)
+        Returns:
+            Complete merged context dictionary with interpolated values
+        """
+        # Template as base, deep merged with dynamic context (overrides template)
+        context = self.context
+        merged = _deep_merge_dicts(self._template, context) if context else self._template
+
+        # Interpolate all meta variables; static template sections (no placeholders,
+        # not overridden) are shared as is - the result is treated as read-only
+        static = self._get_static_keys()
+        interpolate = self._interpolate_value
+        full_context = {
+            key: value if key in static and key not in context else interpolate(value)
+            for key, value in merged.items()
+        }
 
         # Add active protocols
         if self.protocols:
-            protocols_data = {}
-            for name, protocol in self.protocols.items():
-                current_step = protocol.get_current_step()
-                protocols_data[name] = {
-                    "description": protocol.description,
-                    "current_step": current_step.name if current_step else "completed",
-                    "progress": f"{protocol.current_step_index + 1}/{len(protocol.steps)}",
-                    "current_instructions": current_step.instructions if current_step else []
-                }
-            full_context["active_protocols"] = protocols_data
+            full_context["active_protocols"] = interpolate(self._protocols_summary())
 
-        # Interpolate all meta variables
-        return self._interpolate_value(full_context)
+        return full_context
+
+    def _get_static_keys(self) -> frozenset[str]:
+        """Get the top-level template keys whose sections need no interpolation."""
+        cached = self._static_keys
+        if cached is None or cached[0] is not self._template:
+            template = self._template
+            static = frozenset(
+                key for key, value in template.items() if not _needs_interpolation(value)
+            )
+            cached = self._static_keys = (template, static)
+        return cached[1]
+
+    def _protocols_summary(self) -> dict[str, dict[str, Any]]:
+        """Summarize the current step and progress of each registered protocol."""
+        return {name: protocol.summary() for name, protocol in self.protocols.items()}
 
     def populate_system_message(self, formatter: IFormatter | None = None) -> str:
         """
@@ -1034,7 +1386,17 @@ class ContextManager:
         """
         fmt = formatter or self.formatter
         full_context = self._build_full_context()
-        return fmt.format(full_context) if full_context else ""
+        if not full_context:
+            return ""
+
+        # Same context object and formatter: the rendered text is unchanged
+        cached = self._message_cache
+        if cached is not None and cached[0] is full_context and cached[1] is fmt:
+            return cached[2]
+
+        message = fmt.format(full_context)
+        self._message_cache = (full_context, fmt, message)
+        return message
 
     def get_raw_context(self) -> dict[str, Any]:
         """
@@ -1046,7 +1408,7 @@ class ContextManager:
         Returns:
             Dict[str, Any]: Complete context dictionary
         """
-        return self._build_full_context()
+        return _deep_copy_dict(self._build_full_context())
 
     def set_formatter(self, formatter: IFormatter) -> None:
         """
@@ -1065,34 +1427,50 @@ class ContextManager:
         """
         Get a snapshot of the current context state.
 
+        Template and context are deep-copied (nested dicts and lists). Protocol
+        entries are the protocols' cached dumps, reused while a protocol is
+        unchanged; treat them as read-only.
+
         Returns:
             Dictionary containing template, context, protocols, and meta
         """
         return {
             "template": _deep_copy_dict(self._template),
-            "context": dict(self.context),
+            "context": _deep_copy_dict(self.context),
             "protocols": {
-                name: protocol.model_dump()
+                name: protocol.cached_dump
                 for name, protocol in self.protocols.items()
             },
             "meta": self.meta.model_dump()
         }
 
-    def restore_snapshot(self, snapshot: dict[str, Any]) -> None:
+    def restore_snapshot(self, snapshot: dict[str, Any], strict: bool = False) -> None:
         """
         Restore context from a snapshot.
 
+        Snapshots from get_snapshot() are trusted and rebuilt without
+        Pydantic validation; pass strict=True for snapshots from elsewhere.
+
         Args:
             snapshot: Previously captured snapshot dictionary
+            strict: Validate protocols and meta while restoring
         """
         if "template" in snapshot:
             self._template = _deep_copy_dict(snapshot["template"])
 
-        self.context = dict(snapshot.get("context", {}))
+        self.context = _deep_copy_dict(snapshot.get("context", {}))
 
-        self.protocols = {}
-        for name, protocol_data in snapshot.get("protocols", {}).items():
-            self.protocols[name] = Protocol(**protocol_data)
+        build_protocol = Protocol.model_validate if strict else _construct_protocol
+        self.protocols = {
+            name: build_protocol(protocol_data)
+            for name, protocol_data in snapshot.get("protocols", {}).items()
+        }
 
         if "meta" in snapshot:
-            self.meta = MetaData(**snapshot["meta"])
+            meta = snapshot["meta"]
+            if strict:
+                self.meta = MetaData.model_validate(meta)
+            else:
+                self.meta = MetaData.model_construct(**{**meta, "custom": dict(meta.get("custom", {}))})
+
+        self._version += 1
@@ -3,53 +3,111 @@ LifeCycle Manager for the Agent Framework.
 """
 
 import time
-from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from ..interfaces.base import ILifeCycle
 
+# Seconds a resource usage reading is reused before psutil is queried again
+_RESOURCE_USAGE_TTL = 0.25
+
+# psutil module, imported on first use (False when unavailable)
+_psutil: Any = None
+
+
+def _load_psutil() -> Any | None:
+    """Import psutil on first use; None when it is not installed."""
+    global _psutil
+    if _psutil is None:
+        try:
+            import psutil
+            _psutil = psutil
+        except ImportError:
+            _psutil = False
+    return _psutil or None
+
 
 class LifeCycleManager(ILifeCycle):
     """Manages token counting, rate limits, and resource usage."""
 
+    __slots__ = (
+        "_token_usage",
+        "_token_usage_view",
+        "_limits",
+        "_rate_tokens",
+        "_rate_refilled_at",
+        "_errors",
+        "_process",
+        "_usage_cache",
+    )
+
     def __init__(self):
         self._token_usage = {"input": 0, "output": 0, "total": 0}
-        self._request_history: deque = deque(maxlen=1000)
+        # Read-only live view handed out by get_token_usage()
+        self._token_usage_view = MappingProxyType(self._token_usage)
         self._limits = {
             "max_tokens_per_request": 4096,
             "max_total_tokens": 100000,
             "requests_per_minute": 60,
             "max_memory_mb": 1024
         }
+        # Rate limit token bucket: holds up to requests_per_minute tokens and
+        # refills at requests_per_minute / 60 tokens per second
+        self._rate_tokens: float = float(self._limits["requests_per_minute"])
+        self._rate_refilled_at: float = time.monotonic()
         self._errors: list = []
+        # psutil.Process of this process (created on first reading), and the
+        # last reading as (monotonic timestamp, usage)
+        self._process: Any = None
+        self._usage_cache: tuple[float, dict[str, Any]] | None = None
 
     def count_tokens(self, text: str) -> int:
         # Simple estimation: ~4 chars per token
         return len(text) // 4
 
-    def get_token_usage(self) -> dict[str, int]:
-        return dict(self._token_usage)
+    def get_token_usage(self) -> Mapping[str, int]:
+        return self._token_usage_view
+
+    def _refill_rate_tokens(self) -> float:
+        """Add the tokens earned since the last refill and return the current count."""
+        now = time.monotonic()
+        capacity = self._limits["requests_per_minute"]
+        tokens = min(capacity, self._rate_tokens + (now - self._rate_refilled_at) * capacity / 60.0)
+        self._rate_tokens = tokens
+        self._rate_refilled_at = now
+        return tokens
 
     def check_rate_limit(self) -> bool:
-        now = time.time()
-        minute_ago = now - 60
-        recent = sum(1 for t, _ in self._request_history if t > minute_ago)
-        return recent < self._limits["requests_per_minute"]
+        return self._refill_rate_tokens() >= 1.0
 
     def record_request(self, tokens_used: int) -> None:
         self._token_usage["total"] += tokens_used
-        self._request_history.append((time.time(), tokens_used))
+        self._rate_tokens = max(0.0, self._refill_rate_tokens() - 1.0)
 
     def get_resource_usage(self) -> dict[str, Any]:
-        try:
-            import psutil
-            process = psutil.Process()
-            return {
+        return dict(self._read_resource_usage())
+
+    def _read_resource_usage(self) -> dict[str, Any]:
+        """Get the current usage, reusing a reading younger than _RESOURCE_USAGE_TTL."""
+        now = time.monotonic()
+        cached = self._usage_cache
+        if cached is not None and now - cached[0] < _RESOURCE_USAGE_TTL:
+            return cached[1]
+
+        psutil = _load_psutil()
+        if psutil is None:
+            usage = {"memory_mb": 0, "cpu_percent": 0}
+        else:
+            process = self._process
+            if process is None:
+                process = self._process = psutil.Process()
+            usage = {
                 "memory_mb": process.memory_info().rss / (1024 * 1024),
                 "cpu_percent": process.cpu_percent()
             }
-        except ImportError:
-            return {"memory_mb": 0, "cpu_percent": 0}
+        self._usage_cache = (now, usage)
+        return usage
 
     def set_limits(self, **limits) -> None:
         self._limits.update(limits)
@@ -58,7 +116,7 @@ class LifeCycleManager(ILifeCycle):
         return {
             "tokens_ok": self._token_usage["total"] < self._limits["max_total_tokens"],
             "rate_ok": self.check_rate_limit(),
-            "memory_ok": self.get_resource_usage().get("memory_mb", 0) < self._limits["max_memory_mb"]
+            "memory_ok": self._read_resource_usage()["memory_mb"] < self._limits["max_memory_mb"]
         }
 
     def handle_api_error(self, error: Exception) -> bool:
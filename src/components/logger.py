@@ -2,82 +2,166 @@
 Logger Component for the Agent Framework.
 """
 
+import threading
+import time
 from datetime import datetime
-from typing import Any
+from typing import IO, Any
 
 from ..interfaces.base import ILogger, LogLevel
 
+# Severity rank of each level; gating is a single int comparison
+_LEVEL_RANK = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+    LogLevel.CRITICAL: 4,
+}
+_DEBUG = _LEVEL_RANK[LogLevel.DEBUG]
+_INFO = _LEVEL_RANK[LogLevel.INFO]
+_WARNING = _LEVEL_RANK[LogLevel.WARNING]
+_ERROR = _LEVEL_RANK[LogLevel.ERROR]
+_CRITICAL = _LEVEL_RANK[LogLevel.CRITICAL]
+
+
+# (wall-clock second, "%H:%M:%S" string) of the last console timestamp
+_clock_cache: tuple[int, str] = (-1, "")
+
+
+def _clock() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    global _clock_cache
+    second = int(time.time())
+    if _clock_cache[0] != second:
+        _clock_cache = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return _clock_cache[1]
+
+
+def _render(message: str, args: tuple) -> str:
+    """Apply printf-style arguments lazily (only for emitted messages)."""
+    return message % args if args else message
+
 
 class ConsoleLogger(ILogger):
     """Logger that outputs to console with rich formatting."""
 
+    __slots__ = ("name", "_min_level", "_min_rank")
+
     def __init__(self, name: str = "Agent", min_level: LogLevel = LogLevel.DEBUG):
         self.name = name
         self.min_level = min_level
-        self._levels_order = [LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR, LogLevel.CRITICAL]
+
+    @property
+    def min_level(self) -> LogLevel:
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, level: LogLevel) -> None:
+        self._min_level = level
+        self._min_rank = _LEVEL_RANK[level]
 
     def _should_log(self, level: LogLevel) -> bool:
-        return self._levels_order.index(level) >= self._levels_order.index(self.min_level)
+        return _LEVEL_RANK[level] >= self._min_rank
 
-    def _format_message(self, level: str, message: str) -> str:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        return f"[{timestamp}] [{self.name}] [{level}] {message}"
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return self._should_log(level)
 
-    def debug(self, message: str, **kwargs) -> None:
-        if self._should_log(LogLevel.DEBUG):
-            print(self._format_message("DEBUG", message))
+    def _format_message(self, level: str, message: str, args: tuple = ()) -> str:
+        return f"[{_clock()}] [{self.name}] [{level}] {_render(message, args)}"
 
-    def info(self, message: str, **kwargs) -> None:
-        if self._should_log(LogLevel.INFO):
-            print(self._format_message("INFO", message))
+    def debug(self, message: str, *args, **kwargs) -> None:
+        if self._min_rank <= _DEBUG:
+            print(self._format_message("DEBUG", message, args))
 
-    def warning(self, message: str, **kwargs) -> None:
-        if self._should_log(LogLevel.WARNING):
-            print(self._format_message("WARNING", message))
+    def info(self, message: str, *args, **kwargs) -> None:
+        if self._min_rank <= _INFO:
+            print(self._format_message("INFO", message, args))
 
-    def error(self, message: str, **kwargs) -> None:
-        if self._should_log(LogLevel.ERROR):
-            print(self._format_message("ERROR", message))
+    def warning(self, message: str, *args, **kwargs) -> None:
+        if self._min_rank <= _WARNING:
+            print(self._format_message("WARNING", message, args))
 
-    def critical(self, message: str, **kwargs) -> None:
-        if self._should_log(LogLevel.CRITICAL):
-            print(self._format_message("CRITICAL", message))
+    def error(self, message: str, *args, **kwargs) -> None:
+        if self._min_rank <= _ERROR:
+            print(self._format_message("ERROR", message, args))
+
+    def critical(self, message: str, *args, **kwargs) -> None:
+        if self._min_rank <= _CRITICAL:
+            print(self._format_message("CRITICAL", message, args))
 
     def log_thinking(self, thought: str, **kwargs) -> None:
-        if self._should_log(LogLevel.DEBUG):
+        if self._min_rank <= _DEBUG:
             print(f"[💭 THINKING] {thought[:200]}...")
 
     def log_tool_call(self, tool_name: str, args: dict, result: Any, **kwargs) -> None:
-        if self._should_log(LogLevel.INFO):
+        if self._min_rank <= _INFO:
             print(f"[🔧 TOOL] {tool_name} | Args: {args} | Result: {str(result)[:100]}")
 
 
 class FileLogger(ILogger):
-    """Logger that writes to a file."""
+    """
+    Logger that writes to a file.
+
+    The file is kept open with a write buffer; lines reach the disk when the
+    buffer fills, on ERROR/CRITICAL messages, or on flush()/close().
+    """
+
+    # Bytes buffered before the file object writes through to the OS
+    BUFFER_SIZE = 1 << 16
+
+    __slots__ = ("filepath", "name", "_file", "_lock")
 
     def __init__(self, filepath: str, name: str = "Agent"):
         self.filepath = filepath
         self.name = name
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
 
-    def _write(self, level: str, message: str) -> None:
+    def _write(self, level: str, message: str, flush: bool = False) -> None:
         timestamp = datetime.now().isoformat()
-        with open(self.filepath, 'a', encoding='utf-8') as f:
-            f.write(f"{timestamp} | {level} | {self.name} | {message}\n")
-
-    def debug(self, message: str, **kwargs) -> None:
-        self._write("DEBUG", message)
-
-    def info(self, message: str, **kwargs) -> None:
-        self._write("INFO", message)
-
-    def warning(self, message: str, **kwargs) -> None:
-        self._write("WARNING", message)
-
-    def error(self, message: str, **kwargs) -> None:
-        self._write("ERROR", message)
-
-    def critical(self, message: str, **kwargs) -> None:
-        self._write("CRITICAL", message)
+        line = f"{timestamp} | {level} | {self.name} | {message}\n"
+        with self._lock:
+            f = self._file
+            if f is None:
+                f = self._file = open(  # noqa: SIM115 - held open until close()
+                    self.filepath, 'a', encoding='utf-8', buffering=self.BUFFER_SIZE
+                )
+            f.write(line)
+            if flush:
+                f.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file (it is reopened on the next message)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __del__(self) -> None:
+        f = getattr(self, "_file", None)
+        if f is not None:
+            f.close()
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        self._write("DEBUG", _render(message, args))
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        self._write("INFO", _render(message, args))
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        self._write("WARNING", _render(message, args))
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        self._write("ERROR", _render(message, args), flush=True)
+
+    def critical(self, message: str, *args, **kwargs) -> None:
+        self._write("CRITICAL", _render(message, args), flush=True)
 
     def log_thinking(self, thought: str, **kwargs) -> None:
         self._write("THINKING", thought)
@@ -92,25 +176,28 @@ class CompositeLogger(ILogger):
     def __init__(self, loggers: list[ILogger]):
         self.loggers = loggers
 
-    def debug(self, message: str, **kwargs) -> None:
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return any(logger.is_enabled_for(level) for logger in self.loggers)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
         for logger in self.loggers:
-            logger.debug(message, **kwargs)
+            logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         for logger in self.loggers:
-            logger.info(message, **kwargs)
+            logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         for logger in self.loggers:
-            logger.warning(message, **kwargs)
+            logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         for logger in self.loggers:
-            logger.error(message, **kwargs)
+            logger.error(message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         for logger in self.loggers:
-            logger.critical(message, **kwargs)
+            logger.critical(message, *args, **kwargs)
 
     def log_thinking(self, thought: str, **kwargs) -> None:
         for logger in self.loggers:
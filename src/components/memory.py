@@ -2,65 +2,149 @@
 Memory Manager for the Agent Framework.
 """
 
+import time
+from bisect import bisect_right
 from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from ..interfaces.base import IMemoryManager
 
+# Seconds an ISO timestamp is reused before datetime.now() is formatted again
+_TIMESTAMP_TTL = 1.0
+
+# (monotonic timestamp, ISO string) of the last issued timestamp
+_timestamp_cache: tuple[float, str] = (float("-inf"), "")
+
+
+def _timestamp() -> str:
+    """Current time in ISO format, reused for writes within _TIMESTAMP_TTL."""
+    global _timestamp_cache
+    tick = time.monotonic()
+    if tick - _timestamp_cache[0] >= _TIMESTAMP_TTL:
+        _timestamp_cache = (tick, datetime.now().isoformat())
+    return _timestamp_cache[1]
+
 
 class InMemoryManager(IMemoryManager):
     """In-memory implementation of memory management."""
 
-    # Flag to enable/disable automatic context injection (default: True)
-    inject_context: bool = True
+    __slots__ = (
+        "_short_term",
+        "_long_term",
+        "_long_term_text",
+        "_search_index",
+        "inject_context",
+        "_contribution",
+    )
 
     def __init__(self, short_term_limit: int = 50, inject_context: bool = True):
         self._short_term: deque = deque(maxlen=short_term_limit)
         self._long_term: dict[str, Any] = {}
+        # Casefolded "key\0value" search text of each long-term entry
+        self._long_term_text: dict[str, str] = {}
+        # (joined search texts, start offset of each text, keys in the same
+        # order), rebuilt on the first retrieve after a store
+        self._search_index: tuple[str, list[int], list[str]] | None = None
         self.inject_context = inject_context
+        # Context contribution, rebuilt only after memory changes
+        self._contribution: dict[str, Any] | None = None
 
     def add_message(self, role: str, content: str, metadata: dict | None = None) -> None:
         self._short_term.append({
             "role": role,
             "content": content,
             "metadata": metadata or {},
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _timestamp()
         })
+        self._contribution = None
+
+    def add_messages(self, messages: list[tuple[str, str]]) -> None:
+        timestamp = _timestamp()
+        self._short_term.extend(
+            {"role": role, "content": content, "metadata": {}, "timestamp": timestamp}
+            for role, content in messages
+        )
+        self._contribution = None
 
     def get_recent_messages(self, limit: int = 10) -> list[dict[str, Any]]:
-        return list(self._short_term)[-limit:]
+        short_term = self._short_term
+        if 0 < limit < len(short_term):
+            # Walk back from the newest entry instead of copying the whole deque
+            recent = list(islice(reversed(short_term), limit))
+            recent.reverse()
+            return recent
+        return list(short_term)[-limit:]
 
     def store_long_term(self, key: str, value: Any, metadata: dict | None = None) -> None:
         self._long_term[key] = {
             "value": value,
             "metadata": metadata or {},
-            "stored_at": datetime.now().isoformat()
+            "stored_at": _timestamp()
         }
+        self._long_term_text[key] = f"{key}\0{value}".casefold()
+        self._search_index = None
+        self._contribution = None
 
     def retrieve(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
-        # Simple keyword matching
-        query_lower = query.lower()
+        # Simple case-insensitive keyword matching against the text casefolded at
+        # store time, searched with str.find over all entries joined together
+        if top_k <= 0:
+            return []
+        blob, starts, keys = self._get_search_index()
+        folded = query.casefold()
+        size = len(folded)
+        long_term = self._long_term
         results = []
-        for key, data in self._long_term.items():
-            if query_lower in key.lower() or query_lower in str(data.get("value", "")).lower():
-                results.append({"key": key, **data})
-        return results[:top_k]
+        end = starts[-1]
+        pos = blob.find(folded)
+        while 0 <= pos < end:
+            entry = bisect_right(starts, pos) - 1
+            # Entries are joined with one separator char; a match running into
+            # the next entry is not a match
+            if pos + size < starts[entry + 1]:
+                key = keys[entry]
+                results.append({"key": key, **long_term[key]})
+                if len(results) == top_k:
+                    break
+            pos = blob.find(folded, starts[entry + 1])
+        return results
+
+    def _get_search_index(self) -> tuple[str, list[int], list[str]]:
+        """Get the joined search texts, rebuilding them after stores."""
+        index = self._search_index
+        if index is None:
+            keys = list(self._long_term_text)
+            texts = list(self._long_term_text.values())
+            starts = []
+            offset = 0
+            for text in texts:
+                starts.append(offset)
+                offset += len(text) + 1
+            # Sentinel start one past the end, so entry + 1 is always valid
+            starts.append(offset)
+            index = self._search_index = ("\n".join(texts) + "\n", starts, keys)
+        return index
 
     def clear_short_term(self) -> None:
         self._short_term.clear()
+        self._contribution = None
 
     def get_context_contribution(self) -> dict[str, Any]:
         """
         Get memory context for injection into the agent's system prompt.
         
         Returns:
-            dict with 'memory' key containing recent messages and long-term keys
+            dict with 'memory' key containing recent messages and long-term keys.
+            The same dict is returned until memory changes; treat it as read-only.
         """
-        return {
-            "memory": {
-                "recent_messages": self.get_recent_messages(5),
-                "long_term_keys": list(self._long_term.keys())[:10]
+        if self._contribution is None:
+            self._contribution = {
+                "memory": {
+                    "recent_messages": self.get_recent_messages(5),
+                    "long_term_keys": list(self._long_term.keys())[:10]
+                }
             }
-        }
+        return self._contribution
 
@@ -0,0 +1,149 @@
+"""
+Semantic Response Cache for the Agent Framework.
+
+Stores (embedding, response) pairs and answers lookups whose cosine
+similarity to a cached message exceeds a threshold, so repeated or
+near-duplicate messages can skip the LLM round-trip.
+"""
+
+import math
+import re
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from ..interfaces.base import IResponseCache
+
+# numpy module, imported on first lookup (False when unavailable, in which
+# case similarity falls back to a pure-Python scan)
+_numpy: Any = None
+
+
+def _load_numpy() -> Any | None:
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def hashed_embedding(text: str, dimensions: int = 256) -> list[float]:
+    """
+    Cheap bag-of-words embedding using feature hashing.
+
+    Args:
+        text: Text to embed
+        dimensions: Size of the output vector
+
+    Returns:
+        L2-normalized vector (all zeros for text without words)
+    """
+    vector = [0.0] * dimensions
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        vector[zlib.crc32(token.encode()) % dimensions] += 1.0
+    return _normalize(vector)
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return vector
+    return [v / norm for v in vector]
+
+
+class SemanticResponseCache(IResponseCache):
+    """
+    In-memory response cache with cosine-similarity lookup.
+
+    Entries are kept per partition; each partition holds at most
+    ``max_entries`` items and evicts the least recently used one.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], list[float]] | None = None,
+        threshold: float = 0.92,
+        max_entries: int = 256
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Function mapping text to a vector (defaults to hashed_embedding)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries kept per partition
+        """
+        self.embed_fn = embed_fn or hashed_embedding
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._partitions: dict[str, OrderedDict[str, tuple[list[float], Any]]] = {}
+        # Per-partition (keys, float32 N x D matrix) for vectorized lookup (numpy only)
+        self._matrices: dict[str, tuple[list[str], Any]] = {}
+
+    def _embed(self, message: str) -> list[float]:
+        return _normalize(list(self.embed_fn(message)))
+
+    def lookup(self, message: str, partition: str = "") -> Any | None:
+        entries = self._partitions.get(partition)
+        if not entries:
+            return None
+
+        # Exact repeats skip the embedding entirely
+        if message in entries:
+            entries.move_to_end(message)
+            return entries[message][1]
+
+        query = self._embed(message)
+        np = _load_numpy()
+        if np is not None:
+            keys, matrix = self._get_matrix(np, partition, entries)
+            scores = matrix @ np.asarray(query, dtype=np.float32)
+            best = int(scores.argmax())
+            best_key, best_score = keys[best], float(scores[best])
+        else:
+            best_key, best_score = None, -1.0
+            for key, (vector, _) in entries.items():
+                score = sum(a * b for a, b in zip(query, vector, strict=False))
+                if score > best_score:
+                    best_key, best_score = key, score
+
+        if best_score < self.threshold:
+            return None
+        entries.move_to_end(best_key)
+        return entries[best_key][1]
+
+    def _get_matrix(
+        self,
+        np: Any,
+        partition: str,
+        entries: OrderedDict[str, tuple[list[float], Any]]
+    ) -> tuple[list[str], Any]:
+        """Get the stacked embeddings of a partition, rebuilding them after stores."""
+        cached = self._matrices.get(partition)
+        if cached is None:
+            keys = list(entries)
+            matrix = np.array([entries[key][0] for key in keys], dtype=np.float32)
+            cached = self._matrices[partition] = (keys, matrix)
+        return cached
+
+    def store(self, message: str, response: Any, partition: str = "") -> None:
+        entries = self._partitions.setdefault(partition, OrderedDict())
+        entries[message] = (self._embed(message), response)
+        entries.move_to_end(message)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        self._matrices.pop(partition, None)
+
+    def clear(self) -> None:
+        self._partitions.clear()
+        self._matrices.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._partitions.values())
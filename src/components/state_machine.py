@@ -5,13 +5,43 @@ Manages agent states and transitions, providing the core flow control
 for both synchronous and reactive operation modes.
 """
 
-import contextlib
-from collections.abc import Callable
+import time
+from bisect import insort
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from ..models.data_models import AgentState, Transition
 
 
+def _run_callback(callback: Callable, agent: Any) -> None:
+    """Call a state callback, ignoring its errors."""
+    # A bare try costs nothing until it raises; contextlib.suppress() would
+    # build a context manager on every transition
+    try:  # noqa: SIM105
+        callback(agent)
+    except Exception:
+        pass
+
+
+def _negated_priority(transition: Transition) -> int:
+    """Sort key placing higher priority transitions first."""
+    return -transition.priority
+
+
+def _format_history_entry(entry: tuple[str, str, str, int]) -> dict[str, Any]:
+    """Turn a recorded (from, to, trigger, timestamp_ns) transition into its public dict."""
+    source, target, trigger, timestamp_ns = entry
+    return {
+        "from": source,
+        "to": target,
+        "trigger": trigger,
+        "timestamp": datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+    }
+
+
 class StateConfig:
     """
     Configuration for a state in the state machine.
@@ -54,6 +84,78 @@ class StateConfig:
         """Get the macro instruction for this state."""
         return self.instruction
 
+    def copy(self) -> "StateConfig":
+        """Get an independent copy (the required_tools list is not shared)."""
+        return StateConfig(
+            name=self.name,
+            instruction=self.instruction,
+            required_tools=list(self.required_tools),
+            protocols=self.protocols,
+            on_enter=self.on_enter,
+            on_exit=self.on_exit,
+            timeout_seconds=self.timeout_seconds
+        )
+
+
+# Default agent state templates, built once at import. Each StateMachine
+# registers its own copies, so changing one machine's config never leaks
+# into another.
+_DEFAULT_STATES: dict[str, StateConfig] = {
+    AgentState.IDLE.value: StateConfig(
+        name=AgentState.IDLE.value,
+        instruction="Você está no estado IDLE. Aguardando instruções ou eventos.",
+    ),
+    AgentState.THINKING.value: StateConfig(
+        name=AgentState.THINKING.value,
+        instruction=(
+            "Você é um Agente ReAct e está entrando no modo THINKING. "
+            "Analise o contexto, formule hipóteses, avalie opções e planeje "
+            "passos lógicos para decidir a próxima ação. Mantenha todo o "
+            "raciocínio interno e não o revele ao usuário."
+        ),
+        required_tools=["check_inbox"],
+    ),
+    AgentState.WORKING.value: StateConfig(
+        name=AgentState.WORKING.value,
+        instruction=(
+            "Você está no modo WORKING. Execute as ações planejadas "
+            "usando as ferramentas disponíveis. Documente cada passo."
+        ),
+    ),
+    AgentState.MONITORING.value: StateConfig(
+        name=AgentState.MONITORING.value,
+        instruction=(
+            "Você está no modo MONITORING. Observe continuamente as fontes "
+            "de eventos (inbox, tasks) e responda a novos eventos."
+        ),
+    ),
+    AgentState.REQUEST_RECEIVED.value: StateConfig(
+        name=AgentState.REQUEST_RECEIVED.value,
+        instruction=(
+            "Uma nova requisição foi recebida. Processar a entrada do usuário "
+            "e preparar para transição ao modo THINKING."
+        ),
+    ),
+    AgentState.INTERRUPTED.value: StateConfig(
+        name=AgentState.INTERRUPTED.value,
+        instruction=(
+            "O agente foi interrompido. Salvar estado atual e preparar "
+            "para retomar ou encerrar."
+        ),
+    ),
+    AgentState.ERROR.value: StateConfig(
+        name=AgentState.ERROR.value,
+        instruction=(
+            "Um erro ocorreu. Avaliar a situação e decidir sobre recuperação "
+            "ou escalação."
+        ),
+    ),
+    AgentState.SHUTDOWN.value: StateConfig(
+        name=AgentState.SHUTDOWN.value,
+        instruction="O agente está encerrando. Finalizar processos pendentes.",
+    ),
+}
+
 
 class StateMachine:
     """
@@ -65,12 +167,17 @@ class StateMachine:
 
     Attributes:
         states: Dictionary of registered state configurations
-        transitions: List of registered transitions
+        transitions: Registered transitions, highest priority first (a tuple;
+            use add_transition/remove_transition or assign a new sequence)
         current_state: Name of the current state
         previous_state: Name of the previous state (for history)
-        state_history: List of state transitions for debugging
+        state_history: Last HISTORY_SIZE state transitions for debugging, as
+            (from, to, trigger, timestamp_ns) tuples; get_history() formats them
     """
 
+    # Transitions kept in state_history; older ones are dropped
+    HISTORY_SIZE = 100
+
     def __init__(self, initial_state: str = AgentState.IDLE.value):
         """
         Initialize the state machine.
@@ -79,75 +186,25 @@ class StateMachine:
             initial_state: The starting state (defaults to IDLE)
         """
         self.states: dict[str, StateConfig] = {}
-        self.transitions: list[Transition] = []
+        # Transitions in registration order; the priority-sorted tuple exposed
+        # as self.transitions is built from it on first read after a change
+        self._registered: list[Transition] = []
+        self._sorted_transitions: tuple[Transition, ...] | None = ()
+        # (source, trigger) -> and source -> transitions in priority order,
+        # kept sorted on insert (equal priorities stay in registration order)
+        self._transition_index: dict[tuple[str, str], list[Transition]] = {}
+        self._source_index: dict[str, list[Transition]] = {}
         self.current_state: str = initial_state
         self.previous_state: str | None = None
-        self.state_history: list[dict[str, Any]] = []
+        self.state_history: deque[tuple[str, str, str, int]] = deque(maxlen=self.HISTORY_SIZE)
         self._agent_ref: Any | None = None
 
         # Register default states
         self._register_default_states()
 
     def _register_default_states(self) -> None:
-        """Register the default agent states."""
-        default_states = {
-            AgentState.IDLE.value: StateConfig(
-                name=AgentState.IDLE.value,
-                instruction="Você está no estado IDLE. Aguardando instruções ou eventos.",
-            ),
-            AgentState.THINKING.value: StateConfig(
-                name=AgentState.THINKING.value,
-                instruction=(
-                    "Você é um Agente ReAct e está entrando no modo THINKING. "
-                    "Analise o contexto, formule hipóteses, avalie opções e planeje "
-                    "passos lógicos para decidir a próxima ação. Mantenha todo o "
-                    "raciocínio interno e não o revele ao usuário."
-                ),
-                required_tools=["check_inbox"],
-            ),
-            AgentState.WORKING.value: StateConfig(
-                name=AgentState.WORKING.value,
-                instruction=(
-                    "Você está no modo WORKING. Execute as ações planejadas "
-                    "usando as ferramentas disponíveis. Documente cada passo."
-                ),
-            ),
-            AgentState.MONITORING.value: StateConfig(
-                name=AgentState.MONITORING.value,
-                instruction=(
-                    "Você está no modo MONITORING. Observe continuamente as fontes "
-                    "de eventos (inbox, tasks) e responda a novos eventos."
-                ),
-            ),
-            AgentState.REQUEST_RECEIVED.value: StateConfig(
-                name=AgentState.REQUEST_RECEIVED.value,
-                instruction=(
-                    "Uma nova requisição foi recebida. Processar a entrada do usuário "
-                    "e preparar para transição ao modo THINKING."
-                ),
-            ),
-            AgentState.INTERRUPTED.value: StateConfig(
-                name=AgentState.INTERRUPTED.value,
-                instruction=(
-                    "O agente foi interrompido. Salvar estado atual e preparar "
-                    "para retomar ou encerrar."
-                ),
-            ),
-            AgentState.ERROR.value: StateConfig(
-                name=AgentState.ERROR.value,
-                instruction=(
-                    "Um erro ocorreu. Avaliar a situação e decidir sobre recuperação "
-                    "ou escalação."
-                ),
-            ),
-            AgentState.SHUTDOWN.value: StateConfig(
-                name=AgentState.SHUTDOWN.value,
-                instruction="O agente está encerrando. Finalizar processos pendentes.",
-            ),
-        }
-
-        for name, config in default_states.items():
-            self.states[name] = config
+        """Register copies of the default agent states."""
+        self.states.update({name: config.copy() for name, config in _DEFAULT_STATES.items()})
 
     # ==========================================================================
     # STATE REGISTRATION
@@ -195,15 +252,14 @@ class StateMachine:
         Returns:
             bool: True if the state was removed
         """
-        if name in self.states and name != self.current_state:
-            del self.states[name]
-            # Also remove any transitions involving this state
-            self.transitions = [
-                t for t in self.transitions
-                if t.source != name and t.target != name
-            ]
-            return True
-        return False
+        if name == self.current_state or self.states.pop(name, None) is None:
+            return False
+        # Also remove any transitions involving this state
+        self._set_transitions([
+            t for t in self._registered
+            if t.source != name and t.target != name
+        ])
+        return True
 
     def get_state_config(self, name: str) -> StateConfig | None:
         """Get the configuration for a specific state."""
@@ -230,9 +286,40 @@ class StateMachine:
         if transition.target not in self.states:
             raise ValueError(f"Target state '{transition.target}' not registered")
 
-        self.transitions.append(transition)
-        # Sort by priority (higher priority first)
-        self.transitions.sort(key=lambda t: t.priority, reverse=True)
+        self._registered.append(transition)
+        self._sorted_transitions = None
+        self._index_transition(transition)
+
+    def _index_transition(self, transition: Transition) -> None:
+        """Insert a transition into both lookup tables, keeping priority order."""
+        insort(
+            self._source_index.setdefault(transition.source, []),
+            transition, key=_negated_priority
+        )
+        insort(
+            self._transition_index.setdefault((transition.source, transition.trigger), []),
+            transition, key=_negated_priority
+        )
+
+    @property
+    def transitions(self) -> tuple[Transition, ...]:
+        """All registered transitions, highest priority first (immutable)."""
+        if self._sorted_transitions is None:
+            self._sorted_transitions = tuple(sorted(self._registered, key=_negated_priority))
+        return self._sorted_transitions
+
+    @transitions.setter
+    def transitions(self, transitions: Iterable[Transition]) -> None:
+        self._set_transitions(list(transitions))
+
+    def _set_transitions(self, transitions: list[Transition]) -> None:
+        """Replace all transitions and rebuild the lookup tables."""
+        self._registered = transitions
+        self._sorted_transitions = None
+        self._transition_index = {}
+        self._source_index = {}
+        for transition in transitions:
+            self._index_transition(transition)
 
     def remove_transition(self, source: str, target: str, trigger: str) -> bool:
         """
@@ -246,12 +333,12 @@ class StateMachine:
         Returns:
             bool: True if the transition was removed
         """
-        initial_count = len(self.transitions)
-        self.transitions = [
-            t for t in self.transitions
+        initial_count = len(self._registered)
+        self._set_transitions([
+            t for t in self._registered
             if not (t.source == source and t.target == target and t.trigger == trigger)
-        ]
-        return len(self.transitions) < initial_count
+        ])
+        return len(self._registered) < initial_count
 
     def get_available_transitions(self, agent: Any | None = None) -> list[Transition]:
         """
@@ -264,13 +351,8 @@ class StateMachine:
             List of transitions that can be taken
         """
         agent = agent or self._agent_ref
-        available = []
-
-        for transition in self.transitions:
-            if transition.source == self.current_state and transition.can_transition(agent):
-                available.append(transition)
-
-        return available
+        candidates = self._source_index.get(self.current_state, ())
+        return [transition for transition in candidates if transition.can_transition(agent)]
 
     # ==========================================================================
     # TRIGGER HANDLING
@@ -289,11 +371,9 @@ class StateMachine:
         """
         agent = agent or self._agent_ref
 
-        for transition in self.transitions:
-            if (transition.source == self.current_state and
-                transition.trigger == trigger_name and
-                transition.can_transition(agent)):
-
+        candidates = self._transition_index.get((self.current_state, trigger_name), ())
+        for transition in candidates:
+            if transition.can_transition(agent):
                 return self._execute_transition(transition, agent)
 
         return False
@@ -309,17 +389,16 @@ class StateMachine:
         Returns:
             bool: True if the transition occurred
         """
-        if target_state not in self.states:
+        target_config = self.states.get(target_state)
+        if target_config is None:
             return False
 
         agent = agent or self._agent_ref
         current_config = self.states.get(self.current_state)
-        target_config = self.states.get(target_state)
 
         # Execute exit callback
-        if current_config and current_config.on_exit:
-            with contextlib.suppress(Exception):
-                current_config.on_exit(agent)
+        if current_config is not None and current_config.on_exit:
+            _run_callback(current_config.on_exit, agent)
 
         # Update state
         self.previous_state = self.current_state
@@ -333,23 +412,23 @@ class StateMachine:
         )
 
         # Execute enter callback
-        if target_config and target_config.on_enter:
-            with contextlib.suppress(Exception):
-                target_config.on_enter(agent)
+        if target_config is not None and target_config.on_enter:
+            _run_callback(target_config.on_enter, agent)
 
         return True
 
     def _execute_transition(self, transition: Transition, agent: Any) -> bool:
         """Execute a transition and its callbacks."""
         current_config = self.states.get(self.current_state)
+        target_config = self.states.get(transition.target)
 
         # Execute on_exit for current state config
-        if current_config and current_config.on_exit:
-            with contextlib.suppress(Exception):
-                current_config.on_exit(agent)
+        if current_config is not None and current_config.on_exit:
+            _run_callback(current_config.on_exit, agent)
 
         # Execute transition on_exit
-        transition.execute_on_exit(agent)
+        if transition.on_exit:
+            transition.execute_on_exit(agent)
 
         # Update state
         self.previous_state = self.current_state
@@ -363,30 +442,18 @@ class StateMachine:
         )
 
         # Execute transition on_enter
-        transition.execute_on_enter(agent)
+        if transition.on_enter:
+            transition.execute_on_enter(agent)
 
         # Execute on_enter for new state config
-        target_config = self.states.get(self.current_state)
-        if target_config and target_config.on_enter:
-            with contextlib.suppress(Exception):
-                target_config.on_enter(agent)
+        if target_config is not None and target_config.on_enter:
+            _run_callback(target_config.on_enter, agent)
 
         return True
 
     def _record_transition(self, source: str, target: str, trigger: str) -> None:
-        """Record a transition in the history."""
-        from datetime import datetime
-
-        self.state_history.append({
-            "from": source,
-            "to": target,
-            "trigger": trigger,
-            "timestamp": datetime.now().isoformat()
-        })
-
-        # Keep history bounded
-        if len(self.state_history) > 100:
-            self.state_history = self.state_history[-50:]
+        """Record a transition in the history (the timestamp is formatted on read)."""
+        self.state_history.append((source, target, trigger, time.time_ns()))
 
     # ==========================================================================
     # UTILITY METHODS
@@ -426,7 +493,13 @@ class StateMachine:
 
     def get_history(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get recent state transition history."""
-        return self.state_history[-limit:]
+        history = self.state_history
+        if 0 < limit < len(history):
+            recent = list(islice(reversed(history), limit))
+            recent.reverse()
+        else:
+            recent = list(history)[-limit:]
+        return [_format_history_entry(entry) for entry in recent]
 
     def reset(self, initial_state: str = AgentState.IDLE.value) -> None:
         """
@@ -14,44 +14,65 @@ class ToolManager(IToolManager):
     inject_context: bool = True
 
     def __init__(self, inject_context: bool = True):
-        self._tools: dict[str, dict[str, Any]] = {}  # tool_name -> {tool, context, description}
-        self._contexts: dict[str, list[str]] = {}  # context -> [tool_names]
+        self._tools: dict[str, dict[str, Any]] = {}  # tool_name -> {tool, context, description, line}
+        # context -> [(tool_name, tool, description line)], read without going
+        # back through _tools
+        self._contexts: dict[str, list[tuple[str, Any, str]]] = {}
         self.inject_context = inject_context
+        # Bumped on every registration so callers can cache tool-derived data
+        self.version: int = 0
+        # contexts tuple (None for all tools) -> (version, descriptions)
+        self._descriptions: dict[tuple[str, ...] | None, tuple[int, str]] = {}
+        # Context contribution, rebuilt only after a registration
+        self._contribution: dict[str, Any] | None = None
 
     def register_tool(self, context: str, tool: Any) -> None:
         tool_name = getattr(tool, 'name', str(tool))
         description = getattr(tool, 'description', '')
 
+        display_name = tool.name if hasattr(tool, 'name') else 'Unknown'
+        # Rendered once here for get_tool_descriptions()
+        line = f"- {display_name}: {description}"
+        replaced = tool_name in self._tools
         self._tools[tool_name] = {
             "tool": tool,
             "context": context,
-            "description": description
+            "description": description,
+            "line": line
         }
 
-        if context not in self._contexts:
-            self._contexts[context] = []
-        self._contexts[context].append(tool_name)
+        entry = (tool_name, tool, line)
+        if replaced:
+            # Context lists that already name this tool now refer to the new one
+            for entries in self._contexts.values():
+                for i, (name, _, _) in enumerate(entries):
+                    if name == tool_name:
+                        entries[i] = entry
+        self._contexts.setdefault(context, []).append(entry)
+        self.version += 1
+        self._contribution = None
 
     def get_tools(self, contexts: list[str] | None = None) -> list[Any]:
         if contexts is None:
             return [t["tool"] for t in self._tools.values()]
 
-        tools = []
-        for ctx in contexts:
-            for tool_name in self._contexts.get(ctx, []):
-                tools.append(self._tools[tool_name]["tool"])
-        return tools
+        return [tool for ctx in contexts for _, tool, _ in self._contexts.get(ctx, ())]
 
     def get_tool_descriptions(self, contexts: list[str] | None = None) -> str:
-        tools = self._tools.values() if contexts is None else [
-            self._tools[name] for ctx in contexts
-            for name in self._contexts.get(ctx, [])
-        ]
+        key = None if contexts is None else tuple(contexts)
+        cached = self._descriptions.get(key)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
 
         lines = ["Available Tools:"]
-        for t in tools:
-            lines.append(f"- {t['tool'].name if hasattr(t['tool'], 'name') else 'Unknown'}: {t['description']}")
-        return "\n".join(lines)
+        if contexts is None:
+            lines.extend(t["line"] for t in self._tools.values())
+        else:
+            lines.extend(line for ctx in contexts for _, _, line in self._contexts.get(ctx, ()))
+        descriptions = "\n".join(lines)
+
+        self._descriptions[key] = (self.version, descriptions)
+        return descriptions
 
     def execute_tool(self, tool_name: str, **kwargs) -> Any:
         if tool_name not in self._tools:
@@ -69,12 +90,12 @@ class ToolManager(IToolManager):
         Get tools context for injection into the agent's system prompt.
         
         Returns:
-            dict with 'available_tools' key containing tool descriptions
+            dict with 'available_tools' key containing tool descriptions.
+            The same dict is returned until a tool is registered; treat it as read-only.
         """
-        if not self._tools:
-            return {}
-        
-        return {
-            "available_tools": self.get_tool_descriptions()
-        }
+        if self._contribution is None:
+            self._contribution = {
+                "available_tools": self.get_tool_descriptions()
+            } if self._tools else {}
+        return self._contribution
 
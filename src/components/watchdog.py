@@ -12,38 +12,32 @@ class Watchdog(IWatchdog):
     """Watchdog implementation for timeout and polling control."""
 
     def __init__(self, poll_interval: float = 30.0):
-        self._timer_duration: float | None = None
-        self._timer_start: float | None = None
+        # (monotonic start, duration) of the running timer, or None. Writers
+        # rebind it under the lock; readers take one unlocked snapshot of it
+        self._timer: tuple[float, float] | None = None
         self._poll_interval: float = poll_interval
-        self._is_running: bool = False
         self._lock = threading.Lock()
         self._timeout_callback: callable | None = None
 
     def start_timer(self, duration_seconds: float) -> None:
         with self._lock:
-            self._timer_duration = duration_seconds
-            self._timer_start = time.time()
-            self._is_running = True
+            self._timer = (time.monotonic(), duration_seconds)
 
     def stop_timer(self) -> None:
         with self._lock:
-            self._is_running = False
-            self._timer_duration = None
-            self._timer_start = None
+            self._timer = None
 
     def is_timed_out(self) -> bool:
-        with self._lock:
-            if not self._is_running or self._timer_start is None:
-                return False
-            elapsed = time.time() - self._timer_start
-            return elapsed >= self._timer_duration
+        timer = self._timer
+        if timer is None:
+            return False
+        return time.monotonic() - timer[0] >= timer[1]
 
     def get_remaining_time(self) -> float | None:
-        with self._lock:
-            if not self._is_running or self._timer_start is None:
-                return None
-            elapsed = time.time() - self._timer_start
-            return max(0, self._timer_duration - elapsed)
+        timer = self._timer
+        if timer is None:
+            return None
+        return max(0, timer[1] - (time.monotonic() - timer[0]))
 
     def get_poll_interval(self) -> float:
         return self._poll_interval
@@ -55,8 +49,9 @@ class Watchdog(IWatchdog):
 
     def reset(self) -> None:
         with self._lock:
-            if self._is_running and self._timer_duration is not None:
-                self._timer_start = time.time()
+            timer = self._timer
+            if timer is not None:
+                self._timer = (time.monotonic(), timer[1])
 
     def is_running(self) -> bool:
-        return self._is_running
+        return self._timer is not None
@@ -2,14 +2,87 @@
 Workspace Manager for the Agent Framework.
 """
 
+import contextlib
+import json
+import os
+import re
+import selectors
+import shlex
 import shutil
+import signal
 import subprocess
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ..interfaces.base import IWorkspaceManager
 
+# Seconds a full storage scan is trusted; the workspace may also change
+# through commands or other processes, which only a rescan picks up
+_STORAGE_USAGE_TTL = 5.0
+
+# Seconds the context contribution is reused when the workspace is only
+# changed from outside (the manager's own changes rebuild it right away)
+_CONTRIBUTION_TTL = 1.0
+
+
+# Characters that need a shell (pipes, redirection, globs, expansion, comments,
+# several commands); commands without them are exec'ed directly
+_SHELL_META = re.compile(r"[|&;<>*?`$(){}\[\]\\~#\n]")
+
+
+def _direct_args(command: str) -> list[str] | None:
+    """Split a command that can run without /bin/sh into argv, or return None."""
+    if _SHELL_META.search(command):
+        return None
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+    return args or None
+
+
+def _directory_size(path: str) -> int:
+    """Total size of the regular files under path (symlinks are not followed)."""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                total += _directory_size(entry.path)
+    return total
+
+
+def _format_audit_entry(entry: tuple[str, str, bool, int]) -> dict[str, Any]:
+    """Turn a recorded (action, path, success, timestamp_ns) entry into its public dict."""
+    action, path, success, timestamp_ns = entry
+    return {
+        "action": action,
+        "path": path,
+        "success": success,
+        "timestamp": datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+    }
+
+
+def _audit_flush_loop(
+    manager_ref: "weakref.ref[WorkspaceManager]",
+    stop: threading.Event,
+    interval: float
+) -> None:
+    """Background loop flushing a manager's audit entries until stopped or collected."""
+    while not stop.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager._flush_audit()
+        del manager
+
 
 class WorkspaceManager(IWorkspaceManager):
     """Manages the isolated workspace environment for the agent."""
@@ -17,33 +90,116 @@ class WorkspaceManager(IWorkspaceManager):
     # Flag to enable/disable automatic context injection (default: True)
     inject_context: bool = True
 
-    def __init__(self, base_path: str, inject_context: bool = True):
+    # Audit entries kept; older ones are dropped
+    AUDIT_LOG_SIZE = 10_000
+
+    # Seconds between background writes of new audit entries to audit_path
+    AUDIT_FLUSH_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        base_path: str,
+        inject_context: bool = True,
+        persistent_shell: bool = False,
+        audit_path: str | Path | None = None
+    ):
+        """
+        Initialize the workspace.
+
+        Args:
+            base_path: Workspace root directory (created if missing)
+            inject_context: Whether to contribute workspace context to prompts
+            persistent_shell: Run commands in one long-lived /bin/sh instead of
+                a new shell per command. Each command still starts in the
+                workspace root, but shell variables carry over between commands.
+            audit_path: File that audit entries are appended to as
+                newline-delimited JSON. Entries are written in batches by a
+                background thread; close() writes the remaining ones.
+        """
         self.base_path = Path(base_path).resolve()
         self.base_path.mkdir(parents=True, exist_ok=True)
         self._snapshots: dict[str, dict] = {}
-        self._audit_log: list[dict] = []
+        # (action, path, success, timestamp_ns) entries, formatted by get_audit_log()
+        self._audit_log: deque[tuple[str, str, bool, int]] = deque(maxlen=self.AUDIT_LOG_SIZE)
         self._storage_limit: int = 1024 * 1024 * 1024  # 1GB default
+        # (monotonic time of the last full scan, bytes used), adjusted in place
+        # by create_file/delete_file and dropped by bulk changes
+        self._storage_used: tuple[float, int] | None = None
+        # (monotonic build time, context contribution), dropped on every change
+        self._contribution: tuple[float, dict[str, Any]] | None = None
         self.inject_context = inject_context
+        self._persistent_shell = persistent_shell
+        self._shell: subprocess.Popen | None = None
+        # Entries not yet written to audit_path (None when not persisting)
+        self._audit_pending: deque[tuple[str, str, bool, int]] | None = None
+        self._audit_fd: int | None = None
+        self._audit_stop: threading.Event | None = None
+        self._audit_thread: threading.Thread | None = None
+        if audit_path is not None:
+            self._start_audit_writer(Path(audit_path))
+
+    def _start_audit_writer(self, audit_path: Path) -> None:
+        audit_path.parent.mkdir(parents=True, exist_ok=True)
+        self._audit_fd = os.open(audit_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._audit_pending = deque()
+        self._audit_stop = threading.Event()
+        # The thread only holds a weak reference so an unclosed manager can
+        # still be collected (its __del__ then stops the thread)
+        self._audit_thread = threading.Thread(
+            target=_audit_flush_loop,
+            args=(weakref.ref(self), self._audit_stop, self.AUDIT_FLUSH_INTERVAL),
+            name="workspace-audit",
+            daemon=True
+        )
+        self._audit_thread.start()
 
     def _log_action(self, action: str, path: str, success: bool) -> None:
-        self._audit_log.append({
-            "action": action,
-            "path": path,
-            "success": success,
-            "timestamp": datetime.now().isoformat()
-        })
+        self._contribution = None
+        entry = (action, path, success, time.time_ns())
+        self._audit_log.append(entry)
+        if self._audit_pending is not None:
+            self._audit_pending.append(entry)
+
+    def _flush_audit(self) -> None:
+        """Append pending audit entries to audit_path with a single write."""
+        pending, fd = self._audit_pending, self._audit_fd
+        if not pending or fd is None:
+            return
+        # popleft() is atomic, so entries logged meanwhile are left for the next flush
+        lines = [
+            json.dumps(_format_audit_entry(pending.popleft())) for _ in range(len(pending))
+        ]
+        data = memoryview(("\n".join(lines) + "\n").encode())
+        while data:
+            data = data[os.write(fd, data):]
 
     def _resolve_path(self, path: str) -> Path:
-        resolved = (self.base_path / path).resolve()
-        if not str(resolved).startswith(str(self.base_path)):
+        # Lexical check first: ".." escapes are rejected without touching the disk
+        candidate = Path(os.path.normpath(self.base_path / path))
+        if not candidate.is_relative_to(self.base_path):
+            raise ValueError("Path escapes workspace")
+        # Symlinks (e.g. created by execute_command) can still point outside
+        resolved = candidate.resolve()
+        if not resolved.is_relative_to(self.base_path):
             raise ValueError("Path escapes workspace")
         return resolved
 
+    def _adjust_storage_used(self, delta: int) -> None:
+        """Apply a known size change to the cached storage usage, if any."""
+        cached = self._storage_used
+        if cached is not None:
+            self._storage_used = (cached[0], cached[1] + delta)
+
     def create_file(self, path: str, content: str) -> bool:
         try:
             file_path = self._resolve_path(path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = 0
+            if self._storage_used is not None and file_path.is_file():
+                old_size = file_path.stat().st_size
             file_path.write_text(content, encoding='utf-8')
+            if self._storage_used is not None:
+                self._adjust_storage_used(file_path.stat().st_size - old_size)
             self._log_action("create_file", path, True)
             return True
         except Exception:
@@ -61,7 +217,10 @@ class WorkspaceManager(IWorkspaceManager):
 
     def delete_file(self, path: str) -> bool:
         try:
-            self._resolve_path(path).unlink()
+            file_path = self._resolve_path(path)
+            size = file_path.stat().st_size if self._storage_used is not None else 0
+            file_path.unlink()
+            self._adjust_storage_used(-size)
             self._log_action("delete_file", path, True)
             return True
         except Exception:
@@ -79,8 +238,10 @@ class WorkspaceManager(IWorkspaceManager):
     def delete_directory(self, path: str, recursive: bool = False) -> bool:
         try:
             dir_path = self._resolve_path(path)
+            self._contribution = None
             if recursive:
                 shutil.rmtree(dir_path)
+                self._storage_used = None
             else:
                 dir_path.rmdir()
             return True
@@ -89,7 +250,8 @@ class WorkspaceManager(IWorkspaceManager):
 
     def list_directory(self, path: str) -> list[str]:
         try:
-            return [p.name for p in self._resolve_path(path).iterdir()]
+            with os.scandir(self._resolve_path(path)) as entries:
+                return [entry.name for entry in entries]
         except Exception:
             return []
 
@@ -108,42 +270,177 @@ class WorkspaceManager(IWorkspaceManager):
         return snapshot_id in self._snapshots
 
     def get_storage_usage(self) -> dict[str, Any]:
-        total = sum(f.stat().st_size for f in self.base_path.rglob("*") if f.is_file())
-        return {"used_bytes": total, "limit_bytes": self._storage_limit}
+        now = time.monotonic()
+        cached = self._storage_used
+        if cached is None or now - cached[0] >= _STORAGE_USAGE_TTL:
+            cached = self._storage_used = (now, _directory_size(str(self.base_path)))
+        return {"used_bytes": cached[1], "limit_bytes": self._storage_limit}
 
     def set_storage_limit(self, limit_bytes: int) -> None:
         self._storage_limit = limit_bytes
 
     def execute_command(self, command: str, timeout: float | None = None) -> dict[str, Any]:
+        # Commands may write anywhere in the workspace
+        self._storage_used = None
+        self._contribution = None
+        if self._persistent_shell:
+            return self._execute_in_shell(command, timeout or 30)
+        args = _direct_args(command)
+        result = None
         try:
-            result = subprocess.run(
-                command, shell=True, cwd=str(self.base_path),
-                capture_output=True, text=True, timeout=timeout or 30
-            )
+            if args is not None:
+                # Not an executable (shell builtin, variable assignment...): the
+                # shell below runs it, or reports it as not found
+                with contextlib.suppress(OSError):
+                    result = subprocess.run(
+                        args, cwd=str(self.base_path),
+                        capture_output=True, text=True, timeout=timeout or 30
+                    )
+            if result is None:
+                result = subprocess.run(
+                    command, shell=True, cwd=str(self.base_path),
+                    capture_output=True, text=True, timeout=timeout or 30
+                )
             return {"stdout": result.stdout, "stderr": result.stderr, "returncode": result.returncode}
         except subprocess.TimeoutExpired:
             return {"stdout": "", "stderr": "Timeout", "returncode": -1}
 
+    def _execute_in_shell(self, command: str, timeout: float) -> dict[str, Any]:
+        """
+        Run a command in the persistent shell, spawning it if needed.
+
+        The command is eval'ed from the workspace root with stdin from
+        /dev/null, then a unique marker is printed on stdout (with the exit
+        status) and on stderr; output is read until both markers arrive. A
+        command that ends the shell (exit, syntax error) returns the shell's
+        status, and the next command starts a fresh shell. On timeout the
+        shell is killed.
+        """
+        shell = self._shell
+        if shell is None or shell.poll() is not None:
+            shell = self._shell = subprocess.Popen(
+                ["/bin/sh"], cwd=str(self.base_path), stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True
+            )
+
+        marker = f"__workspace_done_{uuid.uuid4().hex}__"
+        script = (
+            f"cd {shlex.quote(str(self.base_path))} && eval {shlex.quote(command)} </dev/null\n"
+            f"printf '\\n{marker}%d\\n' $?\n"
+            f"printf '\\n{marker}\\n' >&2\n"
+        )
+        try:
+            shell.stdin.write(script.encode())
+            shell.stdin.flush()
+        except BrokenPipeError:
+            self._close_shell()
+            return {"stdout": "", "stderr": "Shell exited", "returncode": -1}
+
+        tail = f"\n{marker}".encode()
+        outputs = {shell.stdout.fileno(): bytearray(), shell.stderr.fileno(): bytearray()}
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            for fd in outputs:
+                selector.register(fd, selectors.EVENT_READ)
+            open_fds = set(outputs)
+            while open_fds:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._close_shell()
+                    return {"stdout": "", "stderr": "Timeout", "returncode": -1}
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 1 << 16)
+                    buffer = outputs[key.fd]
+                    buffer += chunk
+                    # Done with a stream at EOF or once its marker line is complete
+                    if not chunk or (buffer.endswith(b"\n") and tail in buffer):
+                        selector.unregister(key.fd)
+                        open_fds.discard(key.fd)
+
+        stdout = outputs[shell.stdout.fileno()]
+        stderr = outputs[shell.stderr.fileno()]
+        end = stdout.rfind(tail)
+        if end == -1:
+            # The shell exited before printing the marker
+            returncode = shell.wait()
+            self._close_shell()
+        else:
+            returncode = int(stdout[end + len(tail):])
+            del stdout[end:]
+            err_end = stderr.rfind(tail)
+            if err_end != -1:
+                del stderr[err_end:]
+        return {
+            "stdout": stdout.decode(errors="replace"),
+            "stderr": stderr.decode(errors="replace"),
+            "returncode": returncode
+        }
+
+    def close(self) -> None:
+        """Terminate the persistent shell and write out pending audit entries."""
+        self._close_audit_writer()
+        self._close_shell()
+
+    def _close_shell(self) -> None:
+        """Kill the persistent shell, if one is running (the next command starts a new one)."""
+        shell, self._shell = self._shell, None
+        if shell is None:
+            return
+        if shell.poll() is None:
+            # The shell leads its own session: also stop the commands it started
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(shell.pid, signal.SIGKILL)
+        shell.wait()
+        for stream in (shell.stdin, shell.stdout, shell.stderr):
+            stream.close()
+
+    def _close_audit_writer(self) -> None:
+        thread, self._audit_thread = self._audit_thread, None
+        if thread is None:
+            return
+        self._audit_stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._flush_audit()
+        os.close(self._audit_fd)
+        self._audit_fd = self._audit_pending = None
+
+    def __del__(self) -> None:
+        if (
+            getattr(self, "_shell", None) is not None
+            or getattr(self, "_audit_thread", None) is not None
+        ):
+            self.close()
+
     def get_audit_log(self) -> list[dict[str, Any]]:
-        return list(self._audit_log)
+        return [_format_audit_entry(entry) for entry in self._audit_log]
 
     def get_context_contribution(self) -> dict[str, Any]:
         """
         Get workspace context for injection into the agent's system prompt.
         
         Returns:
-            dict with 'workspace' key containing base path and file list
+            dict with 'workspace' key containing base path and file list.
+            The same dict is returned until the workspace changes (or for up to
+            _CONTRIBUTION_TTL seconds); treat it as read-only.
         """
+        now = time.monotonic()
+        cached = self._contribution
+        if cached is not None and now - cached[0] < _CONTRIBUTION_TTL:
+            return cached[1]
+
         try:
             files = self.list_directory(".")
         except Exception:
             files = []
-        
-        return {
+
+        contribution = {
             "workspace": {
                 "base_path": str(self.base_path),
                 "files": files[:20],  # Limit to first 20 files
                 "storage": self.get_storage_usage()
             }
         }
+        self._contribution = (now, contribution)
+        return contribution
 
@@ -8,6 +8,7 @@ from .base import (
     ILifeCycle,
     ILogger,
     IMemoryManager,
+    IResponseCache,
     ITaskManager,
     ITextClient,
     IToolManager,
@@ -25,6 +26,7 @@ __all__ = [
     "ILogger",
     "ILifeCycle",
     "IWorkspaceManager",
+    "IResponseCache",
     "IInboxClient",
     "ITaskManager",
 ]
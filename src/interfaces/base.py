@@ -6,6 +6,7 @@ Using Python's Protocol for structural subtyping (duck typing with type safety).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from enum import Enum
 from typing import Any
 
@@ -51,6 +52,8 @@ class IContextProvider(ABC):
                 }
     """
     
+    __slots__ = ()
+
     # Flag to enable/disable context injection (default: True)
     inject_context: bool = True
     
@@ -122,6 +125,9 @@ class IFormatter(ABC):
     suitable for system prompts.
     """
 
+    # Lets slotted formatters drop the per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def format(self, context: dict[str, Any]) -> str:
         """
@@ -147,11 +153,23 @@ class IMemoryManager(IContextProvider):
     recent messages and long-term memory keys.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def add_message(self, role: str, content: str, metadata: dict | None = None) -> None:
         """Add a message to short-term memory."""
         pass
 
+    def add_messages(self, messages: list[tuple[str, str]]) -> None:
+        """
+        Add several (role, content) messages to short-term memory at once.
+
+        Backends that can batch-append (files, databases) should override this;
+        the default simply calls add_message() for each entry.
+        """
+        for role, content in messages:
+            self.add_message(role, content)
+
     @abstractmethod
     def get_recent_messages(self, limit: int = 10) -> list[dict[str, Any]]:
         """Retrieve recent messages from short-term memory."""
@@ -267,30 +285,36 @@ class ILogger(ABC):
 
     Supports various output destinations (terminal, file, subprocess, etc.)
     Must be able to log thinking tokens and tool calls.
+
+    Message methods accept printf-style ``*args`` (as logging.Logger does),
+    so formatting is only paid for when the message is actually emitted:
+    ``logger.info("Processing: %s", text)``.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """Log a debug message."""
         pass
 
     @abstractmethod
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """Log an info message."""
         pass
 
     @abstractmethod
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """Log a warning message."""
         pass
 
     @abstractmethod
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """Log an error message."""
         pass
 
     @abstractmethod
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """Log a critical message."""
         pass
 
@@ -304,6 +328,14 @@ class ILogger(ABC):
         """Log a tool call with arguments and result."""
         pass
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Check if messages of the given level would be emitted.
+
+        Lets callers skip building expensive log payloads. Defaults to True.
+        """
+        return True
+
 
 class ILifeCycle(ABC):
     """
@@ -313,14 +345,16 @@ class ILifeCycle(ABC):
     message limits, and other guardrails for limited resources.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def count_tokens(self, text: str) -> int:
         """Count tokens in a text string."""
         pass
 
     @abstractmethod
-    def get_token_usage(self) -> dict[str, int]:
-        """Get current token usage statistics."""
+    def get_token_usage(self) -> Mapping[str, int]:
+        """Get current token usage statistics (may be a read-only live view)."""
         pass
 
     @abstractmethod
@@ -449,6 +483,36 @@ class IWorkspaceManager(IContextProvider):
     # get_context_contribution() is inherited from IContextProvider and must be implemented
 
 
+class IResponseCache(ABC):
+    """
+    Interface for LLM response caching.
+
+    Lets the agent answer repeated or near-duplicate messages without a
+    new LLM round-trip. Entries are grouped in partitions so responses are
+    only reused under comparable conditions (state, protocol, urgency).
+    """
+
+    @abstractmethod
+    def lookup(self, message: str, partition: str = "") -> Any | None:
+        """
+        Find a cached response for a message.
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    def store(self, message: str, response: Any, partition: str = "") -> None:
+        """Cache the response produced for a message."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        pass
+
+
 # ==============================================================================
 # MONITORING INTERFACES (Inbox & Tasks)
 # ==============================================================================
@@ -6,11 +6,12 @@ including models for emails, tasks, protocols, and state machine components.
 """
 
 import contextlib
+import itertools
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # ==============================================================================
 # INBOX MODELS
@@ -86,6 +87,10 @@ class TaskItem(BaseModel):
 # PROTOCOL MODELS
 # ==============================================================================
 
+# Source of ProtocolStep revisions, unique across all steps
+_step_revisions = itertools.count()
+
+
 class ProtocolStep(BaseModel):
     """
     Represents a single step within a protocol.
@@ -99,6 +104,14 @@ class ProtocolStep(BaseModel):
     notes: str | None = Field(None, description="Additional notes or considerations")
     is_complete: bool = Field(default=False, description="Whether this step has been completed")
 
+    # Changes whenever a field is reassigned (Protocol cache key)
+    _revision: int = PrivateAttr(default_factory=lambda: next(_step_revisions))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_revision", next(_step_revisions))
+
     def mark_complete(self) -> None:
         """Mark this step as complete."""
         self.is_complete = True
@@ -114,12 +127,88 @@ class Protocol(BaseModel):
 
     Protocols provide structured guidance for the agent to follow
     when handling specific types of situations or tasks.
+
+    cached_dump and summary() follow field reassignments on the protocol and
+    its steps (e.g. protocol.steps[0].name = ...). Changes they cannot see,
+    such as appending to a step's instructions list or replacing an item of
+    steps, need an explicit invalidate().
     """
     protocol_name: str = Field(..., description="Unique name for the protocol")
     description: str = Field(..., description="What this protocol is for")
     steps: list[ProtocolStep] = Field(..., description="Ordered list of protocol steps")
     current_step_index: int = Field(default=0, description="Index of the current step")
 
+    # Memoized model_dump(), keyed by (current_step_index, step revisions)
+    _dump_cache: tuple[tuple, dict[str, Any]] | None = PrivateAttr(default=None)
+    # Memoized summary(), keyed by (current_step_index, len(steps), current step revision)
+    _summary_cache: tuple[tuple[int, int, int | None], dict[str, Any]] | None = PrivateAttr(
+        default=None
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Drop the memoized dump and summary.
+
+        Only needed after in-place changes the caches cannot see, such as
+        mutating a step's instructions list or replacing an item of steps.
+        """
+        super().__setattr__("_dump_cache", None)
+        super().__setattr__("_summary_cache", None)
+
+    @property
+    def cached_dump(self) -> dict[str, Any]:
+        """
+        Get model_dump() of this protocol, computed once per step state.
+
+        The dump is reused until a field of the protocol or of one of its
+        steps is reassigned (marking a step complete included). Treat the
+        returned dict as read-only.
+        """
+        progress = (self.current_step_index, tuple(step._revision for step in self.steps))
+        cached = self._dump_cache
+        if cached is not None and cached[0] == progress:
+            return cached[1]
+
+        dump = self.model_dump()
+        self._dump_cache = (progress, dump)
+        return dump
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Get the description, current step and progress of this protocol.
+
+        The dict is reused until the step index or step count changes, or a
+        field of the protocol or of its current step is reassigned. Treat it
+        as read-only.
+        """
+        steps = self.steps
+        index = self.current_step_index
+        count = len(steps)
+        step = steps[index] if 0 <= index < count else None
+        key = (index, count, step._revision if step is not None else None)
+        cached = self._summary_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if step is not None:
+            # Copied so summaries taken before an in-place edit keep their value
+            step_name, instructions = step.name, list(step.instructions)
+        else:
+            step_name, instructions = "completed", []
+        summary = {
+            "description": self.description,
+            "current_step": step_name,
+            "progress": f"{index + 1}/{count}",
+            "current_instructions": instructions
+        }
+        self._summary_cache = (key, summary)
+        return summary
+
     def get_current_step(self) -> ProtocolStep | None:
         """Get the current step in the protocol."""
         if 0 <= self.current_step_index < len(self.steps):
@@ -0,0 +1,525 @@
+"""
+Unit Tests for the Agent class.
+
+Uses a fake ITextClient so the synchronous pipeline (system prompt build,
+ReAct loop, memory writes) can be exercised without any real API.
+"""
+
+import threading
+from typing import Any
+
+import pytest
+
+from src.agent import Agent
+from src.clients import MockInboxClient, MockTaskClient
+from src.components import (
+    ConsoleLogger,
+    ContextManager,
+    InMemoryManager,
+    SemanticResponseCache,
+    ToolManager,
+    Watchdog,
+    WorkspaceManager,
+)
+from src.interfaces.base import ITextClient, LogLevel
+from src.models import AgentEvent, Protocol, ProtocolStep
+
+
+class FakeResponse:
+    """Minimal LLM response object."""
+
+    def __init__(self, content: str, tool_calls: list | None = None):
+        self.content = content
+        self.tool_calls = tool_calls
+
+    def __str__(self):
+        return self.content
+
+
+class FakeTextClient(ITextClient):
+    """Text client that records calls and answers with scripted replies."""
+
+    def __init__(self, reply: str = "ok", scripted: list[FakeResponse] | None = None):
+        self.reply = reply
+        self.scripted = list(scripted or [])
+        self.calls: list[list[Any]] = []
+        self.bind_count = 0
+
+    def invoke(self, messages: list[Any], **kwargs) -> FakeResponse:
+        self.calls.append(list(messages))
+        if self.scripted:
+            return self.scripted.pop(0)
+        return FakeResponse(self.reply)
+
+    def bind_tools(self, tools: list[Any]) -> "FakeTextClient":
+        self.bind_count += 1
+        return self
+
+    def get_model_name(self) -> str:
+        return "fake"
+
+
+def make_protocol(name: str = "analysis") -> Protocol:
+    return Protocol(
+        protocol_name=name,
+        description="Protocol for tests",
+        steps=[
+            ProtocolStep(name="first", goal="Start", instructions=["Do A"]),
+            ProtocolStep(name="second", goal="Finish", instructions=["Do B"]),
+        ],
+    )
+
+
+@pytest.fixture
+def agent():
+    return Agent(text_provider=FakeTextClient(), context=ContextManager())
+
+
+# ==============================================================================
+# System Prompt Cache Tests
+# ==============================================================================
+
+class TestSystemPromptCache:
+    """Tests for reusing the rendered system prompt."""
+
+    def test_cache_hit_returns_same_prompt(self, agent):
+        """Unchanged inputs reuse the prompt rendered by the ContextManager."""
+        first = agent._build_system_prompt()
+        version = agent.context._version
+        second = agent._build_system_prompt()
+
+        assert second is first
+        assert agent.context._version == version
+
+    def test_context_change_invalidates(self, agent):
+        """A new context entry produces a fresh prompt."""
+        first = agent._build_system_prompt()
+        agent.context.add("extra", "new value")
+        second = agent._build_system_prompt()
+
+        assert first != second
+        assert "new value" in second
+
+    def test_protocol_progress_invalidates(self, agent):
+        """Advancing a protocol step is reflected in the prompt."""
+        protocol = make_protocol()
+        agent.add_protocol(protocol)
+
+        first = agent._build_system_prompt()
+        protocol.advance_step()
+        second = agent._build_system_prompt()
+
+        assert "first" in first
+        assert "second" in second
+        assert first != second
+
+    def test_memory_change_invalidates(self):
+        """New memory messages are included in the next prompt."""
+        agent = Agent(text_provider=FakeTextClient(), memory=InMemoryManager())
+
+        agent.process_message("Hello there")
+        prompt = agent._build_system_prompt()
+
+        assert "Hello there" in prompt
+
+
+class TestContextDirtyFlags:
+    """Tests for skipping unchanged context writes."""
+
+    def test_unchanged_value_not_rewritten(self, agent):
+        """The same value is written only once."""
+        agent._set_context("key", {"a": 1})
+        first = agent.context.get("key")
+
+        agent._set_context("key", {"a": 1})
+
+        assert agent.context.get("key") is first
+
+    def test_changed_value_rewritten(self, agent):
+        """A different value replaces the entry."""
+        agent._set_context("key", {"a": 1})
+        agent._set_context("key", {"a": 2})
+
+        assert agent.context.get("key") == {"a": 2}
+
+    def test_value_mutated_in_place_rewritten(self, agent):
+        """Mutating the written object in place is detected and invalidates the context."""
+        value = {"a": ["first-item"]}
+        agent._set_context("key", value)
+        version = agent.context._version
+
+        value["a"].append("second-item")
+        agent._set_context("key", value)
+
+        assert agent.context._version > version
+        assert "second-item" in agent._build_system_prompt()
+
+    def test_external_change_is_overwritten(self, agent):
+        """Entries changed outside the agent are written again."""
+        agent._set_context("key", "value")
+        agent.context.add("key", "external")
+
+        agent._set_context("key", "value")
+
+        assert agent.context.get("key") == "value"
+
+
+# ==============================================================================
+# Tool Call Tests
+# ==============================================================================
+
+class FunctionCall:
+    """SDK-style tool call object (tool_call.function.{name, arguments})."""
+
+    class _Function:
+        def __init__(self, name: str, arguments: str):
+            self.name = name
+            self.arguments = arguments
+
+    def __init__(self, call_id: str, name: str, arguments: str):
+        self.id = call_id
+        self.function = self._Function(name, arguments)
+
+
+class AddTool:
+    """Tool object exposing the name/description/invoke protocol."""
+
+    name = "add"
+    description = "Add two numbers"
+
+    def invoke(self, args: dict) -> int:
+        return args["a"] + args["b"]
+
+
+class TestToolCalls:
+    """Tests for tool call extraction in the ReAct loop."""
+
+    def run_with_calls(self, tool_calls: list[Any]) -> list[dict]:
+        client = FakeTextClient(scripted=[FakeResponse("", tool_calls), FakeResponse("done")])
+        tools = ToolManager()
+        tools.register_tool("math", AddTool())
+        agent = Agent(text_provider=client, tools=tools)
+
+        agent.process_message("add numbers")
+
+        return [m for m in client.calls[-1] if m["role"] == "tool"]
+
+    def test_dict_tool_call(self):
+        """LangChain-style dict tool calls are executed."""
+        results = self.run_with_calls([{"name": "add", "args": {"a": 1, "b": 2}, "id": "c1"}])
+
+        assert results == [{"role": "tool", "content": "3", "name": "add", "tool_call_id": "c1"}]
+
+    def test_function_object_tool_call(self):
+        """SDK objects with JSON string arguments are executed."""
+        results = self.run_with_calls([FunctionCall("c2", "add", '{"a": 2, "b": 5}')])
+
+        assert results[0]["content"] == "7"
+        assert results[0]["tool_call_id"] == "c2"
+
+    def test_failed_tool_call_reports_error(self):
+        """Tool errors are sent back to the LLM with the call id."""
+        results = self.run_with_calls([{"name": "missing", "args": {}, "id": "c3"}])
+
+        assert results[0]["content"].startswith("Error:")
+        assert results[0]["tool_call_id"] == "c3"
+
+    def test_bound_llm_reused_until_tools_change(self):
+        """bind_tools() runs once per tool set, not once per iteration."""
+        client = FakeTextClient()
+        tools = ToolManager()
+        tools.register_tool("math", AddTool())
+        agent = Agent(text_provider=client, tools=tools)
+
+        agent.process_message("first")
+        agent.process_message("second")
+        assert client.bind_count == 1
+
+        other = AddTool()
+        other.name = "add_again"
+        tools.register_tool("math", other)
+        agent.process_message("third")
+        assert client.bind_count == 2
+
+    def test_tool_calls_run_concurrently(self):
+        """With several workers, tool calls of one response overlap; results keep order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitTool:
+            name = "wait"
+            description = "Wait for the other call"
+
+            def invoke(self, args: dict) -> str:
+                barrier.wait()
+                return args["tag"]
+
+        client = FakeTextClient(scripted=[
+            FakeResponse("", [
+                {"name": "wait", "args": {"tag": "first"}, "id": "c1"},
+                {"name": "wait", "args": {"tag": "second"}, "id": "c2"},
+            ]),
+            FakeResponse("done"),
+        ])
+        tools = ToolManager()
+        tools.register_tool("sync", WaitTool())
+        agent = Agent(text_provider=client, tools=tools, max_tool_workers=2)
+
+        agent.process_message("wait twice")
+        executor = agent._tool_executor
+        agent.close()
+
+        results = [m for m in client.calls[-1] if m["role"] == "tool"]
+        assert [(m["content"], m["tool_call_id"]) for m in results] == [
+            ("first", "c1"), ("second", "c2")
+        ]
+        assert agent._tool_executor is None
+        assert not any(t.name.startswith("agent-tool") for t in threading.enumerate())
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+# ==============================================================================
+# Monitoring Tests
+# ==============================================================================
+
+class TestMonitoring:
+    """Tests for the asyncio-based reactive mode."""
+
+    def test_events_processed_and_state_restored(self, monkeypatch):
+        """Inbox and task events are handled and the agent returns to IDLE."""
+        inbox = MockInboxClient()
+        inbox.add_mock_email("Hello", "a@b.com", "Body", is_urgent=True)
+        tasks = MockTaskClient()
+        tasks.create_task("Old task", due_date="2000-01-01", priority=3)
+
+        agent = Agent(
+            text_provider=FakeTextClient(),
+            watchdog=Watchdog(poll_interval=0.01),
+            inbox_client=inbox,
+            task_manager=tasks,
+        )
+        batches = []
+
+        def process_events(events):
+            batches.append(events)
+            agent.stop_monitoring()
+
+        monkeypatch.setattr(Agent, "process_events", lambda self, events: process_events(events))
+        agent.start_monitoring()
+
+        assert len(batches) == 1
+        assert [e.event_type for e in batches[0]] == ["inbox", "task"]
+        assert not agent.is_monitoring()
+        assert agent.get_current_state() == "IDLE"
+
+    def test_process_events_single_llm_call(self):
+        """A batch of events is answered with one LLM invocation."""
+        client = FakeTextClient()
+        agent = Agent(text_provider=client)
+        inbox = MockInboxClient()
+        inbox.add_mock_email("High", "c@d.com", "Body", is_urgent=True)
+        inbox.add_mock_email("Low", "a@b.com", "Body")
+        events = [AgentEvent.from_email(e) for e in inbox.check_new_emails()]
+
+        agent.process_events(events)
+
+        assert len(client.calls) == 1
+        system_prompt = client.calls[0][0]["content"]
+        user_message = client.calls[0][-1]["content"]
+        assert user_message.index("High") < user_message.index("Low")
+        assert "High" in system_prompt and "Low" in system_prompt
+
+    def test_batch_context_cleared_after_processing(self):
+        """Later messages neither see the batch nor inherit its urgency."""
+        client = FakeTextClient()
+        agent = Agent(text_provider=client, response_cache=SemanticResponseCache())
+        inbox = MockInboxClient()
+        inbox.add_mock_email("Urgent thing", "c@d.com", "Body", is_urgent=True)
+
+        agent.process_events([AgentEvent.from_email(e) for e in inbox.check_new_emails()])
+
+        assert agent.context.get("current_events") is None
+        assert agent._response_cache_partition(None).endswith("|normal")
+        agent.process_message("hello")
+        assert "Urgent thing" not in client.calls[-1][0]["content"]
+
+
+# ==============================================================================
+# Response Cache Tests
+# ==============================================================================
+
+class TestResponseCache:
+    """Tests for the semantic response cache in process_message."""
+
+    def test_similar_message_skips_llm(self):
+        """A near-duplicate message is answered from the cache."""
+        client = FakeTextClient(reply="It is sunny")
+        agent = Agent(text_provider=client, response_cache=SemanticResponseCache())
+
+        first = agent.process_message("What is the weather today?")
+        second = agent.process_message("what is the weather today")
+
+        assert len(client.calls) == 1
+        assert second is first
+        assert agent.get_current_state() == "IDLE"
+
+    def test_bypassed_with_conversation_memory(self):
+        """Turns that may refer to earlier messages in memory always reach the LLM."""
+        client = FakeTextClient()
+        memory = InMemoryManager()
+        agent = Agent(text_provider=client, memory=memory, response_cache=SemanticResponseCache())
+
+        agent.process_message("what did I just ask?")
+        agent.process_message("what did I just ask?")
+
+        assert len(client.calls) == 2
+        assert [m["role"] for m in memory.get_recent_messages()] == [
+            "user", "assistant", "user", "assistant"
+        ]
+
+    def test_dissimilar_message_misses(self):
+        """Unrelated messages still reach the LLM."""
+        client = FakeTextClient()
+        agent = Agent(text_provider=client, response_cache=SemanticResponseCache())
+
+        agent.process_message("What is the weather today?")
+        agent.process_message("Summarize my unread emails")
+
+        assert len(client.calls) == 2
+
+    def test_bypassed_when_tools_registered(self):
+        """Agents with tools always run the ReAct loop."""
+        client = FakeTextClient()
+        tools = ToolManager()
+        tools.register_tool("math", AddTool())
+        agent = Agent(text_provider=client, tools=tools, response_cache=SemanticResponseCache())
+
+        agent.process_message("add numbers")
+        agent.process_message("add numbers")
+
+        assert len(client.calls) == 2
+
+
+class TestBuildMessages:
+    """Tests for LLM message assembly."""
+
+    def test_history_objects_and_dicts(self, agent):
+        """Message objects and dicts from chat history are kept in order."""
+
+        class Message:
+            type = "human"
+            content = "earlier"
+
+        messages = agent._build_messages(
+            "SYSTEM", "now", [Message(), {"role": "assistant", "content": "reply"}, 42]
+        )
+
+        assert messages == [
+            {"role": "system", "content": "SYSTEM"},
+            {"role": "human", "content": "earlier"},
+            {"role": "assistant", "content": "reply"},
+            {"role": "user", "content": "now"},
+        ]
+
+
+class TestAgentSlots:
+    """Tests for the slotted Agent layout."""
+
+    def test_no_instance_dict(self, agent):
+        """Agent instances do not carry a __dict__."""
+        assert not hasattr(agent, "__dict__")
+        with pytest.raises(AttributeError):
+            agent.unknown_attribute = 1
+
+
+class TestPlanCache:
+    """Tests for replaying recorded plans of recurring events."""
+
+    def make_agent(self, tmp_path, client):
+        tools = ToolManager()
+        tools.register_tool("math", AddTool())
+        return Agent(
+            text_provider=client,
+            tools=tools,
+            workspace_manager=WorkspaceManager(str(tmp_path)),
+            use_plan_cache=True,
+        )
+
+    def make_event(self):
+        tasks = MockTaskClient()
+        task_id = tasks.create_task("Weekly report", priority=3)
+        return AgentEvent.from_task(tasks.get_task(task_id))
+
+    def test_recurring_event_replayed_without_llm(self, tmp_path):
+        """A second event with the same signature replays the recorded tool calls."""
+        client = FakeTextClient(scripted=[
+            FakeResponse("", [{"name": "add", "args": {"a": 1, "b": 2}, "id": "c1"}]),
+            FakeResponse("report sent"),
+        ])
+        agent = self.make_agent(tmp_path, client)
+
+        first = agent.process_event(self.make_event())
+        assert agent.get_current_state() == "IDLE"
+        second = agent.process_event(self.make_event())
+
+        assert first.content == second.content == "report sent"
+        assert str(second) == "report sent"
+        assert second.tool_calls is None
+        assert agent.get_current_state() == "IDLE"
+        assert len(client.calls) == 2
+        assert (tmp_path / "plan_cache.json").exists()
+
+    def test_plan_loaded_from_workspace(self, tmp_path):
+        """A new agent reuses plans persisted in the workspace."""
+        self.make_agent(tmp_path, FakeTextClient(reply="done")).process_event(self.make_event())
+
+        client = FakeTextClient()
+        response = self.make_agent(tmp_path, client).process_event(self.make_event())
+
+        assert response.content == "done"
+        assert client.calls == []
+
+    def test_failed_replay_regenerates(self, tmp_path):
+        """A plan whose tool calls fail is dropped and the LLM is consulted."""
+        agent = self.make_agent(tmp_path, FakeTextClient(reply="fresh"))
+        key = agent._plan_key(self.make_event())
+        agent._store_plan(key, [{"name": "missing", "args": {}}], "stale")
+
+        response = agent.process_event(self.make_event())
+
+        assert str(response) == "fresh"
+
+    def test_partial_replay_logs_calls_already_run(self, tmp_path, capsys):
+        """When a replay fails midway, the tool calls that already ran are logged."""
+        agent = self.make_agent(tmp_path, FakeTextClient(reply="fresh"))
+        agent.logger = ConsoleLogger(min_level=LogLevel.WARNING)
+        key = agent._plan_key(self.make_event())
+        agent._store_plan(
+            key, [{"name": "add", "args": {"a": 1, "b": 2}}, {"name": "missing", "args": {}}], "stale"
+        )
+
+        agent.process_event(self.make_event())
+
+        assert "Plan replay failed after running ['add']" in capsys.readouterr().out
+
+
+class TestResponseRendering:
+    """Tests for rendering responses to text once."""
+
+    def test_memory_stores_content_without_str(self):
+        """String content is used directly instead of str(response)."""
+
+        class Response:
+            content = "plain text"
+            tool_calls = None
+
+            def __str__(self):
+                raise AssertionError("str(response) should not be needed")
+
+        client = FakeTextClient(scripted=[Response()])
+        memory = InMemoryManager()
+        agent = Agent(text_provider=client, memory=memory)
+
+        agent.process_message("hi")
+
+        assert memory.get_recent_messages()[-1]["content"] == "plain text"
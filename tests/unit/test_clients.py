@@ -0,0 +1,100 @@
+"""
+Unit Tests for the mock inbox and task clients.
+"""
+
+from datetime import datetime
+
+from src.clients import MockInboxClient, MockTaskClient
+
+
+class TestMockTaskClient:
+    """Tests for the indexed pending/overdue task queries."""
+
+    def test_pending_follows_status_changes(self):
+        """Tasks leave and re-enter the pending list with their status."""
+        client = MockTaskClient()
+        first = client.create_task("First")
+        second = client.create_task("Second")
+
+        client.update_task_status(first, "completed")
+        assert [t.task_id for t in client.get_pending_tasks()] == [second]
+
+        client.update_task_status(first, "pending")
+        assert {t.task_id for t in client.get_pending_tasks()} == {first, second}
+
+    def test_overdue_uses_due_dates(self):
+        """Only pending tasks due before today are overdue, oldest first."""
+        client = MockTaskClient()
+        late = client.create_task("Late", due_date="2001-01-01")
+        older = client.create_task("Older", due_date="2000-01-01")
+        client.create_task("Future", due_date="2999-01-01")
+        done = client.create_task("Done", due_date="2000-06-01")
+        client.update_task_status(done, "completed")
+
+        assert [t.task_id for t in client.get_overdue_tasks()] == [older, late]
+
+    def test_overdue_ignores_time_and_unparseable_dates(self):
+        """Datetime suffixes are ignored and non-ISO due dates are never overdue."""
+        client = MockTaskClient()
+        stamped = client.create_task("Stamped", due_date="2000-01-01T09:30:00")
+        client.create_task("Vague", due_date="someday")
+        client.create_task("Unpadded", due_date="2030-1-5")
+
+        assert [t.task_id for t in client.get_overdue_tasks()] == [stamped]
+        assert len(client.get_pending_tasks()) == 3
+
+    def test_deleted_tasks_removed_from_indexes(self):
+        """Deleted tasks no longer appear in any query."""
+        client = MockTaskClient()
+        task_id = client.create_task("Gone", due_date="2000-01-01")
+
+        assert client.delete_task(task_id)
+
+        assert client.get_pending_tasks() == []
+        assert client.get_overdue_tasks() == []
+
+    def test_direct_status_change_respected(self):
+        """Status changes made on the returned TaskItem are honoured."""
+        client = MockTaskClient()
+        task_id = client.create_task("Edited", due_date="2000-01-01")
+
+        client.get_task(task_id).status = "completed"
+
+        assert client.get_pending_tasks() == []
+        assert client.get_overdue_tasks() == []
+
+
+class TestMockInboxClient:
+    """Tests for the unread email index."""
+
+    def test_read_and_archived_emails_not_new(self):
+        """Only emails neither read nor archived are returned, in arrival order."""
+        client = MockInboxClient()
+        first = client.add_mock_email("One", "a@b.com", "Body")
+        second = client.add_mock_email("Two", "a@b.com", "Body")
+        third = client.add_mock_email("Three", "a@b.com", "Body")
+
+        client.mark_as_read(first)
+        client.archive(third)
+
+        assert [e.thread_id for e in client.check_new_emails()] == [second]
+
+    def test_sent_emails_recorded_in_order(self):
+        """Sent emails are logged in send order with their recipients."""
+        client = MockInboxClient()
+        client.send_email("a@b.com", "First", "Body")
+        client.send_email("c@d.com", "Second", "Body", cc=["e@f.com"])
+
+        sent = list(client._sent_emails)
+        assert [e["subject"] for e in sent] == ["First", "Second"]
+        assert sent[1]["cc"] == ["e@f.com"]
+
+    def test_burst_sends_share_timestamp(self):
+        """Sends within the same second reuse one sent_at string."""
+        client = MockInboxClient()
+        for i in range(5):
+            client.send_email("a@b.com", f"Mail {i}", "Body")
+
+        stamps = {e["sent_at"] for e in client._sent_emails}
+        assert len(stamps) <= 2
+        datetime.fromisoformat(stamps.pop())
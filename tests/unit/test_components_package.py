@@ -0,0 +1,41 @@
+"""
+Unit Tests for the src.components package namespace.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import src.components as components
+
+
+class TestLazyExports:
+    """Tests for the lazily resolved package exports."""
+
+    def test_import_does_not_load_submodules(self):
+        """Importing the package alone loads none of the component modules."""
+        code = (
+            "import sys, src.components as c;"
+            "print(any(m.startswith('src.components.') for m in sys.modules));"
+            "c.ContextManager;"
+            "print('src.components.workspace' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+
+        assert out == ["False", "False"]
+
+    def test_every_export_resolves(self):
+        """Each name in __all__ resolves to the object defined in its submodule."""
+        from src.components.workspace import WorkspaceManager
+
+        for name in components.__all__:
+            assert getattr(components, name) is not None
+        assert components.WorkspaceManager is WorkspaceManager
+
+    def test_unknown_name_raises(self):
+        """Unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = components.DoesNotExist
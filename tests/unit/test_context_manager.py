@@ -11,11 +11,15 @@ Tests the new template system including:
 Following the testing pyramid: these are UNIT tests (fast, isolated, no APIs).
 """
 
-import pytest
+import sys
 from datetime import datetime
 
+import pytest
+
 from src.components import (
     ContextManager,
+    DictToXMLFormatter,
+    MarkdownFormatter,
     MetaData,
     SystemPromptTemplate,
     SYSTEM_PROMPT_TEMPLATES,
@@ -65,6 +69,53 @@ class TestMetaData:
         # Should be parseable as ISO datetime
         datetime.fromisoformat(time_str)
 
+    @staticmethod
+    def _fake_clock(monkeypatch) -> tuple[list[float], list[datetime]]:
+        """Drive MetaData._now with a settable monotonic clock; record now() readings."""
+        from types import SimpleNamespace
+
+        from src.components import context_manager
+
+        tick = [100.0]
+        readings: list[datetime] = []
+
+        class FakeDateTime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                reading = datetime(2024, 5, 6, 7, 8, 9, len(readings) + 1)
+                readings.append(reading)
+                return reading
+
+        monkeypatch.setattr(context_manager, "time", SimpleNamespace(monotonic=lambda: tick[0]))
+        monkeypatch.setattr(context_manager, "datetime", FakeDateTime)
+        return tick, readings
+
+    def test_time_fields_share_one_reading(self, monkeypatch):
+        """Time fields read within _NOW_TTL come from the same clock reading."""
+        _, readings = self._fake_clock(monkeypatch)
+        meta = MetaData()
+
+        iso = meta.current_time
+        date = meta.current_date
+        full = meta.current_datetime
+
+        assert len(readings) == 1
+        assert iso == "2024-05-06T07:08:09.000001"
+        assert date == "2024-05-06"
+        assert full == "2024-05-06 07:08:09"
+
+    def test_time_fields_refresh(self, monkeypatch):
+        """The shared reading expires after _NOW_TTL and the clock is read again."""
+        from src.components.context_manager import _NOW_TTL
+
+        tick, readings = self._fake_clock(monkeypatch)
+        meta = MetaData()
+        first = meta.current_time
+        tick[0] += _NOW_TTL
+
+        assert meta.current_time != first
+        assert len(readings) == 2
+
     def test_current_date_property(self):
         """Test that current_date returns YYYY-MM-DD format."""
         meta = MetaData()
@@ -112,6 +163,20 @@ class TestMetaData:
         assert meta.get_field("custom.env") == "test"
         assert meta.get_field("custom.nonexistent") is None
 
+    def test_get_field_subclass_property(self):
+        """Properties added by MetaData subclasses are resolved."""
+
+        class TeamMeta(MetaData):
+            @property
+            def team(self) -> str:
+                return f"{self.agent_name}-team"
+
+        meta = TeamMeta(agent_name="Bot")
+
+        assert meta.get_field("team") == "Bot-team"
+        assert meta.get_field("agent_name") == "Bot"
+        assert meta.get_field("other.value") is None
+
     def test_get_field_nonexistent(self):
         """Test get_field returns None for nonexistent fields."""
         meta = MetaData()
@@ -140,6 +205,18 @@ class TestTemplateRegistry:
         assert "task_agent" in templates
         assert "reactive_agent" in templates
 
+    def test_template_identifiers_are_registry_keys(self):
+        """SystemPromptTemplate constants are plain strings naming built-in templates."""
+        names = [
+            SystemPromptTemplate.MINIMAL,
+            SystemPromptTemplate.GENERAL_ASSISTANT,
+            SystemPromptTemplate.TASK_AGENT,
+            SystemPromptTemplate.REACTIVE_AGENT,
+        ]
+
+        assert all(type(name) is str for name in names)
+        assert set(names) == set(SYSTEM_PROMPT_TEMPLATES)
+
     def test_get_builtin_template(self):
         """Test getting a built-in template."""
         template = TemplateRegistry.get("minimal")
@@ -199,6 +276,61 @@ class TestTemplateRegistry:
         retrieved_again = TemplateRegistry.get("copy_test")
         assert retrieved_again["data"]["value"] == 1
 
+    def test_register_stores_a_copy(self):
+        """Mutating a dict after registering it does not change the template."""
+        original = {"data": {"value": 1}}
+        TemplateRegistry.register("copy_test", original)
+        original["data"]["value"] = 999
+
+        assert TemplateRegistry.get("copy_test")["data"]["value"] == 1
+
+    def test_get_copies_lists(self):
+        """Lists of plain values and dict items are both copied by get()."""
+        TemplateRegistry.register("lists", {"plain": ["a", "b"], "mixed": ["a", {"k": "v"}]})
+
+        copy = TemplateRegistry.get("lists")
+        copy["plain"].append("c")
+        copy["mixed"][1]["k"] = "changed"
+
+        assert TemplateRegistry.get("lists") == {"plain": ["a", "b"], "mixed": ["a", {"k": "v"}]}
+
+    def test_lookup_table_follows_registrations(self):
+        """Overrides, unregistering and clearing are reflected in lookups."""
+        TemplateRegistry.register("minimal", {"override": True})
+        assert "override" in TemplateRegistry.get("minimal")
+
+        TemplateRegistry.unregister("minimal")
+        assert "identity" in TemplateRegistry.get("minimal")
+
+        TemplateRegistry.register("extra", {"a": 1})
+        TemplateRegistry._custom_templates.clear()
+        assert TemplateRegistry.get("extra") is None
+
+    def test_register_interns_keys(self):
+        """Keys built at runtime are interned when a template is registered."""
+        import json
+
+        TemplateRegistry.register("interned", json.loads('{"section": {"name": 1}}'))
+        template = TemplateRegistry._get_shared("interned")
+        TemplateRegistry.unregister("interned")
+
+        key = next(iter(template))
+        assert key is sys.intern("section")
+        assert next(iter(template[key])) is sys.intern("name")
+
+    def test_named_templates_shared_not_mutated(self):
+        """Managers share the registry template and never write into it."""
+        first = ContextManager(template="reactive_agent")
+        second = ContextManager(template="reactive_agent")
+        assert first._template is second._template
+
+        first.add("identity", {"name": "Override"})
+        first.populate_system_message()
+        first.get_raw_context()["identity"]["role"] = "Changed"
+
+        assert SYSTEM_PROMPT_TEMPLATES["reactive_agent"]["identity"]["name"] == "{meta.agent_name}"
+        assert "Override" not in second.populate_system_message()
+
 
 # ==============================================================================
 # ContextManager Template Tests
@@ -410,6 +542,64 @@ class TestDynamicVariables:
         raw = ctx.get_raw_context()
         assert raw["timestamp"] == f"Generated at {current_time}"
 
+    def test_model_values_dumped_and_interpolated(self):
+        """Pydantic values are dumped and interpolated; other objects are kept as is."""
+        from pydantic import BaseModel
+
+        class Card(BaseModel):
+            owner: str
+
+        marker = object()
+        ctx = ContextManager(meta=MetaData(agent_name="Bot"))
+        ctx.add("card", Card(owner="{meta.agent_name}"))
+        ctx.add("marker", marker)
+
+        raw = ctx.get_raw_context()
+        assert raw["card"] == {"owner": "Bot"}
+        assert raw["marker"] is marker
+
+    def test_interpolation_plan_reused_across_managers(self):
+        """A string's placeholder plan is compiled once and applied per manager."""
+        from src.components.context_manager import _compile_interpolation
+
+        text = "{meta.agent_name} <{meta.agent_role}> {meta.missing}!"
+        first = ContextManager(meta=MetaData(agent_name="A", agent_role="R1"))
+        second = ContextManager(meta=MetaData(agent_name="B", agent_role="R2"))
+        first.add("line", text)
+        second.add("line", text)
+        hits = _compile_interpolation.cache_info().hits
+
+        assert first.get_raw_context()["line"] == "A <R1> {meta.missing}!"
+        assert second.get_raw_context()["line"] == "B <R2> {meta.missing}!"
+        assert _compile_interpolation.cache_info().hits > hits
+
+    def test_subclass_properties_are_volatile(self):
+        """Properties defined on a MetaData subclass are re-read on every render."""
+
+        class CountingMeta(MetaData):
+            counter: list[int] = []
+            n = property(lambda self: len(self.counter))
+
+        meta = CountingMeta()
+        ctx = ContextManager(template={"x": "n={meta.n}"}, meta=meta)
+
+        assert ctx.get_raw_context()["x"] == "n=0"
+        meta.counter.append(1)
+        assert ctx.get_raw_context()["x"] == "n=1"
+
+    def test_plain_text_not_memoized(self):
+        """Strings without placeholders skip the interpolation plan cache."""
+        from src.components.context_manager import _compile_interpolation
+
+        ctx = ContextManager(meta=MetaData())
+        ctx.add("body", "a long email body without placeholders")
+        misses = _compile_interpolation.cache_info().misses
+        hits = _compile_interpolation.cache_info().hits
+
+        assert ctx.get_raw_context()["body"] == "a long email body without placeholders"
+        assert _compile_interpolation.cache_info().misses == misses
+        assert _compile_interpolation.cache_info().hits == hits
+
 
 # ==============================================================================
 # Factory Method Tests
@@ -538,6 +728,65 @@ class TestSnapshots:
         assert template["original"] is True
         assert "changed" not in template
 
+    def test_restore_snapshot_rebuilds_protocols_and_meta(self):
+        """Restored protocols and meta match the snapshot and share no state with it."""
+        from src.models import Protocol, ProtocolStep
+
+        ctx = ContextManager()
+        ctx.add_protocol(Protocol(
+            protocol_name="Triage",
+            description="Sort requests",
+            steps=[ProtocolStep(name="read", goal="Read", instructions=["open"])],
+        ))
+        ctx.meta.agent_name = "Snap"
+        ctx.meta.custom["team"] = "ops"
+        snapshot = ctx.get_snapshot()
+        old_protocol = ctx.get_protocols("tri")[0]
+
+        ctx.restore_snapshot(snapshot)
+        restored = ctx.get_protocol("Triage")
+        restored.steps[0].instructions.append("close")
+        ctx.meta.custom["team"] = "dev"
+
+        assert restored is not old_protocol
+        assert ctx.get_protocols("tri")[0] is restored
+        assert isinstance(restored.steps[0], ProtocolStep)
+        assert ctx.meta.agent_name == "Snap"
+        assert snapshot["protocols"]["Triage"]["steps"][0]["instructions"] == ["open"]
+        assert snapshot["meta"]["custom"] == {"team": "ops"}
+
+    def test_snapshot_isolated_from_context_mutation(self):
+        """Nested context values are copied; protocol dumps are reused."""
+        from src.models import Protocol, ProtocolStep
+
+        ctx = ContextManager()
+        ctx.add("identity", {"tags": ["a"]})
+        protocol = Protocol(
+            protocol_name="P",
+            description="d",
+            steps=[ProtocolStep(name="s", goal="g", instructions=[])],
+        )
+        ctx.add_protocol(protocol)
+
+        snapshot = ctx.get_snapshot()
+        ctx.get("identity")["tags"].append("b")
+
+        assert snapshot["context"] == {"identity": {"tags": ["a"]}}
+        assert snapshot["protocols"]["P"] is protocol.cached_dump
+        ctx.restore_snapshot(snapshot)
+        ctx.get("identity")["tags"].append("c")
+        assert snapshot["context"] == {"identity": {"tags": ["a"]}}
+
+    def test_strict_restore_validates(self):
+        """strict=True runs Pydantic validation on the snapshot."""
+        from pydantic import ValidationError
+
+        ctx = ContextManager()
+        bad = {"protocols": {"P": {"protocol_name": "P", "description": "d", "steps": "x"}}}
+
+        with pytest.raises(ValidationError):
+            ctx.restore_snapshot(bad, strict=True)
+
 
 # ==============================================================================
 # populate_system_message Tests
@@ -576,5 +825,335 @@ class TestPopulateSystemMessage:
         assert "{meta.agent_name}" not in result
 
 
+# ==============================================================================
+# Full Context Cache Tests
+# ==============================================================================
+
+class TestFullContextCache:
+    """Tests for the versioned full-context and system message caches."""
+
+    def test_protocol_step_edits_rerender(self):
+        """Step reassignments and invalidated in-place edits reach the system message."""
+        from src.models import Protocol, ProtocolStep
+
+        protocol = Protocol(
+            protocol_name="triage",
+            description="Sort mail",
+            steps=[ProtocolStep(name="read", goal="Read", instructions=["Open inbox"])],
+        )
+        ctx = ContextManager(template={})
+        ctx.add_protocol(protocol)
+        ctx.populate_system_message()
+
+        protocol.steps[0].name = "scan"
+        assert "scan" in ctx.populate_system_message()
+
+        protocol.steps[0].instructions.append("Flag spam")
+        protocol.invalidate()
+        assert "Flag spam" in ctx.populate_system_message()
+
+    def test_unchanged_context_reuses_message(self):
+        """Repeated calls without changes return the cached message."""
+        ctx = ContextManager(template={"identity": {"name": "{meta.agent_name}"}})
+        ctx.add("task", "write tests")
+
+        first = ctx._build_full_context()
+
+        assert ctx._build_full_context() is first
+        assert ctx.populate_system_message() is ctx.populate_system_message()
+
+    def test_mutators_invalidate(self):
+        """add/remove/update/clear are reflected immediately."""
+        ctx = ContextManager()
+        ctx.add("a", "one")
+        assert "one" in ctx.populate_system_message()
+
+        ctx.update({"a": "two"})
+        assert "two" in ctx.populate_system_message()
+
+        ctx.remove("a")
+        ctx.add("b", "three")
+        assert "two" not in ctx.populate_system_message()
+
+        ctx.clear()
+        assert ctx.populate_system_message() == ""
+
+    def test_meta_change_invalidates(self):
+        """Changing a meta field re-interpolates the context."""
+        ctx = ContextManager(template={"identity": {"name": "{meta.agent_name}"}})
+        ctx.populate_system_message()
+
+        ctx.meta.agent_name = "Renamed"
+
+        assert "Renamed" in ctx.populate_system_message()
+
+    def test_protocol_progress_invalidates(self):
+        """Advancing a registered protocol updates active_protocols."""
+        from src.models import Protocol, ProtocolStep
+
+        protocol = Protocol(
+            protocol_name="flow",
+            description="Two steps",
+            steps=[
+                ProtocolStep(name="first", goal="A", instructions=["a"]),
+                ProtocolStep(name="second", goal="B", instructions=["b"]),
+            ],
+        )
+        ctx = ContextManager()
+        ctx.add_protocol(protocol)
+        assert ctx.get_raw_context()["active_protocols"]["flow"]["current_step"] == "first"
+
+        protocol.advance_step()
+
+        assert ctx.get_raw_context()["active_protocols"]["flow"]["current_step"] == "second"
+
+    def test_protocol_search_follows_registrations(self):
+        """get_protocols matches case-insensitively and tracks add/remove/replace."""
+        from src.models import Protocol, ProtocolStep
+
+        def make(name):
+            return Protocol(
+                protocol_name=name,
+                description="d",
+                steps=[ProtocolStep(name="s", goal="g", instructions=[])],
+            )
+
+        ctx = ContextManager()
+        ctx.add_protocol(make("Handle_Email"))
+        ctx.add_protocol(make("Triage_Tasks"))
+        assert [p.protocol_name for p in ctx.get_protocols("EMAIL")] == ["Handle_Email"]
+
+        ctx.remove_protocol("Handle_Email")
+        assert ctx.get_protocols("email") == []
+
+        replacement = make("Triage_Email")
+        ctx.protocols["Triage_Tasks"] = replacement
+        assert ctx.get_protocols("email") == [replacement]
+
+    def test_completed_protocol_summary(self):
+        """A finished protocol reports completion and no instructions."""
+        from src.models import Protocol, ProtocolStep
+
+        protocol = Protocol(
+            protocol_name="flow",
+            description="One step",
+            steps=[ProtocolStep(name="only", goal="A", instructions=["a"])],
+            current_step_index=1,
+        )
+        ctx = ContextManager()
+        ctx.add_protocol(protocol)
+
+        assert ctx.get_raw_context()["active_protocols"]["flow"] == {
+            "description": "One step",
+            "current_step": "completed",
+            "progress": "2/1",
+            "current_instructions": [],
+        }
+
+    def test_meta_version_tracks_field_assignment(self):
+        """Reassigning a meta field bumps its version; reading time fields does not."""
+        meta = MetaData()
+        version = meta._version
+
+        _ = meta.current_datetime
+        assert meta._version == version
+
+        meta.user_name = "Ana"
+        assert meta._version == version + 1
+
+    def test_meta_custom_mutation_invalidates(self):
+        """Values written into meta.custom in place show up in the next render."""
+        ctx = ContextManager()
+        ctx.add("greeting", "Hi {meta.custom.nickname}")
+        ctx.populate_system_message()
+
+        ctx.meta.custom["nickname"] = "Ace"
+
+        assert "Hi Ace" in ctx.populate_system_message()
+
+    def test_in_place_mutation_needs_invalidate(self):
+        """invalidate() picks up values mutated in place."""
+        items = ["one"]
+        ctx = ContextManager()
+        ctx.add("items", items)
+        ctx.populate_system_message()
+
+        items.append("two")
+        ctx.invalidate()
+
+        assert "two" in ctx.populate_system_message()
+
+    def test_raw_context_and_message_share_one_build(self, monkeypatch):
+        """get_raw_context and populate_system_message assemble the context once."""
+        ctx = ContextManager(template={"identity": {"name": "Bot"}})
+        calls = []
+        assemble = ContextManager._assemble_full_context
+        # ContextManager is slotted, so patch the class rather than the instance
+        monkeypatch.setattr(
+            ContextManager, "_assemble_full_context",
+            lambda self: calls.append(1) or assemble(self),
+        )
+
+        ctx.get_raw_context()
+        ctx.populate_system_message()
+
+        assert len(calls) == 1
+
+    def test_template_not_mutated_by_build(self):
+        """Building the context never writes into the template."""
+        from src.models import Protocol, ProtocolStep
+
+        ctx = ContextManager(template={"identity": {"name": "{meta.agent_name}"}})
+        ctx.add_protocol(Protocol(
+            protocol_name="p",
+            description="d",
+            steps=[ProtocolStep(name="s", goal="g", instructions=["i"])],
+        ))
+
+        ctx.populate_system_message()
+
+        assert ctx.get_template() == {"identity": {"name": "{meta.agent_name}"}}
+
+    def test_context_manager_has_no_instance_dict(self):
+        """ContextManager is slotted and carries no per-instance __dict__."""
+        assert not hasattr(ContextManager(), "__dict__")
+
+    def test_merge_is_copy_on_write(self):
+        """Merging builds new dicts only along overridden paths."""
+        from src.components.context_manager import _deep_merge_dicts
+
+        base = {"a": {"x": 1, "y": {"z": 2}}, "b": {"keep": True}, "c": [1]}
+        override = {"a": {"y": {"w": 3}}, "c": [2]}
+
+        merged = _deep_merge_dicts(base, override)
+
+        assert merged == {"a": {"x": 1, "y": {"z": 2, "w": 3}}, "b": {"keep": True}, "c": [2]}
+        assert merged["b"] is base["b"]
+        assert base == {"a": {"x": 1, "y": {"z": 2}}, "b": {"keep": True}, "c": [1]}
+        assert override == {"a": {"y": {"w": 3}}, "c": [2]}
+
+    def test_merge_shortcuts_share_base(self):
+        """Empty overrides return base itself; disjoint keys skip recursion."""
+        from src.components.context_manager import _deep_merge_dicts
+
+        base = {"a": {"x": 1}}
+
+        assert _deep_merge_dicts(base, {}) is base
+        merged = _deep_merge_dicts(base, {"a": {}, "b": {"y": 2}})
+        assert merged["a"] is base["a"]
+        assert _deep_merge_dicts(base, {"b": 2}) == {"a": {"x": 1}, "b": 2}
+
+    def test_static_template_sections_skip_interpolation(self, monkeypatch):
+        """Sections without placeholders are not interpolated unless overridden."""
+        ctx = ContextManager(template={
+            "identity": {"name": "{meta.agent_name}"},
+            "rules": {"tone": "calm", "items": ["a", "b"]},
+            "limits": {"max": 3},
+        })
+        ctx.add("limits", {"note": "{meta.agent_name} limits"})
+        seen = []
+        interpolate = ContextManager._interpolate_value
+        monkeypatch.setattr(
+            ContextManager, "_interpolate_value",
+            lambda self, value: seen.append(value) or interpolate(self, value),
+        )
+
+        raw = ctx.get_raw_context()
+
+        assert raw["identity"]["name"] == "Agent"
+        assert raw["rules"] == {"tone": "calm", "items": ["a", "b"]}
+        assert raw["limits"] == {"max": 3, "note": "Agent limits"}
+        assert {"tone": "calm", "items": ["a", "b"]} not in seen
+
+    def test_raw_context_is_a_copy(self):
+        """Mutating get_raw_context() output does not corrupt the cache."""
+        ctx = ContextManager(template={"identity": {"name": "Bot"}})
+        ctx.get_raw_context()["identity"]["name"] = "Changed"
+
+        assert ctx.get_raw_context()["identity"]["name"] == "Bot"
+
+
+# ==============================================================================
+# Formatter Tests
+# ==============================================================================
+
+class TestDictToXMLFormatter:
+    """Tests for DictToXMLFormatter output."""
+
+    def test_special_characters_escaped(self):
+        """All five XML special characters are escaped, & first."""
+        result = DictToXMLFormatter().format({"body": "a & b < c > d \"e\" 'f' &amp;"})
+
+        assert result == (
+            "<body>a &amp; b &lt; c &gt; d &quot;e&quot; &apos;f&apos; &amp;amp;</body>"
+        )
+
+    def test_nested_structure_layout(self):
+        """Nesting is indented per level; lists use singular item tags."""
+        formatter = DictToXMLFormatter(indent="  ")
+        result = formatter.format({
+            "identity": {"name": "Bot", "traits": {"tone": "calm"}},
+            "steps": ["plan", {"goal": "act"}],
+            "empty": {},
+        })
+
+        assert result == "\n".join([
+            "<identity>",
+            "  <name>Bot</name>",
+            "  <traits>",
+            "    <tone>calm</tone>",
+            "  </traits>",
+            "</identity>",
+            "<steps>",
+            "  <step>plan</step>",
+            "  <step>",
+            "    <goal>act</goal>",
+            "  </step>",
+            "</steps>",
+            "<empty>",
+            "",
+            "</empty>",
+        ])
+
+    def test_list_item_tags_use_singular(self):
+        """List items are tagged with the singular of the list key, also when overridden."""
+
+        class ItemFormatter(DictToXMLFormatter):
+            __slots__ = ()
+
+            def _get_singular(self, plural: str) -> str:
+                return "item"
+
+        data = {"priorities": ["a"], "steps": ["b"]}
+
+        assert "<priority>a</priority>" in DictToXMLFormatter().format(data)
+        assert "<step>b</step>" in DictToXMLFormatter().format(data)
+        assert ItemFormatter().format(data).count("<item>") == 2
+
+    def test_formatters_have_no_instance_dict(self):
+        """Formatters are slotted and carry no per-instance __dict__."""
+        assert not hasattr(DictToXMLFormatter(), "__dict__")
+        assert not hasattr(MarkdownFormatter(), "__dict__")
+
+
+class TestMarkdownFormatter:
+    """Tests for MarkdownFormatter output layout."""
+
+    def test_nested_layout(self):
+        """Sections become headers, leaves bold labels and lists bullets."""
+        result = MarkdownFormatter().format({
+            "identity": {"agent_name": "Bot", "traits": []},
+            "steps": ["plan", {"goal": "act"}],
+            "note": "x",
+        })
+
+        assert result == (
+            "\n# Identity\n\n**Agent Name:** Bot\n"
+            "\n## Traits\n\n\n"
+            "\n# Steps\n\n- plan\n- **goal:** act\n"
+            "**Note:** x"
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,119 @@
+"""
+Unit Tests for the data models.
+"""
+
+from src.models import Protocol, ProtocolStep
+
+
+def make_protocol() -> Protocol:
+    return Protocol(
+        protocol_name="analysis",
+        description="Protocol for tests",
+        steps=[
+            ProtocolStep(name="first", goal="Start", instructions=["Do A"]),
+            ProtocolStep(name="second", goal="Finish", instructions=["Do B"]),
+        ],
+    )
+
+
+class TestProtocolCachedDump:
+    """Tests for Protocol.cached_dump."""
+
+    def test_dump_reused_while_unchanged(self):
+        """Repeated access returns the same serialized dict."""
+        protocol = make_protocol()
+
+        first = protocol.cached_dump
+        assert protocol.cached_dump is first
+        assert first == protocol.model_dump()
+
+    def test_step_progress_invalidates(self):
+        """Advancing or completing steps produces a fresh dump."""
+        protocol = make_protocol()
+        first = protocol.cached_dump
+
+        protocol.advance_step()
+        second = protocol.cached_dump
+        assert second is not first
+        assert second["current_step_index"] == 1
+
+        protocol.steps[1].mark_complete()
+        assert protocol.cached_dump["steps"][1]["is_complete"] is True
+
+    def test_field_assignment_invalidates(self):
+        """Reassigning a field clears the cached dump."""
+        protocol = make_protocol()
+        first = protocol.cached_dump
+
+        protocol.description = "Changed"
+
+        assert protocol.cached_dump is not first
+        assert protocol.cached_dump["description"] == "Changed"
+        assert "_dump_cache" not in protocol.model_dump()
+
+    def test_step_field_assignment_invalidates(self):
+        """Reassigning a field of a step clears the cached dump."""
+        protocol = make_protocol()
+        first = protocol.cached_dump
+
+        protocol.steps[1].goal = "Wrap up"
+
+        assert protocol.cached_dump is not first
+        assert protocol.cached_dump["steps"][1]["goal"] == "Wrap up"
+        assert "_revision" not in protocol.model_dump()["steps"][1]
+
+
+class TestProtocolSummary:
+    """Tests for Protocol.summary."""
+
+    def test_summary_reused_until_step_changes(self):
+        """The summary dict is reused until the step index moves."""
+        protocol = make_protocol()
+
+        first = protocol.summary()
+        assert protocol.summary() is first
+        assert first == {
+            "description": "Protocol for tests",
+            "current_step": "first",
+            "progress": "1/2",
+            "current_instructions": ["Do A"],
+        }
+
+        protocol.advance_step()
+        assert protocol.summary()["progress"] == "2/2"
+
+    def test_field_assignment_invalidates(self):
+        """Reassigning a field rebuilds the summary."""
+        protocol = make_protocol()
+        first = protocol.summary()
+
+        protocol.description = "Changed"
+
+        assert protocol.summary() is not first
+        assert protocol.summary()["description"] == "Changed"
+
+    def test_step_field_assignment_invalidates(self):
+        """Reassigning a field of the current step rebuilds the summary."""
+        protocol = make_protocol()
+        first = protocol.summary()
+
+        protocol.steps[0].name = "renamed"
+
+        assert protocol.summary() is not first
+        assert protocol.summary()["current_step"] == "renamed"
+        assert first["current_step"] == "first"
+
+    def test_in_place_edits_need_invalidate(self):
+        """Mutating a step's instructions in place is picked up after invalidate()."""
+        protocol = make_protocol()
+        first = protocol.summary()
+        dump = protocol.cached_dump
+
+        protocol.steps[0].instructions.append("Do C")
+        assert protocol.summary() is first
+        protocol.invalidate()
+
+        assert protocol.summary()["current_instructions"] == ["Do A", "Do C"]
+        assert first["current_instructions"] == ["Do A"]
+        assert protocol.cached_dump is not dump
+        assert protocol.cached_dump["steps"][0]["instructions"] == ["Do A", "Do C"]
@@ -0,0 +1,109 @@
+"""
+Unit Tests for the LifeCycleManager component.
+"""
+
+import pytest
+
+from src.components.lifecycle import LifeCycleManager
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimit:
+    """Tests for the token-bucket rate limit."""
+
+    def test_limit_reached_then_refilled(self, monkeypatch):
+        """Requests drain the bucket, which refills at the per-minute rate."""
+        clock = FakeClock()
+        monkeypatch.setattr("src.components.lifecycle.time.monotonic", clock)
+        manager = LifeCycleManager()
+        manager.set_limits(requests_per_minute=3)
+
+        for _ in range(3):
+            assert manager.check_rate_limit()
+            manager.record_request(10)
+        assert not manager.check_rate_limit()
+
+        clock.now += 20  # One request's worth at 3 per minute
+        assert manager.check_rate_limit()
+        assert manager.get_token_usage()["total"] == 30
+
+    def test_refill_capped_at_limit(self, monkeypatch):
+        """Idle time never banks more than one minute of requests."""
+        clock = FakeClock()
+        monkeypatch.setattr("src.components.lifecycle.time.monotonic", clock)
+        manager = LifeCycleManager()
+        manager.set_limits(requests_per_minute=2)
+
+        clock.now += 3600
+        for _ in range(2):
+            manager.record_request(1)
+
+        assert not manager.check_rate_limit()
+
+
+class TestTokenUsage:
+    """Tests for the token usage view."""
+
+    def test_usage_is_read_only_live_view(self):
+        """get_token_usage returns one read-only view that tracks updates."""
+        manager = LifeCycleManager()
+        usage = manager.get_token_usage()
+
+        manager.record_request(7)
+
+        assert manager.get_token_usage() is usage
+        assert usage["total"] == 7
+        with pytest.raises(TypeError):
+            usage["total"] = 0
+
+
+class TestResourceUsage:
+    """Tests for the cached psutil readings."""
+
+    def test_readings_reused_within_ttl(self, monkeypatch):
+        """psutil is queried once per TTL through a single Process object."""
+        from src.components import lifecycle
+
+        processes = []
+
+        class FakeProcess:
+            def __init__(self):
+                self.reads = 0
+                processes.append(self)
+
+            def memory_info(self):
+                self.reads += 1
+                return type("MemInfo", (), {"rss": 512 * 1024 * 1024})()
+
+            def cpu_percent(self):
+                return 5.0
+
+        clock = FakeClock()
+        monkeypatch.setattr("src.components.lifecycle.time.monotonic", clock)
+        monkeypatch.setattr(lifecycle, "_psutil", type("FakePsutil", (), {"Process": FakeProcess}))
+        manager = LifeCycleManager()
+
+        assert manager.get_resource_usage() == {"memory_mb": 512.0, "cpu_percent": 5.0}
+        assert manager.check_guardrails()["memory_ok"]
+        clock.now += 1
+        manager.get_resource_usage()
+
+        assert len(processes) == 1
+        assert processes[0].reads == 2
+
+    def test_without_psutil(self, monkeypatch):
+        """Usage falls back to zeros when psutil is unavailable."""
+        from src.components import lifecycle
+
+        monkeypatch.setattr(lifecycle, "_psutil", False)
+
+        assert LifeCycleManager().get_resource_usage() == {"memory_mb": 0, "cpu_percent": 0}
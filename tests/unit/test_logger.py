@@ -0,0 +1,133 @@
+"""
+Unit Tests for the logger components.
+"""
+
+from src.components.logger import CompositeLogger, ConsoleLogger, FileLogger
+from src.interfaces.base import LogLevel
+
+
+class TestConsoleLogger:
+    """Tests for ConsoleLogger."""
+
+    def test_lazy_arguments_are_formatted(self, capsys):
+        """Printf-style arguments are applied to emitted messages."""
+        logger = ConsoleLogger(name="T")
+        logger.info("Hello %s, %d items", "Ana", 3)
+
+        assert "[T] [INFO] Hello Ana, 3 items" in capsys.readouterr().out
+
+    def test_suppressed_level_skips_formatting(self, capsys):
+        """Messages below min_level are neither formatted nor printed."""
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("should not be formatted")
+
+        logger = ConsoleLogger(min_level=LogLevel.WARNING)
+        logger.debug("Value: %s", Exploding())
+
+        assert capsys.readouterr().out == ""
+
+    def test_is_enabled_for(self):
+        """is_enabled_for follows min_level."""
+        logger = ConsoleLogger(min_level=LogLevel.INFO)
+
+        assert not logger.is_enabled_for(LogLevel.DEBUG)
+        assert logger.is_enabled_for(LogLevel.INFO)
+        assert logger.is_enabled_for(LogLevel.CRITICAL)
+
+    def test_timestamp_formatted_once_per_second(self, monkeypatch, capsys):
+        """Messages within one second reuse the formatted HH:MM:SS prefix."""
+        import time
+
+        from src.components import logger as logger_module
+
+        calls = []
+        strftime = time.strftime
+        monkeypatch.setattr(logger_module, "_clock_cache", (-1, ""))
+        monkeypatch.setattr(logger_module.time, "time", lambda: 3600.5)
+        monkeypatch.setattr(
+            logger_module.time, "strftime", lambda *a: calls.append(a) or strftime(*a)
+        )
+
+        logger = ConsoleLogger(name="T")
+        logger.info("one")
+        logger.info("two")
+
+        assert len(calls) == 1
+        stamp = strftime("%H:%M:%S", time.localtime(3600))
+        assert capsys.readouterr().out.count(f"[{stamp}] [T]") == 2
+
+    def test_min_level_can_be_changed(self, capsys):
+        """Reassigning min_level updates the gating."""
+        logger = ConsoleLogger(min_level=LogLevel.ERROR)
+        logger.warning("hidden")
+        logger.min_level = LogLevel.WARNING
+        logger.warning("shown")
+
+        out = capsys.readouterr().out
+        assert "hidden" not in out
+        assert "shown" in out
+        assert logger.min_level is LogLevel.WARNING
+
+
+class TestFileLogger:
+    """Tests for FileLogger."""
+
+    def test_writes_formatted_lines(self, tmp_path):
+        """Messages are appended with level and name."""
+        path = tmp_path / "agent.log"
+        logger = FileLogger(str(path), name="F")
+
+        logger.info("Processing %s", "task")
+        logger.error("Failed")
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[0].endswith("| INFO | F | Processing task")
+        assert lines[1].endswith("| ERROR | F | Failed")
+
+    def test_lines_buffered_until_flush(self, tmp_path):
+        """Info lines are buffered; flush() and close() write them out."""
+        path = tmp_path / "agent.log"
+        logger = FileLogger(str(path))
+
+        logger.info("one")
+        assert not path.exists() or path.read_text(encoding="utf-8") == ""
+
+        logger.flush()
+        assert path.read_text(encoding="utf-8").endswith("| INFO | Agent | one\n")
+
+        logger.close()
+        logger.info("two")
+        logger.close()
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_loggers_are_slotted(self, tmp_path):
+        """Console and file loggers carry no per-instance __dict__."""
+        file_logger = FileLogger(str(tmp_path / "agent.log"))
+
+        assert not hasattr(ConsoleLogger(), "__dict__")
+        assert not hasattr(file_logger, "__dict__")
+        file_logger.close()
+
+
+class TestCompositeLogger:
+    """Tests for CompositeLogger."""
+
+    def test_enabled_if_any_child_enabled(self):
+        """The composite is enabled when at least one child is."""
+        composite = CompositeLogger([
+            ConsoleLogger(min_level=LogLevel.ERROR),
+            ConsoleLogger(min_level=LogLevel.DEBUG),
+        ])
+
+        assert composite.is_enabled_for(LogLevel.DEBUG)
+
+    def test_forwards_arguments(self, capsys):
+        """Lazy arguments are forwarded to every child."""
+        composite = CompositeLogger([ConsoleLogger(name="A"), ConsoleLogger(name="B")])
+        composite.warning("%s!", "careful")
+
+        out = capsys.readouterr().out
+        assert "[A] [WARNING] careful!" in out
+        assert "[B] [WARNING] careful!" in out
@@ -0,0 +1,116 @@
+"""
+Unit Tests for InMemoryManager.
+"""
+
+from src.components import InMemoryManager
+
+
+class TestInMemoryManager:
+    """Tests for batched writes and the cached context contribution."""
+
+    def test_add_messages_appends_in_order(self):
+        """Batched messages are stored in order with shared metadata."""
+        memory = InMemoryManager()
+        memory.add_messages([("user", "Hi"), ("assistant", "Hello")])
+
+        recent = memory.get_recent_messages()
+        assert [(m["role"], m["content"]) for m in recent] == [("user", "Hi"), ("assistant", "Hello")]
+        assert recent[0]["timestamp"] == recent[1]["timestamp"]
+
+    def test_add_messages_respects_limit(self):
+        """The short-term limit still applies to batched writes."""
+        memory = InMemoryManager(short_term_limit=2)
+        memory.add_messages([("user", "1"), ("assistant", "2"), ("user", "3")])
+
+        assert [m["content"] for m in memory.get_recent_messages()] == ["2", "3"]
+
+    def test_recent_messages_keep_slice_semantics(self):
+        """get_recent_messages returns the newest entries, oldest first."""
+        memory = InMemoryManager()
+        memory.add_messages([("user", str(i)) for i in range(6)])
+
+        def contents(limit):
+            return [m["content"] for m in memory.get_recent_messages(limit)]
+
+        assert contents(3) == ["3", "4", "5"]
+        assert contents(10) == [str(i) for i in range(6)]
+        assert contents(0) == [str(i) for i in range(6)]
+
+    def test_contribution_reused_until_change(self):
+        """The context contribution is rebuilt only after memory changes."""
+        memory = InMemoryManager()
+        memory.add_message("user", "Hi")
+
+        first = memory.get_context_contribution()
+        assert memory.get_context_contribution() is first
+
+        memory.store_long_term("fact", "value")
+        second = memory.get_context_contribution()
+        assert second is not first
+        assert second["memory"]["long_term_keys"] == ["fact"]
+
+        memory.clear_short_term()
+        assert memory.get_context_contribution()["memory"]["recent_messages"] == []
+
+    def test_retrieve_matches_keys_and_values(self):
+        """Queries match keys or values case-insensitively, up to top_k results."""
+        memory = InMemoryManager()
+        memory.store_long_term("User_Name", "Ana")
+        memory.store_long_term("city", "Lisbon")
+        memory.store_long_term("favourite_city", {"name": "Porto"})
+
+        assert [r["key"] for r in memory.retrieve("name")] == ["User_Name", "favourite_city"]
+        assert [r["key"] for r in memory.retrieve("PORTO")] == ["favourite_city"]
+        assert [r["key"] for r in memory.retrieve("city", top_k=1)] == ["city"]
+        assert memory.retrieve("city")[0]["value"] == "Lisbon"
+
+    def test_retrieve_uses_latest_value(self):
+        """Overwriting a key replaces its searchable text."""
+        memory = InMemoryManager()
+        memory.store_long_term("note", "old text")
+        memory.store_long_term("note", "new text")
+
+        assert memory.retrieve("old") == []
+        assert memory.retrieve("new")[0]["value"] == "new text"
+
+    def test_retrieve_ignores_matches_across_entries(self):
+        """A query spanning two joined entries does not match either."""
+        memory = InMemoryManager()
+        memory.store_long_term("a", "ends with foo")
+        memory.store_long_term("b", "bar starts here")
+
+        assert memory.retrieve("foo\nb") == []
+        assert memory.retrieve("foo")[0]["key"] == "a"
+
+        memory.store_long_term("a", "now bar too")
+        assert [r["key"] for r in memory.retrieve("bar")] == ["a", "b"]
+
+    def test_retrieve_is_caseless(self):
+        """Matching uses full case folding, not just lowercasing."""
+        memory = InMemoryManager()
+        memory.store_long_term("street", "Hauptstraße 1")
+
+        assert [r["key"] for r in memory.retrieve("STRASSE")] == ["street"]
+
+    def test_timestamps_formatted_once_per_ttl(self, monkeypatch):
+        """Writes within the TTL reuse one ISO timestamp string."""
+        from datetime import datetime
+
+        from src.components import memory as memory_module
+
+        monkeypatch.setattr(memory_module, "_timestamp_cache", (float("-inf"), ""))
+        memory = InMemoryManager()
+        memory.add_message("user", "Hi")
+        memory.store_long_term("k", "v")
+
+        stamp = memory.get_recent_messages()[0]["timestamp"]
+        assert memory.retrieve("k")[0]["stored_at"] is stamp
+        datetime.fromisoformat(stamp)
+
+    def test_slotted_instance(self):
+        """Instances have no __dict__ but keep the inject_context flag."""
+        memory = InMemoryManager(inject_context=False)
+
+        assert not hasattr(memory, "__dict__")
+        assert memory.inject_context is False
+        assert InMemoryManager().inject_context is True
@@ -0,0 +1,58 @@
+"""
+Unit Tests for SemanticResponseCache.
+"""
+
+import pytest
+
+from src.components import response_cache
+from src.components.response_cache import SemanticResponseCache
+
+
+@pytest.fixture(params=["numpy", "python"])
+def cache(request, monkeypatch):
+    """A cache exercising both the vectorized and the pure-Python scan."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(response_cache, "_numpy", False)
+    return SemanticResponseCache()
+
+
+class TestSemanticResponseCache:
+    """Tests for similarity lookup."""
+
+    def test_nearest_entry_returned(self, cache):
+        """The most similar cached message above the threshold wins."""
+        cache.store("what is the weather today", "sunny")
+        cache.store("list my open tasks", "three tasks")
+
+        assert cache.lookup("What is the weather today?") == "sunny"
+        assert cache.lookup("list my open tasks please") is None
+
+    def test_partitions_are_isolated(self, cache):
+        """Entries are only visible in their own partition."""
+        cache.store("hello", "hi", partition="a")
+
+        assert cache.lookup("hello", partition="b") is None
+        assert cache.lookup("hello there", partition="a") is None
+        assert cache.lookup("Hello!", partition="a") == "hi"
+
+    def test_store_after_lookup_is_searchable(self, cache):
+        """Entries stored after a lookup are included in later scans."""
+        cache.store("first message", "one")
+        cache.lookup("first message!")
+        cache.store("second message here", "two")
+
+        assert cache.lookup("Second message here") == "two"
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted past max_entries."""
+        cache = SemanticResponseCache(max_entries=2)
+        cache.store("alpha", 1)
+        cache.store("beta", 2)
+        cache.lookup("alpha")
+        cache.store("gamma", 3)
+
+        assert len(cache) == 2
+        assert cache.lookup("beta") is None
+        assert cache.lookup("alpha") == 1
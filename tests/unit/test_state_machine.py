@@ -0,0 +1,186 @@
+"""
+Unit Tests for the StateMachine transition lookup.
+"""
+
+import pytest
+
+from src.components import StateMachine
+from src.models import Transition
+
+
+class TestTransitionLookup:
+    """Tests for (source, trigger) indexed triggers."""
+
+    def test_highest_priority_passing_condition_wins(self):
+        """Among matching transitions, the first passing one by priority is taken."""
+        sm = StateMachine()
+        sm.add_transition(Transition(source="IDLE", target="WORKING", trigger="go", priority=1))
+        sm.add_transition(Transition(
+            source="IDLE", target="ERROR", trigger="go", priority=5, condition=lambda a: False
+        ))
+        sm.add_transition(Transition(source="IDLE", target="THINKING", trigger="go", priority=3))
+
+        assert sm.trigger("go")
+        assert sm.current_state == "THINKING"
+
+    def test_unknown_trigger_does_nothing(self):
+        """Triggers without a transition from the current state are ignored."""
+        sm = StateMachine()
+        sm.add_transition(Transition(source="WORKING", target="IDLE", trigger="go"))
+
+        assert not sm.trigger("go")
+        assert sm.current_state == "IDLE"
+
+    def test_index_follows_removal(self):
+        """Removed transitions are no longer triggered."""
+        sm = StateMachine()
+        sm.add_transition(Transition(source="IDLE", target="WORKING", trigger="go"))
+        sm.trigger("go")
+        sm.force_transition("IDLE")
+
+        sm.remove_transition("IDLE", "WORKING", "go")
+
+        assert not sm.trigger("go")
+        assert sm.current_state == "IDLE"
+
+    def test_available_transitions_from_current_state(self):
+        """Only passing transitions leaving the current state are listed, by priority."""
+        sm = StateMachine()
+        low = Transition(source="IDLE", target="WORKING", trigger="a", priority=1)
+        high = Transition(source="IDLE", target="THINKING", trigger="b", priority=2)
+        sm.add_transition(low)
+        sm.add_transition(high)
+        sm.add_transition(Transition(source="IDLE", target="ERROR", trigger="c", condition=lambda a: False))
+        sm.add_transition(Transition(source="WORKING", target="IDLE", trigger="a"))
+
+        assert sm.get_available_transitions() == [high, low]
+        sm.trigger("a")
+        assert [t.target for t in sm.get_available_transitions()] == ["IDLE"]
+
+    def test_transitions_sorted_by_priority_then_registration(self):
+        """Equal priorities keep registration order in the list and in lookups."""
+        sm = StateMachine()
+        first = Transition(source="IDLE", target="WORKING", trigger="go")
+        other = Transition(source="WORKING", target="IDLE", trigger="back", priority=2)
+        second = Transition(source="IDLE", target="THINKING", trigger="go")
+        for transition in (first, other, second):
+            sm.add_transition(transition)
+
+        assert sm.transitions == (other, first, second)
+        assert sm.transitions is sm.transitions
+        assert sm.trigger("go")
+        assert sm.current_state == "WORKING"
+
+    def test_transitions_cannot_be_mutated_in_place(self):
+        """The exposed transitions cannot be appended to behind the lookup tables' back."""
+        sm = StateMachine()
+        extra = Transition(source="IDLE", target="SHUTDOWN", trigger="zz")
+
+        with pytest.raises(AttributeError):
+            sm.transitions.append(extra)
+
+        sm.transitions = [*sm.transitions, extra]
+        assert sm.trigger("zz", None)
+        assert sm.current_state == "SHUTDOWN"
+
+    def test_assigning_transitions_rebuilds_lookup(self):
+        """Replacing the transition list updates trigger lookups."""
+        sm = StateMachine()
+        sm.add_transition(Transition(source="IDLE", target="WORKING", trigger="go"))
+
+        sm.transitions = [Transition(source="IDLE", target="THINKING", trigger="go")]
+
+        assert sm.trigger("go")
+        assert sm.current_state == "THINKING"
+
+
+class TestHistory:
+    """Tests for the recorded transition history."""
+
+    def test_history_formats_timestamps_on_read(self):
+        """Entries are stored as tuples with a ns epoch and returned with an ISO timestamp."""
+        from datetime import datetime
+
+        sm = StateMachine()
+        sm.force_transition("WORKING")
+        sm.force_transition("IDLE")
+
+        assert sm.state_history[0][:3] == ("IDLE", "WORKING", "forced")
+        assert isinstance(sm.state_history[0][3], int)
+        history = sm.get_history(1)
+        assert [(h["from"], h["to"], h["trigger"]) for h in history] == [("WORKING", "IDLE", "forced")]
+        datetime.fromisoformat(history[0]["timestamp"])
+
+    def test_history_bounded(self, monkeypatch):
+        """Only the last HISTORY_SIZE transitions are kept."""
+        monkeypatch.setattr(StateMachine, "HISTORY_SIZE", 3)
+        sm = StateMachine()
+        for state in ["WORKING", "IDLE", "THINKING", "WORKING", "ERROR"]:
+            sm.force_transition(state)
+
+        assert len(sm.state_history) == 3
+        assert [h["to"] for h in sm.get_history(2)] == ["WORKING", "ERROR"]
+        assert [h["to"] for h in sm.get_history(10)] == ["THINKING", "WORKING", "ERROR"]
+
+
+class TestDefaultStates:
+    """Tests for the default state configs."""
+
+    def test_machines_get_independent_defaults(self):
+        """Mutating one machine's default config does not leak into another."""
+        first = StateMachine()
+        thinking = first.get_state_config("THINKING")
+        thinking.required_tools.append("search")
+        thinking.on_enter = lambda agent: None
+
+        second = StateMachine()
+
+        assert second.get_state_config("THINKING") is not thinking
+        assert second.get_state_config("THINKING").required_tools == ["check_inbox"]
+        assert second.get_state_config("THINKING").on_enter is None
+
+    def test_register_state_only_affects_its_machine(self):
+        """register_state replaces the config on its own machine only."""
+        first, second = StateMachine(), StateMachine()
+
+        first.register_state("THINKING", "Custom", required_tools=["search"])
+
+        assert first.get_state_config("THINKING").instruction == "Custom"
+        assert second.get_state_config("THINKING").required_tools == ["check_inbox"]
+
+
+class TestStateRegistration:
+    """Tests for registering, forcing and removing states."""
+
+    def test_unregister_and_force_unknown_state(self):
+        """The current state cannot be removed; unknown states cannot be forced."""
+        sm = StateMachine()
+        sm.register_state("CUSTOM", "Custom state")
+        sm.add_transition(Transition(source="IDLE", target="CUSTOM", trigger="go"))
+
+        assert not sm.unregister_state("IDLE")
+        assert sm.unregister_state("CUSTOM")
+        assert not sm.unregister_state("CUSTOM")
+        assert sm.transitions == ()
+        assert not sm.force_transition("CUSTOM")
+        assert sm.current_state == "IDLE"
+
+    def test_failing_callbacks_do_not_block_transitions(self):
+        """State and transition callbacks run in order; their errors are ignored."""
+        calls = []
+
+        def fail(agent):
+            calls.append("exit")
+            raise RuntimeError("boom")
+
+        sm = StateMachine()
+        sm.register_state("IDLE", "Idle", on_exit=fail)
+        sm.register_state("WORKING", "Work", on_enter=lambda agent: calls.append("enter"))
+        sm.add_transition(Transition(
+            source="IDLE", target="WORKING", trigger="go",
+            on_enter=lambda agent: calls.append("transition"),
+        ))
+
+        assert sm.trigger("go")
+        assert sm.current_state == "WORKING"
+        assert calls == ["exit", "transition", "enter"]
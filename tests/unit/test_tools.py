@@ -0,0 +1,86 @@
+"""
+Unit Tests for the ToolManager component.
+"""
+
+from src.components.tools import ToolManager
+
+
+class FakeTool:
+    """Minimal tool exposing name and description."""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+
+    def __call__(self, **kwargs):
+        return kwargs
+
+
+class TestToolDescriptions:
+    """Tests for the cached tool descriptions."""
+
+    def test_descriptions_cached_per_contexts(self):
+        """Each contexts selection is rendered once until a tool is registered."""
+        tools = ToolManager()
+        tools.register_tool("mail", FakeTool("send", "Send mail"))
+        tools.register_tool("files", FakeTool("read", "Read a file"))
+
+        mail = tools.get_tool_descriptions(["mail"])
+        assert mail == "Available Tools:\n- send: Send mail"
+        assert tools.get_tool_descriptions(["mail"]) is mail
+        assert tools.get_tool_descriptions().endswith("- read: Read a file")
+
+        tools.register_tool("mail", FakeTool("draft", "Draft mail"))
+        assert tools.get_tool_descriptions(["mail"]).endswith("- draft: Draft mail")
+
+    def test_tools_without_name_listed_as_unknown(self):
+        """Tools without a name attribute keep the 'Unknown' label."""
+        tools = ToolManager()
+
+        def helper(**kwargs):
+            return None
+
+        tools.register_tool("misc", helper)
+
+        assert tools.get_tool_descriptions() == "Available Tools:\n- Unknown: "
+
+
+class TestGetTools:
+    """Tests for tool lookup by context."""
+
+    def test_tools_returned_in_context_order(self):
+        """Tools come back grouped by the requested contexts, in registration order."""
+        tools = ToolManager()
+        send, read, draft = FakeTool("send"), FakeTool("read"), FakeTool("draft")
+        tools.register_tool("mail", send)
+        tools.register_tool("files", read)
+        tools.register_tool("mail", draft)
+
+        assert tools.get_tools(["files", "mail"]) == [read, send, draft]
+        assert tools.get_tools(["missing"]) == []
+
+    def test_reregistered_name_resolves_to_latest_tool(self):
+        """Re-registering a name updates every context that lists it."""
+        tools = ToolManager()
+        old, new = FakeTool("send", "old"), FakeTool("send", "new")
+        tools.register_tool("mail", old)
+        tools.register_tool("chat", new)
+
+        assert tools.get_tools(["mail"]) == [new]
+        assert tools.get_tool_descriptions(["mail"]).endswith("- send: new")
+
+
+class TestContextContribution:
+    """Tests for the cached tools contribution."""
+
+    def test_contribution_reused_until_registration(self):
+        """The same dict is returned until a tool is registered."""
+        tools = ToolManager()
+        assert tools.get_context_contribution() == {}
+
+        tools.register_tool("mail", FakeTool("send", "Send mail"))
+        first = tools.get_context_contribution()
+        assert tools.get_context_contribution() is first
+
+        tools.register_tool("mail", FakeTool("draft", "Draft mail"))
+        assert "draft" in tools.get_context_contribution()["available_tools"]
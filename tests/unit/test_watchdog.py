@@ -0,0 +1,34 @@
+"""
+Unit Tests for the Watchdog component.
+"""
+
+from src.components.watchdog import Watchdog
+
+
+class TestTimer:
+    """Tests for the watchdog timer."""
+
+    def test_timer_lifecycle(self, monkeypatch):
+        """Timers time out after their duration, restart on reset and clear on stop."""
+        now = [50.0]
+        monkeypatch.setattr("src.components.watchdog.time.monotonic", lambda: now[0])
+        watchdog = Watchdog()
+
+        assert not watchdog.is_running()
+        assert watchdog.get_remaining_time() is None
+
+        watchdog.start_timer(10)
+        now[0] += 4
+        assert watchdog.get_remaining_time() == 6
+        assert not watchdog.is_timed_out()
+
+        watchdog.reset()
+        now[0] += 9
+        assert not watchdog.is_timed_out()
+        now[0] += 1
+        assert watchdog.is_timed_out()
+        assert watchdog.get_remaining_time() == 0
+
+        watchdog.stop_timer()
+        assert not watchdog.is_running()
+        assert not watchdog.is_timed_out()
@@ -0,0 +1,262 @@
+"""
+Unit Tests for the WorkspaceManager component.
+"""
+
+import gc
+import json
+import time
+from datetime import datetime
+
+from src.components.workspace import WorkspaceManager
+
+
+class TestAuditLog:
+    """Tests for the file operation audit log."""
+
+    def test_entries_formatted_on_read(self, tmp_path):
+        """Audit entries carry an ISO timestamp when read back."""
+        workspace = WorkspaceManager(str(tmp_path))
+        workspace.create_file("a.txt", "hi")
+        workspace.delete_file("missing.txt")
+
+        log = workspace.get_audit_log()
+
+        assert [(e["action"], e["path"], e["success"]) for e in log] == [
+            ("create_file", "a.txt", True),
+            ("delete_file", "missing.txt", False),
+        ]
+        datetime.fromisoformat(log[0]["timestamp"])
+
+    def test_log_bounded(self, tmp_path, monkeypatch):
+        """Only the last AUDIT_LOG_SIZE entries are kept."""
+        monkeypatch.setattr(WorkspaceManager, "AUDIT_LOG_SIZE", 2)
+        workspace = WorkspaceManager(str(tmp_path))
+        for name in ["a", "b", "c"]:
+            workspace.create_file(name, "")
+
+        assert [e["path"] for e in workspace.get_audit_log()] == ["b", "c"]
+
+
+class TestAuditPersistence:
+    """Tests for writing the audit log to disk."""
+
+    def test_close_writes_pending_entries(self, tmp_path):
+        """Entries are appended as JSON lines and close() writes the rest."""
+        audit_path = tmp_path / "logs" / "audit.log"
+        workspace = WorkspaceManager(str(tmp_path / "ws"), audit_path=audit_path)
+        workspace.create_file("a.txt", "x")
+        workspace.delete_file("a.txt")
+        workspace.close()
+
+        entries = [json.loads(line) for line in audit_path.read_text().splitlines()]
+        assert entries == workspace.get_audit_log()
+        assert [e["action"] for e in entries] == ["create_file", "delete_file"]
+        assert workspace._audit_thread is None
+
+    def test_background_flush_and_append(self, tmp_path, monkeypatch):
+        """The writer thread flushes periodically and never truncates existing lines."""
+        monkeypatch.setattr(WorkspaceManager, "AUDIT_FLUSH_INTERVAL", 0.01)
+        audit_path = tmp_path / "audit.log"
+        audit_path.write_text('{"action": "old"}\n')
+        workspace = WorkspaceManager(str(tmp_path / "ws"), audit_path=audit_path)
+        try:
+            workspace.create_file("a.txt", "x")
+            deadline = time.monotonic() + 2
+            while len(audit_path.read_text().splitlines()) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            lines = audit_path.read_text().splitlines()
+            assert json.loads(lines[0]) == {"action": "old"}
+            assert json.loads(lines[1])["path"] == "a.txt"
+        finally:
+            workspace.close()
+
+    def test_shell_failures_keep_audit_writer(self, tmp_path):
+        """A persistent-shell timeout or exit restarts the shell but keeps writing the audit log."""
+        audit_path = tmp_path / "audit.log"
+        workspace = WorkspaceManager(
+            str(tmp_path / "ws"), persistent_shell=True, audit_path=audit_path
+        )
+        try:
+            workspace.create_file("before.txt", "x")
+            assert workspace.execute_command("sleep 5", timeout=0.2)["stderr"] == "Timeout"
+            assert workspace.execute_command("echo hi; exit 3")["returncode"] == 3
+            workspace.create_file("after.txt", "y")
+
+            assert workspace._audit_thread is not None
+        finally:
+            workspace.close()
+
+        entries = [json.loads(line) for line in audit_path.read_text().splitlines()]
+        assert [e["path"] for e in entries] == ["before.txt", "after.txt"]
+        assert entries == workspace.get_audit_log()
+
+    def test_unclosed_manager_stops_writer(self, tmp_path):
+        """Dropping a manager without close() still stops its thread and writes its entries."""
+        audit_path = tmp_path / "audit.log"
+        workspace = WorkspaceManager(str(tmp_path / "ws"), audit_path=audit_path)
+        workspace.create_directory("d")
+        thread = workspace._audit_thread
+        del workspace
+        gc.collect()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+        assert json.loads(audit_path.read_text())["action"] == "create_dir"
+
+
+class TestStorageUsage:
+    """Tests for the cached storage usage."""
+
+    def test_file_operations_adjust_cached_total(self, tmp_path, monkeypatch):
+        """create_file/delete_file keep the cached total exact without rescanning."""
+        workspace = WorkspaceManager(str(tmp_path))
+        workspace.create_file("a.txt", "1234")
+        assert workspace.get_storage_usage()["used_bytes"] == 4
+
+        from src.components import workspace as workspace_module
+
+        def no_scan(*args):
+            raise AssertionError("storage should not be rescanned")
+
+        monkeypatch.setattr(workspace_module, "_directory_size", no_scan)
+        workspace.create_file("a.txt", "12")
+        workspace.create_file("sub/b.txt", "123")
+        assert workspace.get_storage_usage()["used_bytes"] == 5
+
+        workspace.delete_file("a.txt")
+        assert workspace.get_storage_usage()["used_bytes"] == 3
+
+    def test_scan_counts_nested_files_not_symlinks(self, tmp_path):
+        """The scan sums nested regular files and skips symlinks."""
+        (tmp_path / "d" / "e").mkdir(parents=True)
+        (tmp_path / "d" / "e" / "f.txt").write_text("12345")
+        (tmp_path / "g.txt").write_text("1")
+        (tmp_path / "link").symlink_to(tmp_path / "d")
+
+        workspace = WorkspaceManager(str(tmp_path))
+
+        assert workspace.get_storage_usage()["used_bytes"] == 6
+        assert sorted(workspace.list_directory(".")) == ["d", "g.txt", "link"]
+
+    def test_rescanned_after_ttl(self, tmp_path, monkeypatch):
+        """External changes are picked up once the cached scan expires."""
+        from src.components import workspace as workspace_module
+
+        now = [100.0]
+        monkeypatch.setattr(workspace_module.time, "monotonic", lambda: now[0])
+        workspace = WorkspaceManager(str(tmp_path))
+        assert workspace.get_storage_usage()["used_bytes"] == 0
+
+        (tmp_path / "external.txt").write_text("abc")
+        assert workspace.get_storage_usage()["used_bytes"] == 0
+        now[0] += workspace_module._STORAGE_USAGE_TTL
+        assert workspace.get_storage_usage()["used_bytes"] == 3
+
+
+class TestResolvePath:
+    """Tests for the workspace containment check."""
+
+    def test_sibling_with_common_prefix_rejected(self, tmp_path):
+        """A sibling directory sharing the base name prefix is outside the workspace."""
+        base = tmp_path / "ws"
+        (tmp_path / "ws2").mkdir()
+        workspace = WorkspaceManager(str(base))
+
+        assert not workspace.create_file("../ws2/x.txt", "data")
+        assert not (tmp_path / "ws2" / "x.txt").exists()
+
+    def test_symlink_escape_rejected(self, tmp_path):
+        """Links pointing outside the workspace cannot be followed."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        workspace = WorkspaceManager(str(tmp_path / "ws"))
+        (workspace.base_path / "link").symlink_to(outside)
+
+        assert not workspace.create_file("link/x.txt", "data")
+        assert workspace.create_file("inner/../ok.txt", "data")
+        assert workspace.read_file("ok.txt") == "data"
+
+
+class TestExecuteCommand:
+    """Tests for one-shot command execution."""
+
+    def test_simple_command_skips_shell(self, tmp_path, monkeypatch):
+        """Commands without shell syntax are exec'ed directly from the workspace root."""
+        from src.components import workspace as workspace_module
+
+        calls = []
+        run = workspace_module.subprocess.run
+        monkeypatch.setattr(
+            workspace_module.subprocess, "run",
+            lambda *a, **kw: calls.append(kw.get("shell", False)) or run(*a, **kw)
+        )
+        workspace = WorkspaceManager(str(tmp_path))
+
+        result = workspace.execute_command("printf '%s' 'a b'")
+        assert result == {"stdout": "a b", "stderr": "", "returncode": 0}
+        assert workspace.execute_command("pwd")["stdout"] == f"{workspace.base_path}\n"
+        assert calls == [False, False]
+
+    def test_shell_syntax_and_builtins_use_shell(self, tmp_path):
+        """Pipes, builtins, assignments and unknown commands still go through /bin/sh."""
+        workspace = WorkspaceManager(str(tmp_path))
+
+        assert workspace.execute_command("echo a b | wc -w")["stdout"].strip() == "2"
+        assert workspace.execute_command("cd /")["returncode"] == 0
+        assert workspace.execute_command("X=1 printenv X")["stdout"] == "1\n"
+        assert workspace.execute_command("no-such-command-xyz")["returncode"] == 127
+
+
+class TestPersistentShell:
+    """Tests for running commands in a long-lived shell."""
+
+    def test_commands_share_one_shell(self, tmp_path):
+        """Output, status and variables match per-command semantics from the workspace root."""
+        workspace = WorkspaceManager(str(tmp_path), persistent_shell=True)
+        try:
+            first = workspace.execute_command("echo out; echo err >&2; export X=1; cd /")
+            shell = workspace._shell
+            second = workspace.execute_command("printf '%s' \"$X\"; pwd >&2; exit 3")
+
+            assert first == {"stdout": "out\n", "stderr": "err\n", "returncode": 0}
+            assert second == {"stdout": "1", "stderr": f"{workspace.base_path}\n", "returncode": 3}
+            assert workspace.execute_command("echo again")["stdout"] == "again\n"
+            assert workspace._shell is not shell
+        finally:
+            workspace.close()
+
+    def test_timeout_kills_shell(self, tmp_path):
+        """A command past its timeout is reported and the shell is replaced."""
+        workspace = WorkspaceManager(str(tmp_path), persistent_shell=True)
+        try:
+            result = workspace.execute_command("sleep 5", timeout=0.2)
+
+            assert result == {"stdout": "", "stderr": "Timeout", "returncode": -1}
+            assert workspace._shell is None
+            assert workspace.execute_command("echo ok")["stdout"] == "ok\n"
+        finally:
+            workspace.close()
+
+
+class TestContextContribution:
+    """Tests for the cached workspace contribution."""
+
+    def test_contribution_reused_until_change(self, tmp_path, monkeypatch):
+        """Own changes rebuild the contribution; external ones show up after the TTL."""
+        from src.components import workspace as workspace_module
+
+        now = [10.0]
+        monkeypatch.setattr(workspace_module.time, "monotonic", lambda: now[0])
+        workspace = WorkspaceManager(str(tmp_path))
+
+        first = workspace.get_context_contribution()
+        assert workspace.get_context_contribution() is first
+
+        workspace.create_file("a.txt", "abc")
+        assert workspace.get_context_contribution()["workspace"]["files"] == ["a.txt"]
+
+        (tmp_path / "b.txt").write_text("")
+        assert "b.txt" not in workspace.get_context_contribution()["workspace"]["files"]
+        now[0] += workspace_module._CONTRIBUTION_TTL
+        assert "b.txt" in workspace.get_context_contribution()["workspace"]["files"]